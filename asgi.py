@@ -0,0 +1,14 @@
+"""ASGI entrypoint.
+
+The Slack routes are served by coroutines, the other routes by the Flask
+application, e.g. ``uvicorn asgi:app --host 0.0.0.0 --port 5002``.
+
+copyright: (c) by Oleg Matskiv
+license: Apache License 2.0
+"""  # noqa
+
+from tts.asgi import SentimentAnalysisASGIService
+from tts.extensions import config_tts as config
+
+
+app = SentimentAnalysisASGIService(environment=config.project.environment)
@@ -0,0 +1,5 @@
+from tts.extensions import config_tts
+from tts.helpers.bundle import build_model_bundle
+from tts.helpers.functions import TRANSFORMER_MODEL_NAME
+
+build_model_bundle(TRANSFORMER_MODEL_NAME, config_tts.project.model_bundle_path)
@@ -1,3 +1,14 @@
 import nltk
+from nltk.sentiment.vader import SentimentIntensityAnalyzer
 
-nltk.download('vader_lexicon')
+from tts.extensions import config_tts
+from tts.helpers.vader import compile_lexicon
+
+try:
+    nltk.data.find('sentiment/vader_lexicon.zip')
+except LookupError:
+    nltk.download('vader_lexicon')
+
+compile_lexicon(
+    SentimentIntensityAnalyzer().lexicon, config_tts.project.vader_lexicon_path
+)
@@ -0,0 +1,15 @@
+import os
+
+from tts.extensions import config_tts
+from tts.helpers.bundle import add_bundle_file, model_source, read_manifest
+from tts.helpers.functions import TRANSFORMER_MODEL_NAME
+from tts.helpers.inference import export_onnx_model
+
+bundle_path = config_tts.project.model_bundle_path
+onnx_model_path = config_tts.project.onnx_model_path
+
+export_onnx_model(
+    model_source(TRANSFORMER_MODEL_NAME, bundle_path), onnx_model_path
+)
+if read_manifest(bundle_path) is not None:
+    add_bundle_file(bundle_path, os.path.relpath(onnx_model_path, bundle_path))
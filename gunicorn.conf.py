@@ -0,0 +1,58 @@
+"""Gunicorn configuration.
+
+When models are listed in ``preload_models`` the application is loaded in the
+master process before forking, so the workers share the model weights
+copy-on-write instead of loading their own copy.
+
+When ``PROMETHEUS_MULTIPROC_DIR`` is set the workers write their metrics to
+the directory, it is emptied at startup and the gauges of the exited workers
+are removed.
+
+SIGHUP sent to the master restarts the workers, sent to the workers it
+reloads the configuration without a restart.
+
+copyright: (c) by Oleg Matskiv
+license: Apache License 2.0
+"""  # noqa
+
+import gc
+import os
+
+from tts.extensions import config_tts
+from tts.helpers.common import reload_on_signal
+
+preload_app = bool(config_tts.settings.preload_models)
+
+
+def on_starting(server) -> None:
+    """Remove the metrics of the previous run, the master keeps its own."""
+    directory = os.environ.get("PROMETHEUS_MULTIPROC_DIR")
+    if directory:
+        for name in os.listdir(directory):
+            if not name.endswith(f"_{os.getpid()}.db"):
+                os.remove(os.path.join(directory, name))
+
+
+def pre_fork(server, worker) -> None:
+    """Keep the preloaded objects out of the garbage collector scans.
+
+    A collection in a worker would otherwise write to the shared pages of
+    every tracked object and unshare them.
+    """
+    gc.freeze()
+
+
+def post_worker_init(worker) -> None:
+    """Reload the configuration of the worker on SIGHUP.
+
+    Installed once the worker has initialized its own signal handlers.
+    """
+    reload_on_signal(config_tts)
+
+
+def child_exit(server, worker) -> None:
+    """Remove the live gauges of the exited worker."""
+    if os.environ.get("PROMETHEUS_MULTIPROC_DIR"):
+        from prometheus_client import multiprocess
+
+        multiprocess.mark_process_dead(worker.pid)
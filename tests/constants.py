@@ -2,5 +2,8 @@ class Endpoint:
     """API endpoint constants."""
 
     HEALTH = "api/v1/health"
+    READY = "api/v1/ready"
+    METRICS = "api/v1/metrics"
     SENTIMENT_ANALYSIS = "api/v1/sentiment-analysis"
+    SENTIMENT_ANALYSIS_BATCH = "api/v1/sentiment-analysis/batch"
     PROXY_SENTIMENT_ANALYSIS = "api/v1/proxy-sentiment-analysis"
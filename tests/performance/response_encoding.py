@@ -0,0 +1,79 @@
+"""Encoding benchmark of the sentiment analysis responses.
+
+Encodes single and batch responses of the load test messages with pydantic
+``model_dump_json``, as the routes did before, and with the orjson response
+layer, then reports the encoding time and the payload bytes, with gzip for
+the batch responses.
+
+Usage: python -m tests.performance.response_encoding [--batch-size 100] [--repeat 2000]
+"""  # noqa
+
+import argparse
+import json
+import os
+import time
+
+from flask import Flask
+
+from tts.helpers.responses import model_response
+from tts.models.sentiment import SentimentBatchResponse, SentimentResponse
+
+DATA_PATH = os.path.join(os.path.dirname(__file__), "data/load_test.json")
+
+
+def load_responses(count: int) -> list[SentimentResponse]:
+    """Return responses of the load test messages repeated to ``count``."""
+    with open(DATA_PATH) as file:
+        data = json.load(file)
+    messages = [item["text"] for items in data.values() for item in items]
+    return [
+        SentimentResponse(
+            text=messages[i % len(messages)],
+            sentiment_result="definitely not negative",
+        )
+        for i in range(count)
+    ]
+
+
+def encoding_time(encode, repeat: int) -> float:
+    """Return the microseconds to encode a response with ``encode``."""
+    start = time.perf_counter()
+    for _ in range(repeat):
+        encode()
+    return (time.perf_counter() - start) / repeat * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--batch-size", type=int, default=100)
+    parser.add_argument("--repeat", type=int, default=2000)
+    args = parser.parse_args()
+
+    responses = load_responses(args.batch_size)
+    single, batch = responses[0], SentimentBatchResponse(results=responses)
+    app = Flask(__name__)
+
+    with app.test_request_context(headers={"Accept-Encoding": "gzip"}):
+        for name, model in (("single", single), ("batch", batch)):
+            before = encoding_time(
+                lambda: app.make_response(model.model_dump_json()), args.repeat
+            )
+            after = encoding_time(lambda: model_response(model), args.repeat)
+            print(
+                f"{name:>8}: {before:,.1f} us -> {after:,.1f} us "
+                f"({before / after:.1f}x)"
+            )
+
+        plain = model_response(batch).content_length
+        compressed = model_response(batch, compress=True).content_length
+        compressing = encoding_time(
+            lambda: model_response(batch, compress=True), args.repeat
+        )
+        print(
+            f"{'gzip':>8}: {plain:,} bytes -> {compressed:,} bytes "
+            f"in {compressing:,.1f} us"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+"""SQL statements issued per Slack event.
+
+Counts the statements sent to Postgres while handling negative Slack
+messages, with the schema check on every event (previous behaviour) and
+with the one-time schema bootstrap. Requires the POSTGRES_* environment.
+
+Usage: python -m tests.performance.sql_statements [--events 100]
+"""  # noqa
+
+import argparse
+from unittest.mock import patch
+
+from sqlalchemy import event
+
+from tts.controllers.slack.http.event_handlers import process_event_callback
+from tts.models.postgres.base import Base, engine, initialize_database
+
+
+class StatementCounter:
+    """Count the statements executed by the engine."""
+
+    def __init__(self):
+        self.statements = 0
+
+    def __call__(self, *args, **kwargs) -> None:
+        self.statements += 1
+
+    def __enter__(self):
+        event.listen(engine, "before_cursor_execute", self)
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        event.remove(engine, "before_cursor_execute", self)
+
+
+def slack_event(index: int) -> dict:
+    """Return a negative message event for a channel."""
+    return {
+        "event": {
+            "text": "This is terrible.",
+            "channel": f"CBENCH{index % 10}",
+            "user": "UBENCH",
+        }
+    }
+
+
+def count_statements(events: int, schema_check_per_event: bool) -> float:
+    """Return the average number of statements per Slack event."""
+    with (
+        patch(
+            "tts.controllers.slack.http.event_handlers.analyze_sentiment",
+            return_value="negative",
+        ),
+        patch("tts.controllers.slack.http.event_handlers.client_slack"),
+        StatementCounter() as counter,
+    ):
+        for index in range(events):
+            if schema_check_per_event:
+                Base.metadata.create_all(engine)
+            process_event_callback(slack_event(index))
+    return counter.statements / events
+
+
+def main() -> None:
+    """Run the benchmark and print the statements per event."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--events", type=int, default=100)
+    args = parser.parse_args()
+
+    from tts.app import SentimentAnalysisService
+
+    with SentimentAnalysisService(environment="testing").app.app_context():
+        initialize_database()
+        before = count_statements(args.events, schema_check_per_event=True)
+        after = count_statements(args.events, schema_check_per_event=False)
+
+    print(f"statements per event with schema check per event: {before:.2f}")
+    print(f"statements per event with schema bootstrap: {after:.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,167 @@
+"""Startup memory benchmark for the gunicorn workers.
+
+Boots the service twice with the transformer preloaded, once with the models
+loaded in every worker and once in the gunicorn master (``gunicorn.conf.py``),
+then reports the private memory of each worker after serving requests.
+
+Usage: python -m tests.performance.startup_memory [--workers 2]
+"""  # noqa
+
+import argparse
+import configparser
+import os
+import secrets
+import shutil
+import signal
+import subprocess
+import sys
+import tempfile
+import time
+
+import requests
+
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), "../.."))
+BIND = "127.0.0.1:5055"
+API_KEY = os.environ.get("API_KEY") or secrets.token_hex(16)
+
+
+def read_memory(pid: int) -> dict[str, int]:
+    """Return the Rss, Pss and private memory of the process in MB."""
+    with open(f"/proc/{pid}/smaps_rollup") as smaps:
+        fields = {
+            line.split(":")[0]: int(line.split()[1])
+            for line in smaps
+            if line.split()[-1] == "kB"
+        }
+    private = fields["Private_Clean"] + fields["Private_Dirty"]
+    return {
+        "rss": fields["Rss"] // 1024,
+        "pss": fields["Pss"] // 1024,
+        "private": private // 1024,
+    }
+
+
+def worker_pids(master_pid: int) -> list[int]:
+    """Return the pids of the gunicorn workers."""
+    with open(f"/proc/{master_pid}/task/{master_pid}/children") as children:
+        return [int(pid) for pid in children.read().split()]
+
+
+def prepare_workdir() -> str:
+    """Copy the configuration with the transformer preloaded.
+
+    The rate limits are kept in the workers, so no Redis is needed, and the
+    paths of the project are made absolute for the temporary directory.
+    """
+    workdir = tempfile.mkdtemp(prefix="tts-memory-")
+    config = configparser.ConfigParser()
+    config.read(os.path.join(PROJECT_ROOT, "config.ini"))
+    project = config["project"]
+    project["preload_models"] = '("vader", "transformer")'
+    project["rate_limiter_storage"] = "memory://"
+    for option in (
+        "model_bundle_path",
+        "onnx_model_path",
+        "attack_vector_deny_list",
+    ):
+        project[option] = os.path.join(PROJECT_ROOT, project[option])
+    with open(os.path.join(workdir, "config.ini"), "w") as config_file:
+        config.write(config_file)
+    open(os.path.join(workdir, "empty.conf.py"), "w").close()
+    return workdir
+
+
+def run(workdir: str, shared: bool, workers: int) -> list[dict[str, int]]:
+    """Boot gunicorn, send requests to the workers and read their memory."""
+    gunicorn_config = (
+        os.path.join(PROJECT_ROOT, "gunicorn.conf.py")
+        if shared
+        else os.path.join(workdir, "empty.conf.py")
+    )
+    python_path = [PROJECT_ROOT, os.environ.get("PYTHONPATH", "")]
+    env = dict(
+        os.environ, PYTHONPATH=os.pathsep.join(python_path), API_KEY=API_KEY
+    )
+    env.setdefault("NLTK_DATA", os.path.join(PROJECT_ROOT, "nltk_data"))
+    process = subprocess.Popen(
+        [
+            sys.executable,
+            "-m",
+            "gunicorn",
+            "-c",
+            gunicorn_config,
+            "-w",
+            str(workers),
+            "-k",
+            "gthread",
+            "--bind",
+            BIND,
+            "--timeout",
+            "500",
+            "wsgi:app",
+        ],
+        cwd=workdir,
+        env=env,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    try:
+        wait_until_ready(process, workers)
+        for index in range(workers * 10):
+            response = requests.post(
+                f"http://{BIND}/api/v1/sentiment-analysis",
+                json={
+                    "text": f"Great job on the release number {index}!",
+                    "sentiment_type": "transformer",
+                },
+                headers={"Authorization": API_KEY},
+                timeout=60,
+            )
+            response.raise_for_status()
+        return [read_memory(pid) for pid in worker_pids(process.pid)]
+    finally:
+        process.send_signal(signal.SIGTERM)
+        process.wait(timeout=60)
+
+
+def wait_until_ready(process: subprocess.Popen, workers: int) -> None:
+    """Wait for every worker to answer the health check."""
+    deadline = time.monotonic() + 600
+    while time.monotonic() < deadline:
+        if process.poll() is not None:
+            raise RuntimeError("gunicorn exited during startup.")
+        try:
+            ready = len(worker_pids(process.pid)) == workers and all(
+                requests.get(f"http://{BIND}/api/v1/health", timeout=5).ok
+                for _ in range(workers * 2)
+            )
+        except requests.RequestException:
+            ready = False
+        if ready:
+            return
+        time.sleep(1)
+    raise TimeoutError("gunicorn workers did not start in time.")
+
+
+def main() -> None:
+    """Run the benchmark and print the memory of the workers."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--workers", type=int, default=2)
+    args = parser.parse_args()
+
+    workdir = prepare_workdir()
+    try:
+        for title, shared in (("per worker", False), ("pre-fork", True)):
+            memory = run(workdir, shared=shared, workers=args.workers)
+            print(f"models loaded {title}:")
+            for index, worker in enumerate(memory):
+                print(
+                    f"  worker {index}: rss={worker['rss']} MB "
+                    f"pss={worker['pss']} MB private={worker['private']} MB"
+                )
+    finally:
+        shutil.rmtree(workdir)
+
+
+if __name__ == "__main__":
+    main()
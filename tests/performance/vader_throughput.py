@@ -0,0 +1,66 @@
+"""Throughput benchmark of the bulk VADER sentiment analysis.
+
+Scores the load test messages, repeated to the requested volume, one by one
+with ``SentimentIntensityAnalyzer.polarity_scores`` and in batches with
+``BulkVaderAnalyzer``, then reports the texts scored per second.
+
+Usage: python -m tests.performance.vader_throughput [--texts 20000] [--batch-size 1000]
+"""  # noqa
+
+import argparse
+import json
+import os
+import time
+
+from nltk.sentiment.vader import SentimentIntensityAnalyzer
+
+from tts.helpers.vader import BulkVaderAnalyzer
+
+DATA_PATH = os.path.join(os.path.dirname(__file__), "data/load_test.json")
+
+
+def load_texts(count: int) -> list[str]:
+    """Return the load test messages repeated to ``count`` texts."""
+    with open(DATA_PATH) as file:
+        data = json.load(file)
+    messages = [item["text"] for items in data.values() for item in items]
+    return [f"{messages[i % len(messages)]} #{i}" for i in range(count)]
+
+
+def throughput(score, texts: list[str], batch_size: int) -> float:
+    """Return the texts scored per second by ``score`` in batches."""
+    start = time.perf_counter()
+    for i in range(0, len(texts), batch_size):
+        score(texts[i : i + batch_size])
+    return len(texts) / (time.perf_counter() - start)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--texts", type=int, default=20000)
+    parser.add_argument("--batch-size", type=int, default=1000)
+    args = parser.parse_args()
+
+    analyzer = SentimentIntensityAnalyzer()
+    bulk_analyzer = BulkVaderAnalyzer.from_lexicon(analyzer.lexicon)
+    texts = load_texts(args.texts)
+
+    results = {
+        "polarity_scores": throughput(
+            lambda batch: [analyzer.polarity_scores(text) for text in batch],
+            texts,
+            args.batch_size,
+        ),
+        "bulk": throughput(
+            bulk_analyzer.polarity_scores_batch, texts, args.batch_size
+        ),
+    }
+    for name, texts_per_second in results.items():
+        print(f"{name:>16}: {texts_per_second:,.0f} texts/s")
+    print(
+        f"{'speedup':>16}: {results['bulk'] / results['polarity_scores']:.1f}x"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -4,6 +4,7 @@ import pytest
 from tts.app import SentimentAnalysisService
 from tts.extensions import config_tts
 from tts.helpers.constants import EnvironmentVariables
+from tts.helpers.functions import result_cache
 
 
 @pytest.fixture
@@ -13,6 +14,12 @@ def app():
     return app
 
 
+@pytest.fixture(autouse=True)
+def clear_result_cache():
+    """Start every test with an empty sentiment result cache."""
+    result_cache.local.clear()
+
+
 @pytest.fixture
 def client(app):
     """Create a test client for the app."""
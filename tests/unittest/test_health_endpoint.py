@@ -1,6 +1,8 @@
 import pytest
 
 from tests.constants import Endpoint
+from tts.helpers.functions import TRANSFORMER_MODEL_VERSION, model_registry
+from tts.helpers.warmup import ModelWarmup
 
 
 @pytest.mark.health_unittest
@@ -11,3 +13,51 @@ def test_health_check(client):
 
     assert response.status_code == 200
     assert json_data["status"] == "up"
+
+
+@pytest.mark.health_unittest
+def test_health_check_reports_model_states(client):
+    """Test the health check API reports the model load states."""
+    response = client.get(Endpoint.HEALTH)
+    json_data = response.get_json()
+
+    assert set(json_data["models"]) == {"vader", "vader_bulk", "transformer"}
+
+
+@pytest.mark.health_unittest
+def test_health_check_reports_model_versions(client):
+    """Test the health check API reports the model versions."""
+    response = client.get(Endpoint.HEALTH)
+    json_data = response.get_json()
+
+    assert json_data["versions"] == model_registry.versions()
+    assert json_data["versions"]["transformer"].startswith(
+        TRANSFORMER_MODEL_VERSION
+    )
+
+
+@pytest.mark.health_unittest
+def test_ready_check_before_warmup(client, monkeypatch):
+    """Test the readiness check API is not ready before the warm-up."""
+    monkeypatch.setattr(
+        "tts.controllers.health_controller.model_warmup",
+        ModelWarmup(lambda: None),
+    )
+    response = client.get(Endpoint.READY)
+
+    assert response.status_code == 503
+    assert response.get_json()["status"] == ModelWarmup.PENDING
+
+
+@pytest.mark.health_unittest
+def test_ready_check_after_warmup(client, monkeypatch):
+    """Test the readiness check API is ready after the warm-up."""
+    warmup = ModelWarmup(lambda: None)
+    warmup.run()
+    monkeypatch.setattr(
+        "tts.controllers.health_controller.model_warmup", warmup
+    )
+    response = client.get(Endpoint.READY)
+
+    assert response.status_code == 200
+    assert response.get_json()["status"] == ModelWarmup.READY
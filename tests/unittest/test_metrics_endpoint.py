@@ -0,0 +1,117 @@
+import pytest
+from prometheus_client import REGISTRY, Counter, values
+
+from tests.constants import Endpoint
+from tts.controllers.metrics_controller import metrics_registry
+
+
+@pytest.mark.metrics_unittest
+def test_metrics_export(client):
+    """Test the metrics API exports the Prometheus text format."""
+    response = client.get(Endpoint.METRICS)
+    body = response.get_data(as_text=True)
+
+    assert response.status_code == 200
+    assert response.content_type.startswith("text/plain")
+    assert "tts_transformer_batch_size_bucket" in body
+    assert "tts_transformer_queue_depth" in body
+
+
+@pytest.mark.metrics_unittest
+def test_metrics_export_pipeline_stages(client):
+    """Test the metrics API exports the latency of the pipeline stages."""
+    body = client.get(Endpoint.METRICS).get_data(as_text=True)
+
+    assert 'tts_pipeline_stage_seconds_bucket{le="0.001",stage="vader"}' in body
+    assert "tts_external_call_seconds" in body
+
+
+def sample_value(name: str, **labels) -> float:
+    """Return the value of the metric sample, 0 when not exported yet."""
+    return REGISTRY.get_sample_value(name, labels) or 0
+
+
+@pytest.mark.metrics_unittest
+def test_requests_are_counted_by_route(client):
+    """Test the requests are counted and timed by route and status."""
+    labels = {"route": "/api/v1/health", "method": "GET"}
+    count_before = sample_value(
+        "tts_http_requests_total", **labels, status="200"
+    )
+    timed_before = sample_value("tts_http_request_seconds_count", **labels)
+
+    client.get(Endpoint.HEALTH)
+    client.get("/api/v1/missing/route")
+
+    assert sample_value("tts_http_requests_total", **labels, status="200") == (
+        count_before + 1
+    )
+    assert sample_value("tts_http_request_seconds_count", **labels) == (
+        timed_before + 1
+    )
+    assert sample_value(
+        "tts_http_requests_total",
+        route="unmatched",
+        method="GET",
+        status="404",
+    )
+
+
+@pytest.mark.metrics_unittest
+def test_rate_limited_requests_are_counted(client):
+    """Test the requests rejected by the rate limiter are counted."""
+    labels = {"route": "/api/v1/health", "limit": "10 per 1 second"}
+    before = sample_value("tts_rate_limited_requests_total", **labels)
+
+    statuses = [client.get(Endpoint.HEALTH).status_code for _ in range(25)]
+
+    assert sample_value("tts_rate_limited_requests_total", **labels) == (
+        before + statuses.count(429)
+    )
+    assert statuses.count(429) > 0
+
+
+@pytest.mark.metrics_unittest
+def test_model_inferences_are_counted(client):
+    """Test the scored messages are counted by model."""
+    before = sample_value("tts_model_inferences_total", model="vader_bulk")
+
+    client.post(
+        Endpoint.SENTIMENT_ANALYSIS_BATCH,
+        json=[
+            {"text": "Counted once.", "sentiment_type": "vader"},
+            {"text": "Counted twice.", "sentiment_type": "vader"},
+        ],
+    )
+
+    assert sample_value("tts_model_inferences_total", model="vader_bulk") == (
+        before + 2
+    )
+
+
+@pytest.mark.metrics_unittest
+def test_metrics_aggregated_across_processes(client, monkeypatch, tmp_path):
+    """Test the metrics of the worker processes are summed by the API."""
+    monkeypatch.setenv("PROMETHEUS_MULTIPROC_DIR", str(tmp_path))
+    for pid, scored in ((1001, 2), (1002, 3)):
+        monkeypatch.setattr(
+            values, "ValueClass", values.MultiProcessValue(lambda pid=pid: pid)
+        )
+        inferences = Counter(
+            "tts_model_inferences",
+            "Messages scored by the sentiment models by model.",
+            ["model"],
+            registry=None,
+        )
+        inferences.labels(model="vader").inc(scored)
+
+    response = client.get(Endpoint.METRICS)
+
+    assert metrics_registry() is not REGISTRY
+    assert sorted(path.name for path in tmp_path.iterdir()) == [
+        "counter_1001.db",
+        "counter_1002.db",
+    ]
+    assert 'tts_model_inferences_total{model="vader"} 5.0' in (
+        response.get_data(as_text=True)
+    )
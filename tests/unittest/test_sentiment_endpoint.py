@@ -1,4 +1,7 @@
 import ast
+import gzip
+import json
+from unittest.mock import MagicMock
 
 import pytest
 from flask.testing import FlaskClient
@@ -61,3 +64,128 @@ def test_sentiment_analysis_internal_error(client: FlaskClient, config_project):
     json_data = response.get_json()
 
     assert response.status_code == 422 and "error" in json_data
+
+
+@pytest.mark.sentiment_analysis_unittest
+def test_sentiment_analysis_batch_keeps_request_order(client: FlaskClient):
+    """Test the batch sentiment analysis returns results in request order."""
+    items = [
+        {"text": "I love this!", "sentiment_type": "vader"},
+        {"text": "", "sentiment_type": "vader"},
+        {"text": "This is terrible.", "sentiment_type": "vader"},
+    ]
+    response = client.post(Endpoint.SENTIMENT_ANALYSIS_BATCH, json=items)
+    results = json.loads(response.data)["results"]
+
+    assert response.status_code == 200
+    assert results[0] == {
+        "text": "I love this!",
+        "sentiment_result": "not negative",
+    }
+    assert "error" in results[1]
+    assert results[2] == {
+        "text": "This is terrible.",
+        "sentiment_result": "negative",
+    }
+
+
+@pytest.mark.sentiment_analysis_unittest
+def test_sentiment_analysis_batch_reports_non_object_items(
+    client: FlaskClient,
+):
+    """Test the items that are not JSON objects are reported in the results."""
+    items = ["I love this!", {"text": "I love this!", "sentiment_type": "vader"}]
+    response = client.post(Endpoint.SENTIMENT_ANALYSIS_BATCH, json=items)
+    results = json.loads(response.data)["results"]
+
+    assert response.status_code == 200
+    assert results[0]["error"][0]["type"] == "model_type"
+    assert results[1] == {
+        "text": "I love this!",
+        "sentiment_result": "not negative",
+    }
+
+
+@pytest.mark.sentiment_analysis_unittest
+def test_sentiment_analysis_batch_single_transformer_call(
+    client: FlaskClient, monkeypatch
+):
+    """Test the batch transformer messages are scored in a single call."""
+    mock_scores = MagicMock(
+        return_value=[
+            {"label": "POSITIVE", "score": 0.9},
+            {"label": "NEGATIVE", "score": 0.1},
+        ]
+    )
+    monkeypatch.setattr(
+        "tts.helpers.functions.get_transformer_batch_scores", mock_scores
+    )
+    monkeypatch.setattr("tts.helpers.functions.model_registry.get", MagicMock())
+    items = [
+        {"text": "Great work!", "sentiment_type": "transformer"},
+        {"text": "Awful work.", "sentiment_type": "transformer"},
+        {"text": "Great work!", "sentiment_type": "transformer"},
+    ]
+    response = client.post(Endpoint.SENTIMENT_ANALYSIS_BATCH, json=items)
+    results = json.loads(response.data)["results"]
+
+    assert response.status_code == 200
+    assert [result["sentiment_result"] for result in results] == [
+        "not negative",
+        "negative",
+        "not negative",
+    ]
+    mock_scores.assert_called_once()
+    assert mock_scores.call_args.args[1] == ["Great work!", "Awful work."]
+
+
+@pytest.mark.sentiment_analysis_unittest
+def test_sentiment_analysis_batch_empty(client: FlaskClient):
+    """Test the batch sentiment analysis rejects an empty batch."""
+    response = client.post(Endpoint.SENTIMENT_ANALYSIS_BATCH, json=[])
+
+    assert response.status_code == 422 and "error" in response.get_json()
+
+
+@pytest.mark.sentiment_analysis_unittest
+def test_sentiment_analysis_returns_json(client: FlaskClient, mock_nltk):
+    """Test the sentiment analysis is returned with the JSON content type."""
+    request = PrepareSentimentRequest()
+    response = client.post(
+        Endpoint.SENTIMENT_ANALYSIS,
+        json=request.model_dump_json(),
+        headers=request.headers,
+    )
+
+    assert response.content_type == "application/json"
+    assert response.get_json() == PrepareSentimentResponse().model_dump_json()
+
+
+@pytest.mark.sentiment_analysis_unittest
+def test_sentiment_analysis_batch_gzip(client: FlaskClient):
+    """Test the large batch responses are compressed for gzip clients."""
+    items = [
+        {"text": f"Compressed message {i}", "sentiment_type": "vader"}
+        for i in range(100)
+    ]
+    response = client.post(
+        Endpoint.SENTIMENT_ANALYSIS_BATCH,
+        json=items,
+        headers={"Accept-Encoding": "gzip, deflate"},
+    )
+    results = json.loads(gzip.decompress(response.data))["results"]
+
+    assert response.headers["Content-Encoding"] == "gzip"
+    assert len(results) == 100
+    assert (
+        "Content-Encoding"
+        not in client.post(
+            Endpoint.SENTIMENT_ANALYSIS_BATCH, json=items[:1]
+        ).headers
+    )
+    assert (
+        "Content-Encoding"
+        not in client.post(
+            Endpoint.SENTIMENT_ANALYSIS_BATCH, json=items
+        ).headers
+    )
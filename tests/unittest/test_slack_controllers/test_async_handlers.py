@@ -0,0 +1,293 @@
+import asyncio
+import json
+import threading
+from dataclasses import replace
+from unittest.mock import AsyncMock, MagicMock, patch
+from urllib.parse import urlencode
+
+import orjson
+import pytest
+
+from tests.constants import Endpoint
+from tts.asgi import SentimentAnalysisASGIService
+from tts.controllers.slack.http import async_handlers
+from tts.controllers.slack.http.constants import (
+    COMMANDS,
+    DEFAULT_SENTIMENT_MESSAGE,
+    INVALID_FORM_MESSAGE,
+    RESPONSE_ACTION_CLEAR,
+)
+from tts.controllers.slack.http.slack_controller import Routes
+from tts.extensions import config_tts
+from tts.models.postgres.base import channel_message_cache
+
+
+@pytest.fixture(scope="module")
+def asgi_app():
+    """Fixture creating the ASGI variant of the service for testing."""
+    return SentimentAnalysisASGIService(environment="testing")
+
+
+@pytest.fixture
+def redis_tier(monkeypatch):
+    """Fixture enabling the Redis tier of the caches of the Slack routes.
+
+    The mock Redis client records the threads it is called in.
+    """
+    threads = []
+
+    def recorded(result):
+        def call(*args):
+            threads.append(threading.current_thread())
+            return result
+
+        return call
+
+    redis_client = MagicMock()
+    redis_client.get_cached_value.side_effect = recorded(
+        json.dumps({"sentiment_message": "Be kind"})
+    )
+    redis_client.add_cached_value.side_effect = recorded(True)
+    for cache in (async_handlers.accepted_events, channel_message_cache):
+        cache.local.clear()
+        monkeypatch.setattr(cache, "redis_client", redis_client)
+    redis_client.threads = threads
+    return redis_client
+
+
+def asgi_request(
+    app,
+    path: str,
+    body: bytes = b"",
+    method: str = "POST",
+    headers=(),
+    client: str = "127.0.0.1",
+) -> tuple:
+    """Send a request to the ASGI application, return status and body."""
+    messages = []
+
+    async def receive():
+        return {"type": "http.request", "body": body, "more_body": False}
+
+    async def send(message):
+        messages.append(message)
+
+    async def call():
+        await app(
+            {
+                "type": "http",
+                "method": method,
+                "path": path,
+                "raw_path": path.encode(),
+                "root_path": "",
+                "scheme": "http",
+                "query_string": b"",
+                "headers": [(b"host", b"testserver"), *headers],
+                "client": (client, 5000),
+                "server": ("testserver", 80),
+                "http_version": "1.1",
+            },
+            receive,
+            send,
+        )
+        await async_handlers.event_tasks.join()
+
+    asyncio.run(call())
+    body = b"".join(
+        message.get("body", b"")
+        for message in messages
+        if message["type"] == "http.response.body"
+    )
+    return messages[0]["status"], body
+
+
+@pytest.mark.asgi_unittest
+def test_flask_routes_are_served_through_the_wsgi_bridge(asgi_app):
+    """Test the routes without a coroutine are served by the Flask app."""
+    status, body = asgi_request(asgi_app, Endpoint.HEALTH, method="GET")
+
+    assert status == 200
+    assert orjson.loads(body)["status"] == "up"
+
+
+@pytest.mark.asgi_unittest
+def test_async_verification(asgi_app):
+    """Test the URL verification challenge is answered by the coroutine."""
+    status, body = asgi_request(
+        asgi_app,
+        Routes.VERIFICATION,
+        orjson.dumps(
+            {
+                "token": "token-1234567890",
+                "challenge": "challenge-1234567890",
+                "type": "url_verification",
+            }
+        ),
+    )
+
+    assert status == 200
+    assert orjson.loads(body) == {"challenge": "challenge-1234567890"}
+
+
+@pytest.mark.asgi_unittest
+@patch.object(
+    async_handlers.client_slack_async, "views_open", new_callable=AsyncMock
+)
+@patch.object(
+    async_handlers.client_redis_async,
+    "store_user_data_with_ttl",
+    new_callable=AsyncMock,
+)
+def test_async_command_add(mock_store_user_data, mock_views_open, asgi_app):
+    """Test the add command stores the user data and opens the modal."""
+    status, _ = asgi_request(
+        asgi_app,
+        Routes.COMMANDS,
+        urlencode(
+            {
+                "command": COMMANDS["add"],
+                "user_id": "U123",
+                "team_id": "T123",
+                "team_domain": "test-domain",
+                "channel_id": "C123",
+                "channel_name": "general",
+                "trigger_id": "trigger123",
+            }
+        ).encode(),
+    )
+
+    assert status == 200
+    mock_store_user_data.assert_awaited_once_with(
+        user_id="U123",
+        team_id="T123",
+        team_domain="test-domain",
+        channel_id="C123",
+        channel_name="general",
+    )
+    assert mock_views_open.await_args.kwargs["trigger_id"] == "trigger123"
+
+
+@pytest.mark.asgi_unittest
+@patch.object(
+    async_handlers.client_slack_async,
+    "chat_postMessage",
+    new_callable=AsyncMock,
+)
+def test_async_interaction_invalid_callback_id(mock_chat_postMessage, asgi_app):
+    """Test an interaction with an invalid callback_id is rejected."""
+    payload = {
+        "type": "view_submission",
+        "team": {"id": "T123", "domain": "test_team"},
+        "user": {"id": "U123", "username": "u", "name": "U", "team_id": "T123"},
+        "api_app_id": "A123",
+        "trigger_id": "trigger123",
+        "view": {"callback_id": "invalid_callback_id", "state": {"values": {}}},
+    }
+
+    status, body = asgi_request(
+        asgi_app,
+        Routes.INTERACTIONS,
+        urlencode({"payload": json.dumps(payload)}).encode(),
+    )
+
+    assert status == 462
+    assert orjson.loads(body) == RESPONSE_ACTION_CLEAR
+    mock_chat_postMessage.assert_awaited_once_with(
+        channel="U123", text=INVALID_FORM_MESSAGE
+    )
+
+
+@pytest.mark.asgi_unittest
+@patch.object(
+    async_handlers.client_slack_async,
+    "chat_postMessage",
+    new_callable=AsyncMock,
+)
+@patch.object(
+    async_handlers.AsyncDatabaseManager,
+    "read_channel_sentiment_message",
+    new_callable=AsyncMock,
+    return_value=None,
+)
+@patch.object(async_handlers, "analyze_sentiment", return_value="negative")
+def test_async_event_is_processed_in_background(
+    mock_analyze_sentiment, mock_read_message, mock_chat_postMessage, asgi_app
+):
+    """Test the event is acknowledged, then analyzed in the inference threads."""
+    status, _ = asgi_request(
+        asgi_app,
+        Routes.EVENTS,
+        orjson.dumps(
+            {
+                "type": "event_callback",
+                "event_id": "Ev-async-1",
+                "event": {"text": "I hate it", "channel": "C1", "user": "U1"},
+            }
+        ),
+    )
+
+    assert status == 200
+    mock_analyze_sentiment.assert_called_once_with(message="I hate it")
+    mock_read_message.assert_awaited_once_with("C1")
+    attachments = mock_chat_postMessage.await_args.kwargs["attachments"]
+    assert DEFAULT_SENTIMENT_MESSAGE in json.dumps(attachments)
+
+
+@pytest.mark.asgi_unittest
+@patch.object(
+    async_handlers.client_slack_async,
+    "chat_postMessage",
+    new_callable=AsyncMock,
+)
+@patch.object(async_handlers, "analyze_sentiment", return_value="negative")
+def test_async_event_calls_the_redis_tier_outside_the_event_loop(
+    mock_analyze_sentiment, mock_chat_postMessage, redis_tier, asgi_app
+):
+    """Test the Redis tier of the caches does not block the event loop."""
+    status, _ = asgi_request(
+        asgi_app,
+        Routes.EVENTS,
+        orjson.dumps(
+            {
+                "type": "event_callback",
+                "event_id": "Ev-async-redis-1",
+                "event": {"text": "I hate it", "channel": "C2", "user": "U1"},
+            }
+        ),
+    )
+
+    assert status == 200
+    redis_tier.add_cached_value.assert_called_once()
+    redis_tier.get_cached_value.assert_called_once_with(
+        "cache:channel_message:C2"
+    )
+    assert threading.main_thread() not in redis_tier.threads
+    attachments = mock_chat_postMessage.await_args.kwargs["attachments"]
+    assert "Be kind" in json.dumps(attachments)
+
+
+@pytest.mark.asgi_unittest
+def test_async_routes_are_rate_limited(asgi_app, monkeypatch):
+    """Test the Slack coroutines share the rate limits of the Flask routes."""
+    settings = replace(config_tts.settings, rate_limiter=(2, 100))
+    monkeypatch.setattr(
+        config_tts, "snapshot", replace(config_tts.snapshot, settings=settings)
+    )
+    body = orjson.dumps(
+        {
+            "token": "token-1234567890",
+            "challenge": "challenge-1234567890",
+            "type": "url_verification",
+        }
+    )
+
+    statuses = [
+        asgi_request(asgi_app, Routes.VERIFICATION, body, client="10.0.0.9")[0]
+        for _ in range(3)
+    ]
+
+    assert statuses == [200, 200, 429]
+    assert (
+        asgi_request(asgi_app, Routes.VERIFICATION, body, client="10.0.0.8")[0]
+        == 200
+    )
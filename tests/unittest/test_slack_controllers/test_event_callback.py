@@ -0,0 +1,73 @@
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from tts.controllers.slack.http import event_handlers
+from tts.controllers.slack.http.constants import RESPONSE_ACTION_CLEAR
+from tts.controllers.slack.http.event_handlers import handle_event_callback
+
+
+@pytest.fixture
+def event_data():
+    """Fixture providing a Slack event callback."""
+    event_handlers.accepted_events.local.clear()
+    return {
+        "type": "event_callback",
+        "event_id": "Ev123",
+        "event": {"text": "bad", "channel": "C123", "user": "U123"},
+    }
+
+
+@patch("tts.controllers.slack.http.event_handlers.process_event_callback")
+def test_event_is_processed_in_background(mock_process, app, event_data):
+    """Test the event is acknowledged and processed in the background."""
+    with app.test_request_context():
+        response, status_code = handle_event_callback(event_data)
+    event_handlers.event_executor.join()
+
+    assert status_code == 200
+    assert response.get_json() == {}
+    mock_process.assert_called_once_with(event_data)
+
+
+@patch("tts.controllers.slack.http.event_handlers.process_event_callback")
+def test_retry_of_accepted_event_is_skipped(mock_process, app, event_data):
+    """Test a Slack retry of an accepted event is not processed again."""
+    with app.test_request_context():
+        handle_event_callback(event_data)
+    with app.test_request_context(headers={"X-Slack-Retry-Num": "1"}):
+        response, status_code = handle_event_callback(event_data)
+    event_handlers.event_executor.join()
+
+    assert status_code == 200
+    mock_process.assert_called_once_with(event_data)
+
+
+@patch("tts.controllers.slack.http.event_handlers.process_event_callback")
+def test_retry_accepted_by_another_worker_is_skipped(
+    mock_process, app, event_data, monkeypatch
+):
+    """Test a retry of an event accepted by another worker is skipped."""
+    redis_client = MagicMock()
+    redis_client.add_cached_value.return_value = False
+    monkeypatch.setattr(
+        event_handlers.accepted_events, "redis_client", redis_client
+    )
+    with app.test_request_context(headers={"X-Slack-Retry-Num": "1"}):
+        response, status_code = handle_event_callback(event_data)
+    event_handlers.event_executor.join()
+
+    assert status_code == 200
+    mock_process.assert_not_called()
+
+
+@patch("tts.controllers.slack.http.event_handlers.event_executor")
+def test_rejected_event_can_be_retried(mock_executor, app, event_data):
+    """Test a rejected event returns 503 and is accepted on the retry."""
+    mock_executor.submit.return_value = False
+    with app.test_request_context():
+        response, status_code = handle_event_callback(event_data)
+
+    assert status_code == 503
+    assert response.get_json() == RESPONSE_ACTION_CLEAR
+    assert event_handlers.accepted_events.local.get("Ev123") is None
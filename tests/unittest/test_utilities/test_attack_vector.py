@@ -0,0 +1,57 @@
+import pytest
+from prometheus_client import REGISTRY
+
+from tests.constants import Endpoint
+from tts.helpers.attack_vector import AttackVectorMatcher, read_deny_list
+
+
+@pytest.mark.attack_vector_unittest
+def test_deny_list_skips_comments(tmp_path):
+    """Test the deny-list file is read without the comments and blank lines."""
+    deny_list = tmp_path / "attack_vectors.txt"
+    deny_list.write_text("# probes\n/.env\n\n  /.git  \n# end\n")
+
+    assert read_deny_list(str(deny_list)) == ["/.env", "/.git"]
+
+
+@pytest.mark.attack_vector_unittest
+def test_matcher_prefers_the_longest_prefix():
+    """Test the most specific prefix is returned for a path."""
+    matcher = AttackVectorMatcher(["/.env", "/.env.bak", "/.git"])
+
+    assert matcher.match("/.env.bak") == "/.env.bak"
+    assert matcher.match("/.env/secrets") == "/.env"
+    assert matcher.match("/.git/config") == "/.git"
+    assert matcher.match("/api/v1/.env") is None
+    assert AttackVectorMatcher([]).match("/.env") is None
+
+
+@pytest.mark.attack_vector_unittest
+def test_attack_vectors_are_rejected(client, config_project):
+    """Test the deny-list paths are rejected and counted by prefix."""
+    before = (
+        REGISTRY.get_sample_value(
+            "tts_attack_vector_hits_total", {"pattern": "/wp-config.php"}
+        )
+        or 0
+    )
+
+    response = client.get("/wp-config.php.old")
+
+    assert response.status_code == 403
+    assert response.json == {"message": config_project.attack_vector_message}
+    assert (
+        REGISTRY.get_sample_value(
+            "tts_attack_vector_hits_total", {"pattern": "/wp-config.php"}
+        )
+        == before + 1
+    )
+    assert client.get(Endpoint.HEALTH).status_code == 200
+
+
+@pytest.mark.attack_vector_unittest
+def test_attack_vectors_with_doubled_slashes_are_rejected(client):
+    """Test the leading slashes of the path do not bypass the deny-list."""
+    for path in ("//.env", "///.git/config"):
+        response = client.get("/", environ_overrides={"PATH_INFO": path})
+        assert response.status_code == 403
@@ -0,0 +1,127 @@
+import asyncio
+import threading
+import time
+
+import pytest
+
+from tts.helpers.background import (
+    AsyncBoundedExecutor,
+    BackgroundTasks,
+    BoundedExecutor,
+)
+
+
+@pytest.fixture
+def blocked_executor():
+    """Fixture creating an executor whose single worker is blocked."""
+    release = threading.Event()
+    started = threading.Event()
+
+    def block():
+        started.set()
+        release.wait(5)
+
+    def create(drop_policy: str) -> BoundedExecutor:
+        executor = BoundedExecutor("test", 1, 1, drop_policy=drop_policy)
+        executor.submit(block)
+        started.wait(5)
+        return executor
+
+    yield create
+    release.set()
+
+
+@pytest.mark.background_executor_unittest
+def test_tasks_run_in_background():
+    """Test the submitted tasks are processed by the workers."""
+    executor = BoundedExecutor("test", max_workers=2, max_queue_size=10)
+    results = []
+
+    for index in range(5):
+        assert executor.submit(results.append, index)
+    executor.join()
+
+    assert sorted(results) == [0, 1, 2, 3, 4]
+
+
+@pytest.mark.background_executor_unittest
+def test_drop_newest_rejects_task(blocked_executor):
+    """Test a full queue rejects the new task with drop_newest."""
+    executor = blocked_executor(BoundedExecutor.DROP_NEWEST)
+
+    assert executor.submit(print, "queued") is True
+    assert executor.submit(print, "rejected") is False
+
+
+@pytest.mark.background_executor_unittest
+def test_drop_oldest_replaces_task(blocked_executor):
+    """Test a full queue discards the oldest task with drop_oldest."""
+    executor = blocked_executor(BoundedExecutor.DROP_OLDEST)
+
+    assert executor.submit(print, "discarded") is True
+    assert executor.submit(print, "queued") is True
+    assert executor._queue.queue[0][1] == ("queued",)
+
+
+@pytest.mark.background_executor_unittest
+def test_failing_task_does_not_stop_worker():
+    """Test the worker keeps processing after a failing task."""
+    executor = BoundedExecutor("test", max_workers=1, max_queue_size=10)
+    results = []
+
+    executor.submit(lambda: 1 / 0)
+    executor.submit(results.append, "processed")
+    executor.join()
+
+    assert results == ["processed"]
+
+
+@pytest.mark.background_executor_unittest
+def test_invalid_drop_policy():
+    """Test an unknown drop policy is rejected."""
+    with pytest.raises(ValueError, match="Invalid drop policy 'random'."):
+        BoundedExecutor("test", 1, 1, drop_policy="random")
+
+
+@pytest.mark.background_executor_unittest
+def test_async_executor_bounds_the_pending_calls():
+    """Test at most max_pending calls are queued or running at once."""
+    executor = AsyncBoundedExecutor("test", max_workers=4, max_pending=2)
+    running, peak, lock = [0], [0], threading.Lock()
+
+    def call(index: int) -> int:
+        with lock:
+            running[0] += 1
+            peak[0] = max(peak[0], running[0])
+        time.sleep(0.01)
+        with lock:
+            running[0] -= 1
+        return index
+
+    async def run_all() -> list:
+        return await asyncio.gather(*(executor.run(call, i) for i in range(8)))
+
+    assert asyncio.run(run_all()) == list(range(8))
+    assert peak[0] <= 2
+    executor.shutdown()
+
+
+@pytest.mark.background_executor_unittest
+def test_background_tasks_reject_beyond_max_tasks():
+    """Test a coroutine is rejected while max_tasks coroutines are running."""
+    tasks = BackgroundTasks("test", max_tasks=1)
+    results = []
+
+    async def append(value: int) -> None:
+        await asyncio.sleep(0)
+        results.append(value)
+
+    async def start_all() -> list:
+        started = [tasks.start(append(1)), tasks.start(append(2))]
+        await tasks.join()
+        started.append(tasks.start(append(3)))
+        await tasks.join()
+        return started
+
+    assert asyncio.run(start_all()) == [True, False, True]
+    assert results == [1, 3]
@@ -0,0 +1,124 @@
+import json
+
+import numpy as np
+import pytest
+from nltk.sentiment.vader import SentimentIntensityAnalyzer
+
+from tts.helpers.vader import (
+    BulkVaderAnalyzer,
+    CompiledSentimentIntensityAnalyzer,
+    compile_lexicon,
+    load_lexicon,
+)
+
+MESSAGES = [
+    "",
+    "!!!",
+    "The project exceeded all expectations!",
+    "This is NOT good at all.",
+    "The food was GREAT, but the service was awful.",
+    "I am very happy, kind of sad, sort of fine.",
+    "At least it works, least helpful answer ever",
+    "It was never so good, never this bad.",
+    "Yeah right, the shit is the bomb",
+    "She cut the mustard, it was the kiss of death",
+    "good good bad good :) :(",
+    "Isn't it lovely?? Really????",
+    "EXTREMELY good and barely acceptable",
+    "Not bad, not bad at all!!!!!",
+    "nothing is wrong, without a doubt",
+]
+
+
+@pytest.fixture(scope="module")
+def analyzers():
+    """Fixture providing the NLTK and the bulk VADER analyzers."""
+    analyzer = SentimentIntensityAnalyzer()
+    return analyzer, BulkVaderAnalyzer.from_lexicon(analyzer.lexicon)
+
+
+@pytest.fixture(scope="module")
+def load_test_messages():
+    """Fixture providing the messages of the load test data."""
+    with open("tests/performance/data/load_test.json") as file:
+        data = json.load(file)
+    return [item["text"] for items in data.values() for item in items]
+
+
+@pytest.mark.bulk_vader_unittest
+def test_bulk_scores_match_polarity_scores(analyzers):
+    """Test the bulk scores match the VADER polarity scores."""
+    analyzer, bulk_analyzer = analyzers
+
+    scores = bulk_analyzer.polarity_scores_batch(MESSAGES)
+
+    assert scores == [analyzer.polarity_scores(text) for text in MESSAGES]
+
+
+@pytest.mark.bulk_vader_unittest
+def test_bulk_scores_match_on_load_test_messages(analyzers, load_test_messages):
+    """Test the bulk scores match the VADER polarity scores on the load test."""
+    analyzer, bulk_analyzer = analyzers
+
+    scores = bulk_analyzer.polarity_scores_batch(load_test_messages)
+
+    for text, score in zip(load_test_messages, scores):
+        expected = analyzer.polarity_scores(text)
+        assert score == pytest.approx(expected), text
+
+
+@pytest.mark.bulk_vader_unittest
+def test_bulk_scores_single_message(analyzers):
+    """Test a single message is scored like a batch of one."""
+    analyzer, bulk_analyzer = analyzers
+
+    assert bulk_analyzer.polarity_scores(
+        "Great work!"
+    ) == analyzer.polarity_scores("Great work!")
+    assert bulk_analyzer.polarity_scores_batch([]) == []
+
+
+@pytest.mark.bulk_vader_unittest
+def test_compiled_lexicon_round_trip(analyzers, tmp_path):
+    """Test the compiled lexicon is loaded with the same words and valences."""
+    analyzer, _ = analyzers
+    path = str(tmp_path / "vader_lexicon.bin")
+
+    compile_lexicon(analyzer.lexicon, path)
+    words, valences = load_lexicon(path)
+
+    assert words == sorted(analyzer.lexicon)
+    assert dict(zip(words, valences.tolist())) == analyzer.lexicon
+    assert np.isnan(valences[-1])
+    assert not valences.flags.writeable
+
+
+@pytest.mark.bulk_vader_unittest
+def test_compiled_lexicon_scores(analyzers, tmp_path):
+    """Test the analyzers of the compiled lexicon match the VADER scores."""
+    analyzer, _ = analyzers
+    path = str(tmp_path / "vader_lexicon.bin")
+    compile_lexicon(analyzer.lexicon, path)
+
+    words, valences = load_lexicon(path)
+    compiled_analyzer = CompiledSentimentIntensityAnalyzer(words, valences)
+    bulk_analyzer = BulkVaderAnalyzer(words, valences)
+
+    assert compiled_analyzer.lexicon.valences is valences
+    assert bulk_analyzer.valences is valences
+
+    expected = [analyzer.polarity_scores(text) for text in MESSAGES]
+    assert [compiled_analyzer.polarity_scores(text) for text in MESSAGES] == (
+        expected
+    )
+    assert bulk_analyzer.polarity_scores_batch(MESSAGES) == expected
+
+
+@pytest.mark.bulk_vader_unittest
+def test_load_lexicon_invalid_file(tmp_path):
+    """Test loading a file that is not a compiled lexicon raises an error."""
+    path = tmp_path / "vader_lexicon.bin"
+    path.write_bytes(b"word\t1.0\t0.5\t[1, 1]\n" * 4)
+
+    with pytest.raises(ValueError, match="Invalid compiled VADER lexicon"):
+        load_lexicon(str(path))
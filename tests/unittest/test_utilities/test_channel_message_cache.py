@@ -0,0 +1,115 @@
+from unittest.mock import MagicMock
+
+import pytest
+
+from tts.helpers.cache import TieredCache
+from tts.models.postgres import base
+from tts.models.postgres.base import DatabaseManager, channel_message_cache
+
+
+@pytest.fixture
+def session(monkeypatch):
+    """Mock the database session and start with an empty cache."""
+    channel_message_cache.local.clear()
+    mock_session = MagicMock()
+    mock_session_manager = MagicMock()
+    mock_session_manager.return_value.__enter__.return_value = mock_session
+    monkeypatch.setattr(base, "SessionManager", mock_session_manager)
+    monkeypatch.setattr(DatabaseManager, "encrypt", lambda data: data.encode())
+    return mock_session
+
+
+def query_result(session) -> MagicMock:
+    """Return the mock of the channel query result."""
+    return session.query.return_value.filter.return_value.first
+
+
+@pytest.mark.channel_message_cache_unittest
+def test_message_is_read_once(session):
+    """Test the database is queried only on the first read."""
+    query_result(session).return_value = MagicMock(sentiment_message="Be kind")
+
+    assert DatabaseManager.read_channel_sentiment_message("C123") == "Be kind"
+    assert DatabaseManager.read_channel_sentiment_message("C123") == "Be kind"
+    session.query.assert_called_once()
+
+
+@pytest.mark.channel_message_cache_unittest
+def test_missing_message_is_cached(session):
+    """Test a channel without a custom message is cached too."""
+    query_result(session).return_value = None
+
+    assert DatabaseManager.read_channel_sentiment_message("C123") is None
+    assert DatabaseManager.read_channel_sentiment_message("C123") is None
+    session.query.assert_called_once()
+
+
+@pytest.mark.channel_message_cache_unittest
+def test_update_invalidates_message(session):
+    """Test updating the message invalidates the cached one."""
+    channel = MagicMock(sentiment_message="Be kind")
+    query_result(session).return_value = channel
+    DatabaseManager.read_channel_sentiment_message("C123")
+
+    DatabaseManager.update_channel_sentiment_message("C123", "Be nice")
+
+    assert DatabaseManager.read_channel_sentiment_message("C123") == "Be nice"
+
+
+@pytest.mark.channel_message_cache_unittest
+def test_add_invalidates_missing_message(session):
+    """Test adding a message invalidates the cached missing message."""
+    query_result(session).return_value = None
+    DatabaseManager.read_channel_sentiment_message("C123")
+
+    DatabaseManager.add_channel_sentiment_message(
+        team_id="T123",
+        team_domain="test-domain",
+        channel_id="C123",
+        channel_name="general",
+        sentiment_message="Be kind",
+    )
+    query_result(session).return_value = MagicMock(sentiment_message="Be kind")
+
+    assert DatabaseManager.read_channel_sentiment_message("C123") == "Be kind"
+
+
+@pytest.mark.channel_message_cache_unittest
+def test_invalidation_evicts_the_redis_tier_and_the_workers():
+    """Test the deleted key is removed from Redis and published."""
+    redis_client = MagicMock()
+    redis_client.get_cached_value.return_value = None
+    cache = TieredCache(
+        "channel_message", 8, 60, redis_client, publish_evictions=True
+    )
+    cache.set("C123", {"sentiment_message": "Be kind"})
+
+    cache.delete("C123")
+
+    assert cache.local.get("C123") is None
+    redis_client.delete_cached_value.assert_called_once_with(
+        "cache:channel_message:C123"
+    )
+    redis_client.publish_message.assert_called_once_with(
+        "cache:channel_message:evictions", "C123"
+    )
+
+
+@pytest.mark.channel_message_cache_unittest
+def test_published_eviction_drops_the_local_value():
+    """Test a key deleted by another worker is dropped from the local tier."""
+    redis_client = MagicMock()
+    redis_client.get_cached_value.return_value = None
+    cache = TieredCache(
+        "channel_message", 8, 60, redis_client, publish_evictions=True
+    )
+    cache.local.set("C123", {"sentiment_message": "Be kind"})
+
+    cache.get("C123")
+    cache.get("C123")
+    channel, on_eviction = redis_client.subscribe.call_args.args
+    on_eviction("C123")
+
+    redis_client.subscribe.assert_called_once()
+    assert channel == "cache:channel_message:evictions"
+    assert cache.local.get("C123") is None
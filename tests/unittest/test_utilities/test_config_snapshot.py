@@ -0,0 +1,158 @@
+import configparser
+import dataclasses
+import logging
+import os
+import signal
+
+import pytest
+
+from tts.helpers.common import Config, Settings, reload_on_signal
+
+PROJECT_SETTINGS = {
+    "environment": "testing",
+    "web_interface": "False",
+    "preload_models": '("vader",)',
+    "warmup_models": "()",
+    "warmup_batch_sizes": "(1, 16)",
+    "rate_limiter": "(600, 10)",
+    "rate_limit_tiers": '{"partner": (6000, 100)}',
+    "api_key_tiers": '{"digest": "partner"}',
+}
+
+
+@pytest.fixture
+def config_file(tmp_path):
+    """Fixture writing the configuration of the repository with overrides."""
+    path = tmp_path / "config.ini"
+
+    def write(sentiment_type: str = "vader", **overrides: str) -> str:
+        config = configparser.ConfigParser()
+        config.read("config.ini")
+        config["project"].update(
+            PROJECT_SETTINGS, sentiment_type=sentiment_type
+        )
+        for key, value in overrides.items():
+            section, option = key.split("__")
+            config[section][option] = value
+        with open(path, "w") as config_data:
+            config.write(config_data)
+        return str(path)
+
+    return write
+
+
+@pytest.fixture
+def restore_sighup():
+    """Fixture restoring the SIGHUP handler of the process."""
+    handler = signal.getsignal(signal.SIGHUP)
+    yield
+    signal.signal(signal.SIGHUP, handler)
+
+
+@pytest.mark.config_snapshot_unittest
+def test_settings_are_typed(config_file):
+    """Test the settings are parsed to their types at load."""
+    settings = Config(config_file(), settings_class=Settings).settings
+
+    assert settings.sentiment_type == "vader"
+    assert settings.web_interface is False
+    assert settings.preload_models == ("vader",)
+    assert settings.warmup_batch_sizes == (1, 16)
+    assert settings.rate_limiter == (600, 10)
+    assert settings.rate_limit_tiers == {"partner": (6000, 100)}
+    assert settings.api_key_tiers == {"digest": "partner"}
+
+
+@pytest.mark.config_snapshot_unittest
+@pytest.mark.parametrize(
+    "sentiment_type, warmup_models",
+    [
+        ("vader", ("vader",)),
+        ("transformer", ("transformer",)),
+        ("all", ("vader", "transformer")),
+    ],
+)
+def test_warmup_models_follow_the_sentiment_type(
+    config_file, sentiment_type, warmup_models
+):
+    """Test the models of the default sentiment type are warmed up."""
+    path = config_file(sentiment_type)
+
+    assert Config(path, settings_class=Settings).settings.warmup_models == (
+        warmup_models
+    )
+
+
+@pytest.mark.config_snapshot_unittest
+def test_configured_warmup_models_are_kept(config_file):
+    """Test the configured warm-up models replace the default ones."""
+    path = config_file("all", project__warmup_models='("vader_bulk",)')
+
+    settings = Config(path, settings_class=Settings).settings
+
+    assert settings.warmup_models == ("vader_bulk",)
+
+
+@pytest.mark.config_snapshot_unittest
+def test_snapshot_is_immutable(config_file):
+    """Test the sections and the settings cannot be modified."""
+    config = Config(config_file(), settings_class=Settings)
+
+    assert config.project is config.project
+    with pytest.raises(AttributeError):
+        config.project.sentiment_type = "all"
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        config.settings.sentiment_type = "all"
+    with pytest.raises(TypeError):
+        config.settings.api_key_tiers["digest"] = "standard"
+
+
+@pytest.mark.config_snapshot_unittest
+def test_invalid_settings_are_rejected_at_load(config_file):
+    """Test an invalid setting fails the load."""
+    with pytest.raises(ValueError, match="Invalid sentiment type 'bert'."):
+        Config(config_file("bert"), settings_class=Settings)
+    with pytest.raises(ValueError, match="Invalid pool_size"):
+        Config(config_file(database__pool_size="0"), settings_class=Settings)
+    with pytest.raises(ValueError, match="must be positive"):
+        Config(
+            config_file(project__vader_conclusive_threshold="-0.5"),
+            settings_class=Settings,
+        )
+    with pytest.raises(ValueError, match="invalid literal"):
+        Config(config_file(asgi__wsgi_workers="ten"), settings_class=Settings)
+
+
+@pytest.mark.config_snapshot_unittest
+def test_reload_reports_the_keys_applying_after_a_restart(config_file):
+    """Test the changed startup keys are returned by the reload."""
+    config = Config(config_file(), settings_class=Settings)
+
+    config_file(
+        "all",
+        project__vader_conclusive_threshold="0.8",
+        database__pool_size="20",
+    )
+
+    assert config.reload() == ["database.pool_size"]
+    assert config.settings.sentiment_type == "all"
+    assert config.settings.vader_conclusive_threshold == 0.8
+
+
+@pytest.mark.config_snapshot_unittest
+def test_sighup_reloads_the_snapshot(config_file, restore_sighup, caplog):
+    """Test SIGHUP swaps the snapshot, an invalid file keeps the current one."""
+    config = Config(config_file(), settings_class=Settings)
+    reload_on_signal(config)
+
+    config_file("transformer", slack__event_workers="8")
+    with caplog.at_level(logging.WARNING):
+        os.kill(os.getpid(), signal.SIGHUP)
+    assert config.settings.sentiment_type == "transformer"
+    assert config.project.sentiment_type == "transformer"
+    assert "applying after a restart: slack.event_workers." in caplog.text
+
+    snapshot = config.snapshot
+    config_file("bert")
+    os.kill(os.getpid(), signal.SIGHUP)
+    assert config.snapshot is snapshot
@@ -0,0 +1,107 @@
+import sqlite3
+from dataclasses import replace
+
+import pytest
+
+from tts.extensions import config_tts
+from tts.helpers.metrics import (
+    DB_POOL_CHECKED_OUT,
+    DB_POOL_CHECKOUT_SECONDS,
+    DB_POOL_CONNECTIONS_CREATED,
+    DB_POOL_OVERFLOW_CONNECTIONS,
+)
+from tts.models.postgres.base import (
+    InstrumentedQueuePool,
+    PostgresEngineConfig,
+    engine,
+)
+
+
+def metric_value(metric, suffix: str) -> float:
+    """Return the current value of the metric sample."""
+    for collected in metric.collect():
+        for sample in collected.samples:
+            if sample.name.endswith(suffix):
+                return sample.value
+    raise KeyError(suffix)
+
+
+@pytest.fixture
+def pool():
+    """Fixture creating an instrumented pool of one connection."""
+    return InstrumentedQueuePool(
+        lambda: sqlite3.connect(":memory:", check_same_thread=False),
+        pool_size=1,
+        max_overflow=1,
+    )
+
+
+@pytest.mark.database_pool_unittest
+def test_engine_options_from_configuration():
+    """Test the engine is configured from the database configuration."""
+    options = PostgresEngineConfig.get_engine_options()
+
+    assert options["pool_pre_ping"] is True
+    assert options["echo"] is (config_tts.settings.environment == "testing")
+    assert options["connect_args"]["options"].startswith(
+        "-c statement_timeout="
+    )
+    assert isinstance(engine.pool, InstrumentedQueuePool)
+    assert engine.pool.size() == options["pool_size"]
+
+
+@pytest.mark.database_pool_unittest
+@pytest.mark.parametrize(
+    "environment, echo", [("testing", True), ("production", False)]
+)
+def test_engine_echo_follows_the_environment(monkeypatch, environment, echo):
+    """Test the SQL echo is enabled by the validated environment."""
+    settings = replace(config_tts.settings, environment=environment)
+    monkeypatch.setattr(
+        config_tts, "snapshot", replace(config_tts.snapshot, settings=settings)
+    )
+
+    assert PostgresEngineConfig.get_engine_options()["echo"] is echo
+
+
+@pytest.mark.database_pool_unittest
+def test_checkout_latency_is_observed(pool):
+    """Test every checkout is observed in the latency histogram."""
+    before = metric_value(DB_POOL_CHECKOUT_SECONDS, "_count")
+
+    pool.connect().close()
+    pool.connect().close()
+
+    assert metric_value(DB_POOL_CHECKOUT_SECONDS, "_count") == before + 2
+
+
+@pytest.mark.database_pool_unittest
+def test_overflow_connections_are_counted(pool):
+    """Test only the connections beyond the pool size are counted."""
+    before = metric_value(DB_POOL_OVERFLOW_CONNECTIONS, "_total")
+
+    first = pool.connect()
+    assert metric_value(DB_POOL_OVERFLOW_CONNECTIONS, "_total") == before
+
+    second = pool.connect()
+    assert metric_value(DB_POOL_OVERFLOW_CONNECTIONS, "_total") == before + 1
+
+    first.close()
+    second.close()
+
+
+@pytest.mark.database_pool_unittest
+def test_checked_out_connections_are_counted(pool):
+    """Test the checked out and the opened connections are counted."""
+    checked_out = metric_value(DB_POOL_CHECKED_OUT, "checked_out")
+    created = metric_value(DB_POOL_CONNECTIONS_CREATED, "_total")
+
+    first = pool.connect()
+    second = pool.connect()
+    assert metric_value(DB_POOL_CHECKED_OUT, "checked_out") == checked_out + 2
+
+    first.close()
+    second.close()
+    pool.connect().close()
+    assert metric_value(DB_POOL_CHECKED_OUT, "checked_out") == checked_out
+    assert metric_value(DB_POOL_CONNECTIONS_CREATED, "_total") == created + 2
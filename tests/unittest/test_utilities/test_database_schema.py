@@ -0,0 +1,65 @@
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from tts.controllers.slack.http.event_handlers import process_event_callback
+from tts.models.postgres import base
+from tts.models.postgres.base import DatabaseSchema, initialize_database
+
+
+@pytest.fixture
+def create_all(monkeypatch):
+    """Mock the schema creation and start with a not ready schema."""
+    mock_create_all = MagicMock()
+    monkeypatch.setattr(DatabaseSchema, "ready", False)
+    monkeypatch.setattr(base.Base.metadata, "create_all", mock_create_all)
+    monkeypatch.setattr(base, "engine", MagicMock())
+    return mock_create_all
+
+
+@pytest.mark.database_schema_unittest
+def test_schema_is_created_once(create_all):
+    """Test the schema is created by the first call only."""
+    initialize_database()
+    initialize_database()
+
+    create_all.assert_called_once()
+    assert DatabaseSchema.ready is True
+
+
+@pytest.mark.database_schema_unittest
+def test_session_bootstraps_schema_when_not_ready(create_all, monkeypatch):
+    """Test the first session creates a schema missed at startup."""
+    monkeypatch.setattr(base, "Session", MagicMock())
+    base.SessionManager()
+    base.SessionManager()
+
+    create_all.assert_called_once()
+
+
+@pytest.mark.database_schema_unittest
+@patch("tts.controllers.slack.http.event_handlers.client_slack")
+@patch("tts.controllers.slack.http.event_handlers.DatabaseManager")
+@patch(
+    "tts.controllers.slack.http.event_handlers.analyze_sentiment",
+    return_value="negative",
+)
+def test_slack_event_does_not_check_schema(
+    mock_analyze,
+    mock_db_manager,
+    mock_client_slack,
+    create_all,
+    monkeypatch,
+):
+    """Test the Slack event path does not issue schema checks."""
+    monkeypatch.setattr(DatabaseSchema, "ready", True)
+    mock_db_manager.return_value.read_channel_sentiment_message.return_value = (
+        None
+    )
+
+    process_event_callback(
+        {"event": {"text": "bad", "channel": "C123", "user": "U123"}}
+    )
+
+    create_all.assert_not_called()
+    mock_client_slack.chat_postMessage.assert_called_once()
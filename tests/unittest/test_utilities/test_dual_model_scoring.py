@@ -0,0 +1,78 @@
+import threading
+from unittest.mock import MagicMock
+
+import pytest
+
+from tts.helpers import functions
+
+
+@pytest.fixture
+def models():
+    """Fixture providing a mock VADER model."""
+    sia = MagicMock()
+    return sia, None
+
+
+@pytest.fixture
+def transformer_batcher(monkeypatch):
+    """Mock the transformer micro-batcher."""
+    mock_batcher = MagicMock()
+    mock_batcher.submit.return_value = {"label": "POSITIVE", "score": 0.9}
+    monkeypatch.setattr(functions, "transformer_batcher", mock_batcher)
+    return mock_batcher
+
+
+@pytest.mark.sentiment_analysis_unittest
+def test_conclusive_vader_skips_transformer(models, transformer_batcher):
+    """Test a strongly positive VADER score does not wait for the transformer."""
+    transformer_released = threading.Event()
+    sia, _ = models
+    sia.polarity_scores.return_value = {"compound": 0.9}
+    transformer_batcher.submit.side_effect = (
+        lambda message: transformer_released.wait(5)
+    )
+
+    scores = functions.score_sentiment("all", "Great job!", models)
+    transformer_released.set()
+
+    assert scores == (None, {"compound": 0.9})
+    assert (
+        functions.determine_sentiment("all", *scores)
+        == "definitely not negative"
+    )
+
+
+@pytest.mark.sentiment_analysis_unittest
+def test_inconclusive_vader_runs_transformer(models, transformer_batcher):
+    """Test a weak VADER score is combined with the transformer score."""
+    sia, _ = models
+    sia.polarity_scores.return_value = {"compound": -0.4}
+
+    scores = functions.score_sentiment("all", "Not great.", models)
+
+    assert scores == ({"label": "POSITIVE", "score": 0.9}, {"compound": -0.4})
+    assert functions.determine_sentiment("all", *scores) == "possibly negative"
+
+
+@pytest.mark.sentiment_analysis_unittest
+def test_models_run_concurrently(models, transformer_batcher):
+    """Test VADER runs while the transformer is scoring."""
+    transformer_started, vader_done = threading.Event(), threading.Event()
+    sia, _ = models
+
+    def vader_scores(message):
+        assert transformer_started.wait(5), "Models did not run concurrently."
+        vader_done.set()
+        return {"compound": 0.1}
+
+    def transformer_scores(message):
+        transformer_started.set()
+        assert vader_done.wait(5), "Models did not run concurrently."
+        return {"label": "NEGATIVE", "score": 0.1}
+
+    sia.polarity_scores.side_effect = vader_scores
+    transformer_batcher.submit.side_effect = transformer_scores
+
+    scores = functions.score_sentiment("all", "Good job.", models)
+
+    assert scores == ({"label": "NEGATIVE", "score": 0.1}, {"compound": 0.1})
@@ -0,0 +1,165 @@
+import json
+import os
+
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+from prometheus_client import REGISTRY
+
+from tts.extensions import config_tts
+from tts.helpers.bundle import model_source
+from tts.helpers.functions import TRANSFORMER_MODEL_NAME
+from tts.helpers.inference import (
+    OnnxBackend,
+    TensorFlowBackend,
+    TransformerBackend,
+)
+
+ONNX_MODEL_PATH = config_tts.project.onnx_model_path
+
+
+class WordTokenizer:
+    """Tokenizer with the length of each word as its token id."""
+
+    model_max_length = 5
+    pad_token_id = 0
+
+    def __init__(self):
+        self.calls = []
+
+    def __call__(self, messages: list, truncation: bool, max_length: int):
+        self.calls.append(list(messages))
+        return {
+            "input_ids": [
+                [len(word) for word in message.split()][:max_length]
+                for message in messages
+            ]
+        }
+
+
+class RecordingBackend(TransformerBackend):
+    """Backend recording its inputs, more tokens give a higher score."""
+
+    def __init__(self, bucket_size: int = 8):
+        super().__init__(
+            WordTokenizer(),
+            SimpleNamespace(
+                id2label={0: "NEGATIVE", 1: "POSITIVE"},
+                max_position_embeddings=4,
+            ),
+            bucket_size=bucket_size,
+        )
+        self.inputs = []
+
+    def logits(self, inputs: dict) -> np.ndarray:
+        self.inputs.append(inputs)
+        lengths = inputs["attention_mask"].sum(axis=-1)
+        return np.stack([np.full(len(lengths), 1.0), lengths], axis=-1)
+
+
+@pytest.fixture(scope="module")
+def load_test_messages():
+    """Fixture providing the messages of the load test data."""
+    with open("tests/performance/data/load_test.json") as file:
+        data = json.load(file)
+    return [item["text"] for items in data.values() for item in items]
+
+
+@pytest.mark.inference_backend_unittest
+def test_backend_scores_label_and_probability():
+    """Test the backend output has the label and softmax score of each message."""
+    backend = RecordingBackend()
+
+    scores = backend.score(["bad", "quite good", "so very good"])
+
+    assert [score["label"] for score in scores] == [
+        "NEGATIVE",
+        "POSITIVE",
+        "POSITIVE",
+    ]
+    assert scores[0]["score"] == pytest.approx(0.5)
+    assert scores[1]["score"] == pytest.approx(1 / (1 + np.exp(-1.0)))
+    assert scores[2]["score"] == pytest.approx(1 / (1 + np.exp(-2.0)))
+
+
+@pytest.mark.inference_backend_unittest
+def test_backend_pads_buckets_of_similar_length():
+    """Test the messages are sorted by token length and padded per bucket."""
+    backend = RecordingBackend(bucket_size=2)
+
+    scores = backend.score(["a b c", "a", "a b c d", "a b"])
+
+    assert [inputs["input_ids"].shape for inputs in backend.inputs] == [
+        (2, 2),
+        (2, 4),
+    ]
+    assert [
+        inputs["attention_mask"].sum(axis=-1).tolist()
+        for inputs in backend.inputs
+    ] == [[1, 2], [3, 4]]
+    assert [score["score"] for score in scores] == pytest.approx(
+        [1 / (1 + np.exp(1.0 - length)) for length in (3, 1, 4, 2)]
+    )
+
+
+@pytest.mark.inference_backend_unittest
+def test_backend_truncates_at_max_length():
+    """Test the messages are truncated at the max sequence length."""
+    backend = RecordingBackend()
+
+    backend.score(["a b c d e f g h"])
+
+    assert backend.max_length == 4
+    assert backend.inputs[0]["input_ids"].tolist() == [[1, 1, 1, 1]]
+
+
+@pytest.mark.inference_backend_unittest
+def test_backend_caches_token_ids():
+    """Test the token ids are cached by content and reused."""
+    backend = RecordingBackend()
+
+    first = backend.score(["good work", "bad work", "good work"])
+    second = backend.score(["good  work", "new work"])
+
+    assert backend.tokenizer.calls == [
+        ["good work", "bad work"],
+        ["new work"],
+    ]
+    assert second[0] == first[0]
+
+
+@pytest.mark.inference_backend_unittest
+def test_backend_records_padding_efficiency():
+    """Test the share of real tokens of each forward pass is recorded."""
+    metric = "tts_transformer_padding_efficiency"
+    count = REGISTRY.get_sample_value(f"{metric}_count") or 0
+    total = REGISTRY.get_sample_value(f"{metric}_sum") or 0
+    backend = RecordingBackend()
+
+    backend.score(["a", "a b c d"])
+
+    assert REGISTRY.get_sample_value(f"{metric}_count") == count + 1
+    assert REGISTRY.get_sample_value(f"{metric}_sum") == pytest.approx(
+        total + 5 / 8
+    )
+
+
+@pytest.mark.inference_backend_unittest
+@pytest.mark.skipif(
+    not os.path.exists(ONNX_MODEL_PATH),
+    reason="The ONNX model is not exported, run export_onnx_model.py.",
+)
+def test_onnx_backend_matches_tensorflow(load_test_messages):
+    """Test the quantized ONNX backend matches the TensorFlow outputs."""
+    source = model_source(
+        TRANSFORMER_MODEL_NAME, config_tts.project.model_bundle_path
+    )
+    tensorflow_scores = TensorFlowBackend(source).score(load_test_messages)
+    onnx_scores = OnnxBackend(source, ONNX_MODEL_PATH).score(load_test_messages)
+
+    for tensorflow_score, onnx_score in zip(tensorflow_scores, onnx_scores):
+        assert onnx_score["label"] == tensorflow_score["label"]
+        assert onnx_score["score"] == pytest.approx(
+            tensorflow_score["score"], abs=0.05
+        )
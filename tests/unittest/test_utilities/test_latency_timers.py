@@ -0,0 +1,78 @@
+from unittest.mock import patch
+
+import pytest
+from prometheus_client import REGISTRY
+from slack_sdk import WebClient
+from sqlalchemy import create_engine, text
+
+from tts.helpers.functions import analyze_sentiment
+from tts.models.postgres.base import instrument_statements
+from tts.models.slack_application.client import InstrumentedWebClient
+
+
+def stage_count(stage: str) -> float:
+    """Return the number of timings of the pipeline stage."""
+    return REGISTRY.get_sample_value(
+        "tts_pipeline_stage_seconds_count", {"stage": stage}
+    )
+
+
+def external_call_count(service: str, operation: str) -> float:
+    """Return the number of timed calls of the external service operation."""
+    return (
+        REGISTRY.get_sample_value(
+            "tts_external_call_seconds_count",
+            {"service": service, "operation": operation},
+        )
+        or 0
+    )
+
+
+@pytest.mark.latency_timers_unittest
+def test_pipeline_stages_are_timed():
+    """Test every stage of the VADER sentiment analysis is timed once."""
+    stages = ("validation", "model_selection", "vader", "determine")
+    before = {stage: stage_count(stage) for stage in stages}
+
+    analyze_sentiment("The timers are lightweight.", "vader")
+
+    assert {stage: stage_count(stage) - before[stage] for stage in stages} == {
+        stage: 1 for stage in stages
+    }
+
+
+@pytest.mark.latency_timers_unittest
+def test_idle_pipeline_stages_are_exported():
+    """Test the stages are exported before any message is analyzed."""
+    for stage in ("tokenization", "forward_pass"):
+        assert stage_count(stage) is not None
+
+
+@pytest.mark.latency_timers_unittest
+def test_slack_api_calls_are_timed():
+    """Test the Slack client times the calls by API method."""
+    before = external_call_count("slack", "chat.postMessage")
+
+    with patch.object(WebClient, "api_call") as api_call:
+        InstrumentedWebClient(token="xoxb-test").chat_postMessage(
+            channel="C123", text="Hello"
+        )
+
+    api_call.assert_called_once()
+    assert external_call_count("slack", "chat.postMessage") == before + 1
+
+
+@pytest.mark.latency_timers_unittest
+def test_database_statements_are_timed():
+    """Test the engine times the statements by their SQL verb."""
+    engine = create_engine("sqlite://")
+    instrument_statements(engine)
+    before = external_call_count("postgres", "select")
+
+    with engine.connect() as connection:
+        connection.execute(text("SELECT 1"))
+        with pytest.raises(Exception):
+            connection.execute(text("SELECT * FROM missing"))
+        assert not connection.info["statement_start"]
+
+    assert external_call_count("postgres", "select") == before + 1
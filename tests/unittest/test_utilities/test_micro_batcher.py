@@ -0,0 +1,105 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from tts.helpers.batching import MicroBatcher
+
+
+class RecordingScorer:
+    """Record the batches passed to the scoring function."""
+
+    def __init__(self):
+        self.batches = []
+        self.lock = threading.Lock()
+
+    def __call__(self, messages: list) -> list:
+        with self.lock:
+            self.batches.append(list(messages))
+        return [{"label": "POSITIVE", "score": len(m)} for m in messages]
+
+
+@pytest.mark.micro_batching_unittest
+def test_concurrent_requests_are_batched():
+    """Test concurrent submissions are scored in fewer batched calls."""
+    scorer = RecordingScorer()
+    batcher = MicroBatcher(scorer, window_ms=100, max_batch_size=8)
+    messages = [f"message {'x' * i}" for i in range(8)]
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        results = list(executor.map(batcher.submit, messages))
+
+    assert [result["score"] for result in results] == [len(m) for m in messages]
+    assert len(scorer.batches) < len(messages)
+    assert all(len(batch) <= 8 for batch in scorer.batches)
+
+
+@pytest.mark.micro_batching_unittest
+def test_max_batch_size_is_respected():
+    """Test a batch never exceeds the configured size."""
+    scorer = RecordingScorer()
+    batcher = MicroBatcher(scorer, window_ms=50, max_batch_size=2)
+
+    with ThreadPoolExecutor(max_workers=6) as executor:
+        list(executor.map(batcher.submit, [str(i) for i in range(6)]))
+
+    assert all(len(batch) <= 2 for batch in scorer.batches)
+
+
+@pytest.mark.micro_batching_unittest
+def test_disabled_window_scores_directly():
+    """Test a zero window scores each message without the scheduler."""
+    scorer = RecordingScorer()
+    batcher = MicroBatcher(scorer, window_ms=0, max_batch_size=16)
+
+    assert batcher.submit("ok") == {"label": "POSITIVE", "score": 2}
+    assert scorer.batches == [["ok"]]
+    assert batcher._worker is None
+
+
+@pytest.mark.micro_batching_unittest
+def test_scoring_error_is_raised_to_every_caller():
+    """Test a failing batch raises the error in the waiting callers."""
+
+    def failing_scorer(messages):
+        raise RuntimeError("inference failed")
+
+    batcher = MicroBatcher(failing_scorer, window_ms=5, max_batch_size=4)
+
+    with pytest.raises(RuntimeError, match="inference failed"):
+        batcher.submit("ok")
+
+
+@pytest.mark.micro_batching_unittest
+def test_missing_scores_are_raised_and_the_batcher_recovers():
+    """Test a short list of scores fails the callers, not the scheduler."""
+    scorer = RecordingScorer()
+    calls = []
+
+    def short_scorer(messages):
+        calls.append(messages)
+        return [] if len(calls) == 1 else scorer(messages)
+
+    batcher = MicroBatcher(short_scorer, window_ms=5, max_batch_size=4)
+
+    with pytest.raises(ValueError, match="0 scores for 1 messages."):
+        batcher.submit("ok")
+    assert batcher.submit("fine") == {"label": "POSITIVE", "score": 4}
+
+
+@pytest.mark.micro_batching_unittest
+def test_callers_stop_waiting_after_the_timeout():
+    """Test a stuck scoring call does not block the callers forever."""
+    released = threading.Event()
+
+    def stuck_scorer(messages):
+        released.wait(5)
+        return [{"label": "POSITIVE", "score": 1.0} for _ in messages]
+
+    batcher = MicroBatcher(
+        stuck_scorer, window_ms=5, max_batch_size=4, timeout=0.05
+    )
+
+    with pytest.raises(TimeoutError):
+        batcher.submit("ok")
+    released.set()
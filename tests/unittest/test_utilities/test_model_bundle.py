@@ -0,0 +1,129 @@
+import json
+import os
+
+import pytest
+
+from tts.helpers.bundle import (
+    MANIFEST_FILE,
+    add_bundle_file,
+    build_model_bundle,
+    model_source,
+    read_manifest,
+    verify_model_bundle,
+)
+from tts.helpers.functions import TRANSFORMER_MODEL_NAME
+
+VOCABULARY = ("[PAD]", "[UNK]", "[CLS]", "[SEP]", "[MASK]", "great", "job")
+
+
+@pytest.fixture(scope="module")
+def model_name(tmp_path_factory):
+    """Fixture saving a tiny random DistilBERT model, nothing is downloaded."""
+    from transformers import (
+        DistilBertConfig,
+        DistilBertTokenizerFast,
+        TFDistilBertForSequenceClassification,
+    )
+
+    path = tmp_path_factory.mktemp("pretrained")
+    vocabulary = path / "vocab.txt"
+    vocabulary.write_text("\n".join(VOCABULARY) + "\n")
+    DistilBertTokenizerFast(vocab_file=str(vocabulary)).save_pretrained(path)
+    model = TFDistilBertForSequenceClassification(
+        DistilBertConfig(
+            vocab_size=len(VOCABULARY),
+            dim=8,
+            n_layers=1,
+            n_heads=2,
+            hidden_dim=16,
+        )
+    )
+    model(model.dummy_inputs)
+    model.save_pretrained(path)
+    return str(path)
+
+
+@pytest.fixture(scope="module")
+def bundle_path(tmp_path_factory, model_name):
+    """Fixture building the model bundle in a temporary directory."""
+    path = str(tmp_path_factory.mktemp("models") / "bundle")
+    build_model_bundle(model_name, path)
+    return path
+
+
+@pytest.mark.model_bundle_unittest
+def test_bundle_manifest(bundle_path, model_name):
+    """Test the manifest lists the bundle files and a content version."""
+    manifest = read_manifest(bundle_path)
+
+    assert manifest["model_name"] == model_name
+    assert manifest["version"].startswith(f"{model_name}@")
+    assert {"config.json", "model.safetensors", "tokenizer.json"} <= set(
+        manifest["files"]
+    )
+    assert set(manifest["files"]) | {MANIFEST_FILE} == set(
+        os.listdir(bundle_path)
+    )
+
+
+@pytest.mark.model_bundle_unittest
+def test_bundle_version_is_reproducible(bundle_path, model_name, tmp_path):
+    """Test the same model files give the same bundle version."""
+    path = str(tmp_path / "bundle")
+
+    version = build_model_bundle(model_name, path)
+
+    assert version == read_manifest(bundle_path)["version"]
+
+
+@pytest.mark.model_bundle_unittest
+def test_model_source_loads_verified_bundle(bundle_path, model_name):
+    """Test the model is loaded from the bundle when its files are intact."""
+    from transformers import DistilBertTokenizerFast
+
+    assert model_source(model_name, bundle_path) == bundle_path
+    assert DistilBertTokenizerFast.from_pretrained(bundle_path).is_fast
+
+
+@pytest.mark.model_bundle_unittest
+def test_model_source_without_bundle(tmp_path):
+    """Test the model is resolved by its name when there is no bundle."""
+    path = str(tmp_path / "missing")
+
+    assert model_source(TRANSFORMER_MODEL_NAME, path) == TRANSFORMER_MODEL_NAME
+    assert read_manifest(path) is None
+
+
+@pytest.mark.model_bundle_unittest
+def test_verify_bundle_rejects_changed_file(model_name, tmp_path):
+    """Test a bundle file changed after the build fails the check."""
+    path = str(tmp_path / "bundle")
+    build_model_bundle(model_name, path)
+    with open(os.path.join(path, "config.json"), "a") as config:
+        config.write(json.dumps({}))
+
+    with pytest.raises(ValueError, match="config.json"):
+        verify_model_bundle(path)
+    with pytest.raises(ValueError, match="config.json"):
+        model_source(model_name, path)
+
+
+@pytest.mark.model_bundle_unittest
+def test_exported_onnx_model_is_verified(model_name, tmp_path):
+    """Test the ONNX model exported to the bundle is checked with its files."""
+    path = str(tmp_path / "bundle")
+    version = build_model_bundle(model_name, path)
+    onnx_model_path = os.path.join(path, "model-int8.onnx")
+    with open(onnx_model_path, "wb") as onnx_model:
+        onnx_model.write(b"onnx")
+
+    assert add_bundle_file(path, "model-int8.onnx") != version
+    assert "model-int8.onnx" in read_manifest(path)["files"]
+    verify_model_bundle(path)
+
+    with open(onnx_model_path, "ab") as onnx_model:
+        onnx_model.write(b"changed")
+    with pytest.raises(ValueError, match="model-int8.onnx"):
+        verify_model_bundle(path)
+    with pytest.raises(ValueError, match="not in the model bundle"):
+        add_bundle_file(path, "../model-int8.onnx")
@@ -0,0 +1,77 @@
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import MagicMock
+
+import pytest
+
+from tts.helpers.registry import LazyModel, ModelRegistry
+
+
+@pytest.fixture
+def loaders():
+    """Fixture providing mock loaders for the models."""
+    return {"vader": MagicMock(), "transformer": MagicMock()}
+
+
+@pytest.fixture
+def registry(loaders):
+    """Fixture creating a registry with the mock loaders."""
+    return ModelRegistry(
+        *(
+            LazyModel(name, loader, version="1")
+            for name, loader in loaders.items()
+        )
+    )
+
+
+@pytest.mark.model_registry_unittest
+def test_models_are_not_loaded_until_first_use(registry, loaders):
+    """Test the models are loaded lazily."""
+    assert registry.states() == {
+        "vader": LazyModel.NOT_LOADED,
+        "transformer": LazyModel.NOT_LOADED,
+    }
+
+    registry.get("vader")
+
+    loaders["vader"].assert_called_once()
+    loaders["transformer"].assert_not_called()
+    assert registry.states()["vader"] == LazyModel.LOADED
+
+
+@pytest.mark.model_registry_unittest
+def test_model_is_loaded_once_under_concurrency(registry, loaders):
+    """Test concurrent first use loads the model once."""
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        models = list(executor.map(registry.get, ["transformer"] * 8))
+
+    loaders["transformer"].assert_called_once()
+    assert all(model is models[0] for model in models)
+
+
+@pytest.mark.model_registry_unittest
+def test_preload(registry, loaders):
+    """Test preloading only the requested models."""
+    registry.preload(("transformer",))
+
+    loaders["transformer"].assert_called_once()
+    loaders["vader"].assert_not_called()
+
+
+@pytest.mark.model_registry_unittest
+def test_failed_load_is_reported(registry, loaders):
+    """Test a failing loader is reported and retried on the next use."""
+    loaders["vader"].side_effect = [OSError("no lexicon"), MagicMock()]
+
+    with pytest.raises(OSError):
+        registry.get("vader")
+    assert registry.states()["vader"] == LazyModel.FAILED
+
+    registry.get("vader")
+    assert registry.states()["vader"] == LazyModel.LOADED
+
+
+@pytest.mark.model_registry_unittest
+def test_unknown_model(registry):
+    """Test requesting an unknown model."""
+    with pytest.raises(ValueError, match="Unknown model 'bert'."):
+        registry.get("bert")
@@ -0,0 +1,70 @@
+import threading
+from unittest.mock import MagicMock
+
+import pytest
+
+from tts.helpers.functions import warm_up_models
+from tts.helpers.warmup import ModelWarmup
+
+
+@pytest.mark.model_warmup_unittest
+def test_warmup_runs_once():
+    """Test the warm-up runs once and reports ready."""
+    warm_up = MagicMock()
+    warmup = ModelWarmup(warm_up)
+
+    warmup.run()
+    warmup.run()
+
+    warm_up.assert_called_once()
+    assert warmup.ready
+    assert warmup.seconds is not None
+
+
+@pytest.mark.model_warmup_unittest
+def test_warmup_failure_is_not_ready():
+    """Test a failed warm-up is reported and never ready."""
+    warmup = ModelWarmup(MagicMock(side_effect=OSError("model not found")))
+
+    warmup.run()
+
+    assert warmup.state == ModelWarmup.FAILED
+    assert not warmup.ready
+
+
+@pytest.mark.model_warmup_unittest
+def test_warmup_in_background():
+    """Test the background warm-up is not ready until it completes."""
+    release = threading.Event()
+    warmup = ModelWarmup(release.wait)
+
+    thread = warmup.start()
+    assert not warmup.ready
+
+    release.set()
+    thread.join(timeout=5)
+    assert warmup.ready
+
+
+@pytest.mark.model_warmup_unittest
+def test_warm_up_models_at_batch_sizes(monkeypatch):
+    """Test each model scores the warm-up messages at every batch size."""
+    models = {"vader": MagicMock(), "vader_bulk": MagicMock()}
+    batch_scores = MagicMock()
+    monkeypatch.setattr("tts.helpers.functions.model_registry.get", models.get)
+    monkeypatch.setattr(
+        "tts.helpers.functions.get_transformer_batch_scores", batch_scores
+    )
+    models["transformer"] = MagicMock()
+
+    warm_up_models(("vader", "vader_bulk", "transformer"), (1, 4))
+
+    assert models["vader"].polarity_scores.call_count == 5
+    assert [
+        len(call.args[0])
+        for call in models["vader_bulk"].polarity_scores_batch.call_args_list
+    ] == [1, 4]
+    assert [len(call.args[1]) for call in batch_scores.call_args_list] == [
+        1,
+        4,
+    ]
@@ -0,0 +1,91 @@
+from dataclasses import replace
+
+import pytest
+from prometheus_client import REGISTRY
+
+from tests.constants import Endpoint
+from tts.extensions import config_tts
+from tts.helpers.limiter import (
+    api_key_digest,
+    limiter_storage_options,
+    rate_limit,
+    rate_limit_key,
+    rate_limit_value,
+)
+from tts.models.redis.client import RedisClient
+
+
+@pytest.fixture
+def partner_key(monkeypatch):
+    """Fixture giving an API key a tier of 3 requests per minute."""
+    api_key = "partner-api-key"
+    settings = replace(
+        config_tts.settings,
+        rate_limit_tiers={"partner": (3, 100)},
+        api_key_tiers={api_key_digest(api_key): "partner"},
+    )
+    monkeypatch.setattr(
+        config_tts, "snapshot", replace(config_tts.snapshot, settings=settings)
+    )
+    return api_key
+
+
+@pytest.mark.rate_limiter_unittest
+def test_unknown_api_keys_are_limited_by_address(app, partner_key):
+    """Test the requests without a tiered API key share the address limit."""
+    for headers in ({}, {"Authorization": "random-api-key"}):
+        with app.test_request_context(
+            headers=headers, environ_base={"REMOTE_ADDR": "10.0.0.1"}
+        ):
+            assert rate_limit_key() == "10.0.0.1"
+            assert rate_limit_value() == rate_limit(
+                *config_tts.settings.rate_limiter
+            )
+
+
+@pytest.mark.rate_limiter_unittest
+def test_tiered_api_keys_are_limited_by_key(app, partner_key):
+    """Test a tiered API key has the quota of its tier on every address."""
+    keys = set()
+    for address in ("10.0.0.1", "10.0.0.2"):
+        with app.test_request_context(
+            headers={"Authorization": partner_key},
+            environ_base={"REMOTE_ADDR": address},
+        ):
+            keys.add(rate_limit_key())
+            assert rate_limit_value() == "3 per minute; 100 per second"
+
+    assert keys == {f"api_key:{api_key_digest(partner_key)[:16]}"}
+
+
+@pytest.mark.rate_limiter_unittest
+def test_tier_quota_is_enforced(client, partner_key):
+    """Test the requests beyond the quota of the tier are rejected."""
+    rejected = REGISTRY.get_sample_value(
+        "tts_rate_limit_decision_seconds_count", {"result": "rejected"}
+    )
+
+    statuses = [
+        client.get(
+            Endpoint.HEALTH, headers={"Authorization": partner_key}
+        ).status_code
+        for _ in range(5)
+    ]
+
+    assert statuses == [200, 200, 200, 429, 429]
+    assert client.get(Endpoint.HEALTH).status_code == 200
+    assert (
+        REGISTRY.get_sample_value(
+            "tts_rate_limit_decision_seconds_count", {"result": "rejected"}
+        )
+        == (rejected or 0) + 2
+    )
+
+
+@pytest.mark.rate_limiter_unittest
+def test_redis_storage_shares_the_connection_pool():
+    """Test the Redis limiter storage uses the connection pool of the service."""
+    assert limiter_storage_options("redis://") == {
+        "connection_pool": RedisClient().get_pool()
+    }
+    assert limiter_storage_options("memory://") == {}
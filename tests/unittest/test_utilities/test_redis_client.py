@@ -19,18 +19,35 @@ def mock_redis(mocker):
 
 @pytest.mark.redis_client_unittest
 def test_connect(redis_client, mocker):
-    """Test Redis connection is established."""
+    """Test Redis connection is established through the connection pool."""
     import redis
 
     mock_redis_instance = mocker.patch.object(redis, "StrictRedis", autospec=True)
     redis_client.connect()
 
-    mock_redis_instance.assert_called_once_with(
-        host=EnvironmentVariables.REDIS_HOST,
-        port=int(EnvironmentVariables.REDIS_PORT),
-        db=0,
-        password=EnvironmentVariables.REDIS_PASSWORD,
+    pool = redis_client.get_pool()
+    mock_redis_instance.assert_called_once_with(connection_pool=pool)
+    assert pool.connection_kwargs["host"] == EnvironmentVariables.REDIS_HOST
+    assert pool.connection_kwargs["port"] == int(
+        EnvironmentVariables.REDIS_PORT
     )
+    assert pool.connection_kwargs["password"] == (
+        EnvironmentVariables.REDIS_PASSWORD
+    )
+    assert pool.max_connections == int(
+        EnvironmentVariables.REDIS_MAX_CONNECTIONS
+    )
+
+
+@pytest.mark.redis_client_unittest
+def test_connection_is_reused(mock_redis):
+    """Test every client of the process shares one pool and one connection."""
+    first_client, second_client = RedisClient(), RedisClient()
+    first_client.get_user_data("U123")
+    first_client.get_user_data("U123")
+
+    assert first_client.connection is mock_redis
+    assert first_client.get_pool() is second_client.get_pool()
 
 @pytest.mark.redis_client_unittest
 def test_close(redis_client, mock_redis):
@@ -50,8 +67,9 @@ def test_store_user_data_with_ttl(redis_client, mock_redis):
     }
     redis_client.store_user_data_with_ttl(**user_data, ttl_seconds=1800)
     user_key = f"user:{user_data['user_id']}:event_data"
+    mock_pipeline = mock_redis.pipeline.return_value
 
-    mock_redis.hset.assert_called_once_with(
+    mock_pipeline.hset.assert_called_once_with(
         user_key,
         mapping={
             "team_id": user_data["team_id"],
@@ -60,7 +78,8 @@ def test_store_user_data_with_ttl(redis_client, mock_redis):
             "channel_name": user_data["channel_name"],
         },
     )
-    mock_redis.expire.assert_called_once_with(user_key, 1800)
+    mock_pipeline.expire.assert_called_once_with(user_key, 1800)
+    mock_pipeline.execute.assert_called_once()
 
 @pytest.mark.redis_client_unittest
 def test_get_user_data(redis_client, mock_redis):
@@ -105,3 +124,46 @@ def test_delete_user_data(redis_client, mock_redis):
 
     redis_client.delete_user_data(user_id)
     mock_redis.delete.assert_called_once_with(user_key)
+
+
+@pytest.mark.redis_client_unittest
+def test_redis_calls_are_timed(redis_client, mock_redis):
+    """Test the Redis calls are timed by operation."""
+    from prometheus_client import REGISTRY
+
+    labels = {"service": "redis", "operation": "hgetall"}
+    before = REGISTRY.get_sample_value(
+        "tts_external_call_seconds_count", labels
+    ) or 0
+    redis_client.get_user_data("U123")
+
+    assert REGISTRY.get_sample_value(
+        "tts_external_call_seconds_count", labels
+    ) == before + 1
+
+
+@pytest.mark.redis_client_unittest
+def test_pooled_connections_are_reused(mocker):
+    """Test the pool counts the checkouts and the opened connections."""
+    import redis
+    from prometheus_client import REGISTRY
+
+    from tts.models.redis.client import InstrumentedConnectionPool
+
+    mocker.patch.object(redis.Connection, "connect")
+    mocker.patch.object(redis.Connection, "can_read", return_value=False)
+    checkouts = REGISTRY.get_sample_value("tts_redis_pool_checkouts_total")
+    created = REGISTRY.get_sample_value(
+        "tts_redis_pool_connections_created_total"
+    )
+    pool = InstrumentedConnectionPool()
+
+    for _ in range(3):
+        pool.release(pool.get_connection("GET"))
+
+    assert REGISTRY.get_sample_value(
+        "tts_redis_pool_checkouts_total"
+    ) == checkouts + 3
+    assert REGISTRY.get_sample_value(
+        "tts_redis_pool_connections_created_total"
+    ) == created + 1
@@ -0,0 +1,44 @@
+import decimal
+
+import pytest
+from pydantic import BaseModel
+
+from tts.helpers.responses import dumps
+
+
+class Scores(BaseModel):
+    """Model serialized inside a JSON response."""
+
+    label: str
+    score: float
+
+
+@pytest.mark.json_response_unittest
+def test_dumps_serializes_models_and_decimals():
+    """Test the objects orjson does not support are serialized."""
+    body = dumps(
+        {
+            "scores": Scores(label="POSITIVE", score=0.9),
+            "cost": decimal.Decimal("1.5"),
+        }
+    )
+
+    assert body == b'{"scores":{"label":"POSITIVE","score":0.9},"cost":"1.5"}'
+
+
+@pytest.mark.json_response_unittest
+def test_dumps_rejects_unknown_objects():
+    """Test an unknown object is not serialized."""
+    with pytest.raises(TypeError):
+        dumps({"value": object()})
+
+
+@pytest.mark.json_response_unittest
+def test_jsonify_uses_the_orjson_provider(app):
+    """Test the application responses are serialized by orjson."""
+    with app.app_context():
+        response = app.json.response({"text": "café"})
+
+    assert response.content_type == "application/json"
+    assert response.data == '{"text":"café"}'.encode()
+    assert app.json.loads(response.data) == {"text": "café"}
@@ -0,0 +1,99 @@
+import json
+from unittest.mock import MagicMock
+
+import pytest
+from redis.exceptions import ConnectionError as RedisConnectionError
+
+from tts.helpers import functions
+from tts.helpers.cache import LRUCache, TieredCache, content_key
+
+
+@pytest.fixture
+def redis_client():
+    """Fixture providing a mock Redis client."""
+    client = MagicMock()
+    client.get_cached_value.return_value = None
+    return client
+
+
+@pytest.mark.result_cache_unittest
+def test_lru_eviction():
+    """Test the least recently used value is evicted."""
+    cache = LRUCache(maxsize=2, ttl_seconds=60)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")
+    cache.set("c", 3)
+
+    assert cache.get("a") == 1
+    assert cache.get("b") is None
+    assert cache.get("c") == 3
+
+
+@pytest.mark.result_cache_unittest
+def test_ttl_expiry(monkeypatch):
+    """Test an expired value is a miss."""
+    now = [1000.0]
+    monkeypatch.setattr("tts.helpers.cache.time.monotonic", lambda: now[0])
+    cache = LRUCache(maxsize=2, ttl_seconds=10)
+    cache.set("a", 1)
+
+    now[0] += 11
+
+    assert cache.get("a") is None
+    assert len(cache) == 0
+
+
+@pytest.mark.result_cache_unittest
+def test_content_key_normalizes_whitespace():
+    """Test the content key ignores the surrounding and repeated whitespace."""
+    assert content_key(" thanks  a lot ", "vader") == content_key(
+        "thanks a lot", "vader"
+    )
+    assert content_key("thanks", "vader") != content_key("thanks", "all")
+
+
+@pytest.mark.result_cache_unittest
+def test_redis_tier_fills_local_tier(redis_client):
+    """Test a Redis hit is stored in the local tier."""
+    redis_client.get_cached_value.return_value = json.dumps({"neg": 0.0})
+    cache = TieredCache("test", 8, 60, redis_client=redis_client)
+
+    assert cache.get("key") == {"neg": 0.0}
+    assert cache.local.get("key") == {"neg": 0.0}
+
+
+@pytest.mark.result_cache_unittest
+def test_redis_tier_is_written(redis_client):
+    """Test a stored value is written to Redis with the TTL."""
+    cache = TieredCache("test", 8, 60, redis_client=redis_client)
+    cache.set("key", [1, 2])
+
+    redis_client.set_cached_value.assert_called_once_with(
+        "cache:test:key", "[1, 2]", 60
+    )
+
+
+@pytest.mark.result_cache_unittest
+def test_redis_errors_are_misses(redis_client):
+    """Test an unavailable Redis does not fail the lookup."""
+    redis_client.get_cached_value.side_effect = RedisConnectionError()
+    redis_client.set_cached_value.side_effect = RedisConnectionError()
+    cache = TieredCache("test", 8, 60, redis_client=redis_client)
+
+    assert cache.get("key") is None
+    cache.set("key", 1)
+    assert cache.get("key") == 1
+
+
+@pytest.mark.result_cache_unittest
+def test_repeated_message_is_scored_once(monkeypatch):
+    """Test the same message is scored by the models only once."""
+    scores = (None, {"compound": 0.4})
+    mock_score = MagicMock(return_value=scores)
+    monkeypatch.setattr(functions, "score_sentiment", mock_score)
+
+    for message in ("thanks", " thanks ", "thanks"):
+        assert functions.get_sentiment_scores("vader", message, None) == scores
+
+    mock_score.assert_called_once()
@@ -1,22 +1,47 @@
-import ast
+import time
 from typing import Literal
 
-from flask import Flask, render_template, request, jsonify, Response
+from flask import Flask, g, render_template, request, Response
 from flask.testing import FlaskClient
-from flask_limiter import Limiter
-from flask_limiter.util import get_remote_address
+from flask_limiter import Limiter, RequestLimit
 from flask_cors import CORS
+from sqlalchemy.exc import SQLAlchemyError
 
 from tts.controllers import (
     sentiment_bp,
     proxy_sentiment_bp,
     health,
+    metrics,
     slack_verification,
     slack_events,
     slack_commands,
     slack_interactions,
 )
 from tts.extensions import config_tts, configurations
+from tts.helpers.attack_vector import (
+    AttackVectorMatcher,
+    AttackVectorMiddleware,
+    read_deny_list,
+)
+from tts.helpers.functions import model_registry, model_warmup
+from tts.helpers.limiter import (
+    limiter_storage_options,
+    rate_limit_key,
+    rate_limit_value,
+)
+from tts.helpers.metrics import (
+    HTTP_REQUEST_SECONDS,
+    HTTP_REQUESTS,
+    RATE_LIMIT_DECISION_SECONDS,
+    RATE_LIMITED_REQUESTS,
+)
+from tts.helpers.responses import OrjsonProvider
+from tts.models.postgres.base import initialize_database
+
+
+def route_label() -> str:
+    """Return the route of the current request for the metrics labels."""
+    return request.url_rule.rule if request.url_rule else "unmatched"
 
 
 class Monostate:
@@ -38,20 +63,19 @@ class SentimentAnalysisService(Monostate):
 
     def __init__(self, environment: Literal["production", "testing"]):
         self.app = Flask(__name__, template_folder="static")
+        self.app.json = OrjsonProvider(self.app)
         if environment not in ("production", "testing"):
-            environment = config_tts.project.environment
+            environment = config_tts.settings.environment
         self.app.config.from_object(configurations[environment])
-        minute, second = ast.literal_eval(config_tts.project.rate_limiter)
-        web_interface = ast.literal_eval(config_tts.project.web_interface)
-        Limiter(
-            get_remote_address,
-            app=self.app,
-            default_limits=[f"{minute} per minute", f"{second} per second"],
-            storage_uri="memory://",
-        )
+        self.instrument_requests()
+        self.configure_rate_limiter()
         self.configure_service()
+        self.preload_models()
+        if not self.app.config["TESTING"]:
+            self.bootstrap_database()
+            self.warm_up_models()
         self.block_attack_vector()
-        if web_interface:
+        if config_tts.settings.web_interface:
             CORS(
                 self.app,
                 resources={
@@ -68,6 +92,7 @@ class SentimentAnalysisService(Monostate):
         """Register the blueprint for the controller."""
         register_blueprints = (
             health,
+            metrics,
             sentiment_bp,
             proxy_sentiment_bp,
             slack_verification,
@@ -78,6 +103,97 @@ class SentimentAnalysisService(Monostate):
         for blueprint in register_blueprints:
             self.app.register_blueprint(blueprint)
 
+    @staticmethod
+    def preload_models() -> None:
+        """Load the configured models before serving the first request."""
+        model_registry.preload(config_tts.settings.preload_models)
+
+    @staticmethod
+    def warm_up_models() -> None:
+        """Warm up the configured models before reporting ready.
+
+        With preloaded models the application is created in the gunicorn
+        master, the warm-up completes before the workers are forked and they
+        start ready. Otherwise every worker warms up in the background.
+        """
+        if config_tts.settings.preload_models:
+            model_warmup.run()
+        else:
+            model_warmup.start()
+
+    @staticmethod
+    def bootstrap_database() -> None:
+        """Create the database schema before serving the first request.
+
+        An unavailable database does not stop the startup, the schema is then
+        created by the first database session.
+        """
+        try:
+            initialize_database()
+        except SQLAlchemyError:
+            pass
+
+    def instrument_requests(self) -> None:
+        """Count and time the requests by route.
+
+        The hooks are registered before the rate limiter, so the rejected
+        requests are timed as well. Paths matching no route share one label.
+        """
+
+        @self.app.before_request
+        def start_request_timer() -> None:
+            g.request_start = time.perf_counter()
+
+        @self.app.after_request
+        def observe_request(response: Response) -> Response:
+            route = route_label()
+            HTTP_REQUESTS.labels(
+                route=route, method=request.method, status=response.status_code
+            ).inc()
+            if "request_start" in g:
+                HTTP_REQUEST_SECONDS.labels(
+                    route=route, method=request.method
+                ).observe(time.perf_counter() - g.request_start)
+            return response
+
+    def configure_rate_limiter(self) -> None:
+        """Limit the requests by address, or by API key for the key tiers.
+
+        With the Redis storage, the moving window of a limit is checked and
+        updated by one Lua script call. The limiter falls back to the
+        in-memory storage while Redis is unavailable.
+        """
+        storage_uri = self.app.config.get(
+            "RATELIMIT_STORAGE_URI", config_tts.project.rate_limiter_storage
+        )
+        Limiter(
+            rate_limit_key,
+            app=self.app,
+            default_limits=[rate_limit_value],
+            storage_uri=storage_uri,
+            storage_options=limiter_storage_options(storage_uri),
+            strategy=config_tts.project.rate_limiter_strategy,
+            key_prefix=config_tts.project.name,
+            in_memory_fallback_enabled=True,
+            on_breach=self.count_rate_limited,
+        )
+
+        @self.app.before_request
+        def observe_rate_limit_decision() -> None:
+            RATE_LIMIT_DECISION_SECONDS.labels(result="allowed").observe(
+                time.perf_counter() - g.request_start
+            )
+
+    @staticmethod
+    def count_rate_limited(request_limit: RequestLimit) -> None:
+        """Count the request rejected by the rate limiter."""
+        RATE_LIMIT_DECISION_SECONDS.labels(result="rejected").observe(
+            time.perf_counter() - g.request_start
+        )
+        RATE_LIMITED_REQUESTS.labels(
+            route=route_label(), limit=str(request_limit.limit)
+        ).inc()
+
     def setup_web_route(self):
         """Setup the web route for the application."""
 
@@ -87,33 +203,18 @@ class SentimentAnalysisService(Monostate):
             return render_template("base.html"), 200
 
     def block_attack_vector(self) -> None:
-        """Block attack vectors from being accessed."""
-
-        @self.app.before_request
-        def attack_vector() -> tuple:
-            message = config_tts.project.attack_vector_message
-            sensitive_files = [
-                "/.env",
-                "/.envi",
-                "/.env.bak",
-                "/.env.swp",
-                "/.env.tmp",
-                "/.git",
-                "/.gitignore",
-                "/.gitmodules",
-                "/.gitkeep",
-                "/.gitlab-ci.yml",
-                "/.hg",
-                "/config.php",
-                "/backup.sql",
-                "/wp-config.php",
-                "/env.txt",
-                "/envi.txt",
-                "/config.txt",
-                "/config.ini",
-            ]
-            if any(request.path.startswith(file) for file in sensitive_files):
-                return jsonify({"message": message}), 403
+        """Block attack vectors from being accessed.
+
+        The paths of the deny-list are matched by a WSGI middleware, so the
+        scanner probes are rejected before the Flask dispatch.
+        """
+        self.app.wsgi_app = AttackVectorMiddleware(
+            self.app.wsgi_app,
+            AttackVectorMatcher(
+                read_deny_list(config_tts.project.attack_vector_deny_list)
+            ),
+            config_tts.project.attack_vector_message,
+        )
 
     def test_client(self) -> FlaskClient:
         """Create a test client for the application."""
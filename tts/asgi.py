@@ -0,0 +1,115 @@
+import asyncio
+import io
+import time
+from typing import Callable, Literal, Optional
+
+import aiohttp
+from a2wsgi import WSGIMiddleware
+from a2wsgi.wsgi import build_environ
+from werkzeug.exceptions import HTTPException
+
+from tts.app import SentimentAnalysisService
+from tts.controllers.slack.http.async_handlers import (
+    ROUTES,
+    event_tasks,
+    inference_executor,
+)
+from tts.extensions import config_tts, client_redis_async, client_slack_async
+from tts.helpers.asgi import AsgiResponse, read_request, send_response
+from tts.helpers.metrics import HTTP_REQUESTS, HTTP_REQUEST_SECONDS
+from tts.models.postgres.base import async_engine
+
+
+class SentimentAnalysisASGIService:
+    """ASGI variant of the sentiment analysis service.
+
+    The Slack routes are served by coroutines with the async Slack, Redis and
+    database clients, so one worker handles many concurrent interactions
+    while they wait on the I/O. The other routes are served by the Flask
+    application in the threads of the WSGI bridge. The Slack routes are rate
+    limited by the Flask application as well.
+    """
+
+    def __init__(self, environment: Literal["production", "testing"]):
+        self.service = SentimentAnalysisService(environment=environment)
+        self.wsgi = WSGIMiddleware(
+            self.service.app, workers=config_tts.settings.wsgi_workers
+        )
+
+    async def __call__(self, scope: dict, receive: Callable, send: Callable):
+        if scope["type"] == "lifespan":
+            return await self.lifespan(receive, send)
+
+        handler = (
+            ROUTES.get(scope["path"])
+            if scope["type"] == "http" and scope["method"] == "POST"
+            else None
+        )
+        if handler is None:
+            return await self.wsgi(scope, receive, send)
+
+        start = time.perf_counter()
+        request = await read_request(scope, receive)
+        response = await asyncio.to_thread(self.check_rate_limit, scope)
+        if response is None:
+            response = await handler(request)
+        await send_response(send, response)
+        HTTP_REQUESTS.labels(
+            route=scope["path"], method="POST", status=response.status
+        ).inc()
+        HTTP_REQUEST_SECONDS.labels(route=scope["path"], method="POST").observe(
+            time.perf_counter() - start
+        )
+
+    def check_rate_limit(self, scope: dict) -> Optional[AsgiResponse]:
+        """Apply the rate limits of the Flask routes to the request.
+
+        The before request hooks of the Flask application run in a request
+        context of the scope, so the Slack routes share the limits, the keys
+        and the metrics of the WSGI entry point. It is called in a thread,
+        so the storage of the limits is not reached from the event loop.
+
+        :returns: (AsgiResponse) The rejection, None for an allowed request.
+        """
+        app = self.service.app
+        with app.request_context(build_environ(scope, io.BytesIO())):
+            try:
+                rejection = app.preprocess_request()
+            except HTTPException as error:
+                rejection = app.handle_user_exception(error)
+            if rejection is None:
+                return None
+            response = app.make_response(rejection)
+            return AsgiResponse(
+                response.get_data(),
+                response.status_code,
+                content_type=response.content_type,
+            )
+
+    async def lifespan(self, receive: Callable, send: Callable) -> None:
+        """Open the async clients at startup and close them at shutdown."""
+        while True:
+            message = await receive()
+            if message["type"] == "lifespan.startup":
+                await self.startup()
+                await send({"type": "lifespan.startup.complete"})
+            elif message["type"] == "lifespan.shutdown":
+                await self.shutdown()
+                await send({"type": "lifespan.shutdown.complete"})
+                return
+
+    @staticmethod
+    async def startup() -> None:
+        """Share one HTTP session by the Slack API calls of the worker."""
+        client_slack_async.session = aiohttp.ClientSession()
+
+    @staticmethod
+    async def shutdown() -> None:
+        """Complete the accepted events and release the connections."""
+        await event_tasks.join()
+        inference_executor.shutdown()
+        if client_slack_async.session is not None:
+            await client_slack_async.session.close()
+            client_slack_async.session = None
+        await client_redis_async.close()
+        await async_engine.dispose()
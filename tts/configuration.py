@@ -29,3 +29,4 @@ class TestConfig(BaseConfig):
 
     TESTING = True
     DEBUG = True
+    RATELIMIT_STORAGE_URI = "memory://"
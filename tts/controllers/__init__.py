@@ -1,5 +1,6 @@
 from .sentiment_controller import sentiment_bp, proxy_sentiment_bp
 from .health_controller import health
+from .metrics_controller import metrics
 from tts.controllers.slack.http.slack_controller import (
     slack_verification,
     slack_events,
@@ -10,6 +11,7 @@ from tts.controllers.slack.http.slack_controller import (
 __all__ = [
     "sentiment_bp",
     "health",
+    "metrics",
     "slack_verification",
     "slack_events",
     "slack_commands",
@@ -1,9 +1,37 @@
+from functools import lru_cache
+
 from flask import Blueprint, jsonify
 
+from tts.helpers.functions import model_registry, model_warmup
+from tts.helpers.responses import dumps, json_response
+
 health = Blueprint("health", __name__)
 
 
+@lru_cache(maxsize=32)
+def health_body(states: tuple) -> bytes:
+    """Return the serialized health of the service for the model states."""
+    return dumps(
+        {
+            "status": "up",
+            "models": dict(states),
+            "versions": model_registry.versions(),
+        }
+    )
+
+
 @health.route("/api/v1/health", methods=["GET"])
 def health_check() -> jsonify:
-    """Health check API."""
-    return jsonify({"status": "up"}), 200
+    """Health check API, serialized once per state of the models."""
+    return json_response(health_body(tuple(model_registry.states().items())))
+
+
+@health.route("/api/v1/ready", methods=["GET"])
+def readiness_check() -> jsonify:
+    """Readiness check API, ready once the models are warmed up."""
+    return (
+        jsonify(
+            {"status": model_warmup.state, "seconds": model_warmup.seconds}
+        ),
+        200 if model_warmup.ready else 503,
+    )
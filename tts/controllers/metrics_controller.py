@@ -0,0 +1,36 @@
+import os
+
+from flask import Blueprint
+from prometheus_client import (
+    CONTENT_TYPE_LATEST,
+    REGISTRY,
+    CollectorRegistry,
+    generate_latest,
+    multiprocess,
+)
+
+metrics = Blueprint("metrics", __name__)
+
+
+def metrics_registry() -> CollectorRegistry:
+    """Return the registry of the metrics to export.
+
+    With ``PROMETHEUS_MULTIPROC_DIR`` set the metrics of every gunicorn
+    worker are aggregated from the files of the directory, otherwise the
+    metrics of the current process are exported.
+    """
+    if "PROMETHEUS_MULTIPROC_DIR" not in os.environ:
+        return REGISTRY
+    registry = CollectorRegistry()
+    multiprocess.MultiProcessCollector(registry)
+    return registry
+
+
+@metrics.route("/api/v1/metrics", methods=["GET"])
+def metrics_export() -> tuple:
+    """Prometheus metrics API."""
+    return (
+        generate_latest(metrics_registry()),
+        200,
+        {"Content-Type": CONTENT_TYPE_LATEST},
+    )
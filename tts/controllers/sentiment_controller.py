@@ -1,4 +1,5 @@
 from flask import Blueprint, request, jsonify, current_app
+from pydantic import ValidationError
 
 from tts.helpers.constants import EnvironmentVariables
 from tts.helpers.decorators import (
@@ -6,8 +7,14 @@ from tts.helpers.decorators import (
     require_api_key,
     ip_whitelist,
 )
-from tts.helpers.functions import analyze_sentiment
-from tts.models.sentiment import SentimentResponse
+from tts.helpers.functions import analyze_sentiment, analyze_sentiment_batch
+from tts.helpers.responses import model_response
+from tts.models.sentiment import (
+    SentimentResponse,
+    SentimentBatchRequest,
+    SentimentBatchItemError,
+    SentimentBatchResponse,
+)
 
 sentiment_bp = Blueprint("sentiment", __name__)
 proxy_sentiment_bp = Blueprint("proxy_sentiment", __name__)
@@ -28,6 +35,24 @@ def process_sentiment_analysis(data) -> SentimentResponse:
     )
 
 
+def process_sentiment_analysis_batch(items: list) -> SentimentBatchResponse:
+    """Helper function to process batch sentiment analysis."""
+    results = []
+    for item, sentiment_result in zip(items, analyze_sentiment_batch(items)):
+        if isinstance(sentiment_result, ValidationError):
+            results.append(
+                SentimentBatchItemError(error=sentiment_result.errors())
+            )
+        else:
+            results.append(
+                SentimentResponse(
+                    text=item.get("text"),
+                    sentiment_result=sentiment_result,
+                )
+            )
+    return SentimentBatchResponse(results=results)
+
+
 @sentiment_bp.route("/api/v1/sentiment-analysis", methods=["POST"])
 @require_api_key
 @handle_exceptions
@@ -35,7 +60,17 @@ def sentiment_analysis() -> jsonify:
     """Sentiment analysis API endpoint."""
     data = request.get_json()
     response = process_sentiment_analysis(data)
-    return response.model_dump_json()
+    return model_response(response)
+
+
+@sentiment_bp.route("/api/v1/sentiment-analysis/batch", methods=["POST"])
+@require_api_key
+@handle_exceptions
+def sentiment_analysis_batch() -> jsonify:
+    """Batch sentiment analysis API endpoint."""
+    batch_request = SentimentBatchRequest(items=request.get_json())
+    response = process_sentiment_analysis_batch(batch_request.items)
+    return model_response(response, compress=True)
 
 
 @proxy_sentiment_bp.route(
@@ -57,4 +92,4 @@ def proxy_sentiment_analysis() -> jsonify:
 
     data = request.get_json()
     response = process_sentiment_analysis(data)
-    return response.model_dump_json()
+    return model_response(response)
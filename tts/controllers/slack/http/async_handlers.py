@@ -0,0 +1,241 @@
+from typing import Callable, Mapping
+
+from tts.controllers.slack.http.constants import (
+    COMMANDS,
+    DEFAULT_SENTIMENT_MESSAGE,
+    EMPTY_JSON,
+    INVALID_FORM_MESSAGE,
+    NO_MESSAGE_FOUND,
+    RESPONSE_ACTION_CLEAR_JSON,
+    USER_DATA_NOT_FOUND,
+)
+from tts.controllers.slack.http.event_handlers import accepted_events
+from tts.controllers.slack.http.slack_controller import Routes
+from tts.controllers.slack.http.templates import Template
+from tts.extensions import config_tts, client_redis_async, client_slack_async
+from tts.helpers.asgi import AsgiRequest, AsgiResponse
+from tts.helpers.background import AsyncBoundedExecutor, BackgroundTasks
+from tts.helpers.decorators import handle_async_slack_exceptions
+from tts.helpers.functions import analyze_sentiment, is_negative_sentiment
+from tts.helpers.responses import dumps
+from tts.models.postgres.base import AsyncDatabaseManager
+from tts.models.slack_application import (
+    SlackInteractionModalResponse,
+    SlackVerificationChallengeResponse,
+    SlackVerificationRequest,
+    modal_view,
+    modal_view_callback_id,
+)
+from tts.models.slack_application.interaction.add import RedisValuesValidated
+
+inference_executor = AsyncBoundedExecutor(
+    name="inference",
+    max_workers=config_tts.settings.inference_workers,
+    max_pending=config_tts.settings.inference_max_pending,
+)
+event_tasks = BackgroundTasks(
+    name="slack_events_async",
+    max_tasks=config_tts.settings.event_max_tasks,
+)
+
+
+@handle_async_slack_exceptions
+async def slack_app_events(request: AsgiRequest) -> AsgiResponse:
+    """The endpoint for Slack events orchestration."""
+    data = request.json()
+    event_type = data.get("type")
+
+    if event_type == "url_verification":
+        return AsgiResponse(
+            status=307, headers=((b"location", Routes.VERIFICATION.encode()),)
+        )
+    elif event_type == "event_callback":
+        return await handle_event_callback(data, request.headers)
+
+    return AsgiResponse(RESPONSE_ACTION_CLEAR_JSON, 460)
+
+
+@handle_async_slack_exceptions
+async def slack_app_verification(request: AsgiRequest) -> AsgiResponse:
+    """The endpoint for Slack URL verification."""
+    validate_req = SlackVerificationRequest(**request.json())
+    response = SlackVerificationChallengeResponse(
+        challenge=validate_req.challenge
+    )
+    return AsgiResponse(dumps(response.model_dump()))
+
+
+@handle_async_slack_exceptions
+async def slack_app_commands(request: AsgiRequest) -> AsgiResponse:
+    """The endpoint for Slack commands."""
+    data = request.form()
+    command = data.get("command")
+
+    if command == COMMANDS["add"]:
+        redis_values = RedisValuesValidated(**data)
+
+        await client_redis_async.store_user_data_with_ttl(
+            user_id=redis_values.user_id,
+            team_id=redis_values.team_id,
+            team_domain=redis_values.team_domain,
+            channel_id=redis_values.channel_id,
+            channel_name=redis_values.channel_name,
+        )
+        await client_slack_async.views_open(
+            trigger_id=data.get("trigger_id"), view=modal_view.model_dump()
+        )
+        return AsgiResponse(EMPTY_JSON)
+    elif command == COMMANDS["read"]:
+        return await read_message_for_channel(data)
+
+    return AsgiResponse(RESPONSE_ACTION_CLEAR_JSON, 461)
+
+
+@handle_async_slack_exceptions
+async def slack_app_interaction(request: AsgiRequest) -> AsgiResponse:
+    """Handle interactions from Slack modal."""
+    validate_req = SlackInteractionModalResponse.model_validate_json(
+        request.form().get("payload")
+    )
+
+    if validate_req.view.callback_id == modal_view_callback_id:
+        return await handle_modal_submission(validate_req)
+
+    await client_slack_async.chat_postMessage(
+        channel=validate_req.user.id, text=INVALID_FORM_MESSAGE
+    )
+    return AsgiResponse(RESPONSE_ACTION_CLEAR_JSON, 462)
+
+
+async def handle_event_callback(
+    data: dict, headers: Mapping[str, str]
+) -> AsgiResponse:
+    """Acknowledges the event callback from Slack and processes it later.
+
+    Slack retries of an already accepted event_id are acknowledged without
+    processing the event again.
+    """
+    event_id = data.get("event_id")
+    is_retry = "x-slack-retry-num" in headers
+    if event_id and not await accepted_events.aadd(event_id, True) and is_retry:
+        return AsgiResponse(EMPTY_JSON)
+
+    if not event_tasks.start(process_event_callback(data)):
+        if event_id:
+            await accepted_events.adelete(event_id)
+        return AsgiResponse(RESPONSE_ACTION_CLEAR_JSON, 503)
+
+    return AsgiResponse(EMPTY_JSON)
+
+
+async def process_event_callback(data: dict) -> None:
+    """Processes the event callback from Slack.
+
+    The sentiment analysis runs in the inference threads, the event loop
+    keeps serving the other requests meanwhile.
+    """
+    event = data.get("event")
+
+    message = event.get("text")
+    channel_id = event.get("channel")
+    username = event.get("user")
+
+    sentiment_result = await inference_executor.run(
+        analyze_sentiment, message=message
+    )
+    if is_negative_sentiment(sentiment_result) and message and channel_id:
+        message = message[0:30] + " ..." if len(message) > 30 else message
+
+        existing_message = (
+            await AsyncDatabaseManager.read_channel_sentiment_message(
+                channel_id
+            )
+        )
+        await client_slack_async.chat_postMessage(
+            channel=channel_id,
+            text="Sentiment Analysis",
+            username=username,
+            attachments=Template.build_sentiment_attachments(
+                message=message,
+                sentiment_result=sentiment_result,
+                message_to_user=existing_message or DEFAULT_SENTIMENT_MESSAGE,
+            ),
+        )
+
+
+async def read_message_for_channel(data: dict) -> AsgiResponse:
+    """Read a sentiment analysis message from a channel."""
+    channel_id = data.get("channel_id")
+    if data.get("user_id"):
+        channel_message = (
+            await AsyncDatabaseManager.read_channel_sentiment_message(
+                channel_id
+            )
+        )
+        await client_slack_async.chat_postMessage(
+            channel=channel_id,
+            text="Sentiment Analysis",
+            mrkdwn=True,
+            attachments=Template.build_message_attachments(
+                title="Read Message",
+                channel_message=channel_message or NO_MESSAGE_FOUND,
+            ),
+        )
+    else:
+        await client_slack_async.chat_postMessage(
+            channel=channel_id, text=USER_DATA_NOT_FOUND
+        )
+
+    return AsgiResponse(EMPTY_JSON)
+
+
+async def handle_modal_submission(validated_data) -> AsgiResponse:
+    """Handle the submission of a Slack modal."""
+    state_values = validated_data.view.state.values
+    block = "sentiment_analysis_message_block"
+    input_ = "sentiment_analysis_message_input"
+
+    channel_message = state_values[block][input_].value
+    user_id = validated_data.user.id
+    user_data = await client_redis_async.get_user_data(user_id)
+
+    if not user_data:
+        await client_slack_async.chat_postMessage(
+            channel=user_id, text=USER_DATA_NOT_FOUND
+        )
+        return AsgiResponse(RESPONSE_ACTION_CLEAR_JSON)
+
+    channel_id = user_data["channel_id"]
+    if await AsyncDatabaseManager.read_channel_sentiment_message(channel_id):
+        await AsyncDatabaseManager.update_channel_sentiment_message(
+            channel_id=channel_id, sentiment_message=channel_message
+        )
+        title = "Updated"
+    else:
+        await AsyncDatabaseManager.add_channel_sentiment_message(
+            team_id=validated_data.team.id,
+            team_domain=validated_data.team.domain,
+            channel_id=channel_id,
+            channel_name=user_data["channel_name"],
+            sentiment_message=channel_message,
+        )
+        await client_redis_async.delete_user_data(user_id)
+        title = "Added"
+
+    await client_slack_async.chat_postMessage(
+        channel=channel_id,
+        text="Sentiment Analysis",
+        mrkdwn=True,
+        attachments=Template.build_message_attachments(
+            title=title, channel_message=channel_message
+        ),
+    )
+    return AsgiResponse(RESPONSE_ACTION_CLEAR_JSON)
+
+
+ROUTES: Mapping[str, Callable] = {
+    Routes.EVENTS: slack_app_events,
+    Routes.VERIFICATION: slack_app_verification,
+    Routes.COMMANDS: slack_app_commands,
+    Routes.INTERACTIONS: slack_app_interaction,
+}
@@ -1,5 +1,7 @@
 from typing import final
 
+import orjson
+
 from tts.extensions import config_tts
 
 
@@ -8,6 +10,8 @@ SIGNATURE_VERIFICATION_ERROR: final = {"error": "Signature verification failed."
 
 
 RESPONSE_ACTION_CLEAR: final = {"response_action": "clear"}
+RESPONSE_ACTION_CLEAR_JSON: final = orjson.dumps(RESPONSE_ACTION_CLEAR)
+EMPTY_JSON: final = orjson.dumps({})
 
 VALIDATION_ERROR_MESSAGE: final = "Validation error occurred."
 INVALID_FORM_MESSAGE: final = "Invalid form fields provided."
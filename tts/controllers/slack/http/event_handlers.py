@@ -1,14 +1,55 @@
-from flask import jsonify
+from flask import request
 
-from tts.controllers.slack.http.constants import DEFAULT_SENTIMENT_MESSAGE
+from tts.controllers.slack.http.constants import (
+    DEFAULT_SENTIMENT_MESSAGE,
+    EMPTY_JSON,
+    RESPONSE_ACTION_CLEAR_JSON,
+)
 from tts.controllers.slack.http.templates import Template
-from tts.extensions import client_slack
+from tts.extensions import client_redis, client_slack, config_tts
+from tts.helpers.background import BoundedExecutor
+from tts.helpers.cache import TieredCache
 from tts.helpers.functions import analyze_sentiment, is_negative_sentiment
-from tts.models.postgres.base import initialize_database, DatabaseManager
+from tts.helpers.responses import json_response
+from tts.models.postgres.base import DatabaseManager
+
+event_executor = BoundedExecutor(
+    name="slack_events",
+    max_workers=config_tts.settings.event_workers,
+    max_queue_size=config_tts.settings.event_queue_size,
+    drop_policy=config_tts.settings.event_drop_policy,
+)
+accepted_events = TieredCache(
+    name="slack_event",
+    maxsize=4096,
+    ttl_seconds=config_tts.settings.event_dedup_ttl,
+    redis_client=(
+        client_redis if config_tts.settings.event_dedup_redis else None
+    ),
+)
 
 
 def handle_event_callback(data: dict) -> tuple:
-    """Handles the event callback from Slack."""
+    """Acknowledges the event callback from Slack and queues its processing.
+
+    Slack retries (``X-Slack-Retry-Num``) of an already accepted event_id
+    are acknowledged without processing the event again.
+    """
+    event_id = data.get("event_id")
+    is_retry = request.headers.get("X-Slack-Retry-Num") is not None
+    if event_id and not accepted_events.add(event_id, True) and is_retry:
+        return json_response(EMPTY_JSON), 200
+
+    if not event_executor.submit(process_event_callback, data):
+        if event_id:
+            accepted_events.delete(event_id)
+        return json_response(RESPONSE_ACTION_CLEAR_JSON), 503
+
+    return json_response(EMPTY_JSON), 200
+
+
+def process_event_callback(data: dict) -> None:
+    """Processes the event callback from Slack."""
     event = data.get("event")
 
     message = event.get("text")
@@ -23,7 +64,6 @@ def handle_event_callback(data: dict) -> tuple:
             else message[: len(message)]
         )
 
-        initialize_database()
         db_manager = DatabaseManager()
 
         existing_message = db_manager.read_channel_sentiment_message(channel_id)
@@ -40,5 +80,3 @@ def handle_event_callback(data: dict) -> tuple:
                 message_to_user=existing_message,
             ),
         )
-
-    return jsonify({}), 200
@@ -1,12 +1,12 @@
-from flask import jsonify
-
 from tts.controllers.slack.http.constants import (
+    EMPTY_JSON,
     NO_MESSAGE_FOUND,
     USER_DATA_NOT_FOUND,
 )
 from tts.controllers.slack.http.templates import Template
 from tts.extensions import client_slack
-from tts.models.postgres.base import initialize_database, DatabaseManager
+from tts.helpers.responses import json_response
+from tts.models.postgres.base import DatabaseManager
 
 
 def read_message_for_channel(data: dict) -> tuple:
@@ -15,7 +15,6 @@ def read_message_for_channel(data: dict) -> tuple:
     user_id = data.get("user_id")
     channel_id = data.get("channel_id")
     if user_id:
-        initialize_database()
         db_manager = DatabaseManager()
 
         channel_message = db_manager.read_channel_sentiment_message(channel_id)
@@ -33,4 +32,4 @@ def read_message_for_channel(data: dict) -> tuple:
             channel=channel_id, text=USER_DATA_NOT_FOUND
         )
 
-    return jsonify({}), 200
+    return json_response(EMPTY_JSON), 200
@@ -1,24 +1,26 @@
-from flask import jsonify
+from flask import Response
 from slack_sdk import WebClient
 
 from tts.controllers.slack.http.constants import (
     USER_DATA_NOT_FOUND,
-    RESPONSE_ACTION_CLEAR,
+    EMPTY_JSON,
+    RESPONSE_ACTION_CLEAR_JSON,
 )
 from tts.controllers.slack.http.templates import Template
 from tts.extensions import client_redis, client_slack
-from tts.models.postgres.base import DatabaseManager, initialize_database
+from tts.helpers.responses import json_response
+from tts.models.postgres.base import DatabaseManager
 from tts.models.slack_application import modal_view
 
 
-def open_modal(data: dict) -> jsonify:
+def open_modal(data: dict) -> Response:
     """Open a Slack modal for adding a channel message."""
     trigger_id = data.get("trigger_id")
     client_slack.views_open(trigger_id=trigger_id, view=modal_view.model_dump())
-    return jsonify({}), 200
+    return json_response(EMPTY_JSON), 200
 
 
-def handle_modal_submission(client: WebClient, validated_data) -> jsonify:
+def handle_modal_submission(client: WebClient, validated_data) -> Response:
     """Handle the submission of a Slack modal."""
     state_values = validated_data.view.state.values
     block = "sentiment_analysis_message_block"
@@ -49,9 +51,8 @@ def handle_modal_submission(client: WebClient, validated_data) -> jsonify:
             channel=user_data["channel_id"],
             text=USER_DATA_NOT_FOUND,
         )
-        return jsonify(RESPONSE_ACTION_CLEAR)
+        return json_response(RESPONSE_ACTION_CLEAR_JSON)
 
-    initialize_database()
     db_manager = DatabaseManager()
     existing_message = db_manager.read_channel_sentiment_message(
         user_data["channel_id"]
@@ -74,4 +75,4 @@ def handle_modal_submission(client: WebClient, validated_data) -> jsonify:
         client_redis.delete_user_data(validated_data.user.id)
         send_message(title=added)
 
-    return jsonify(RESPONSE_ACTION_CLEAR)
+    return json_response(RESPONSE_ACTION_CLEAR_JSON)
@@ -1,18 +1,19 @@
 import json
 
-from flask import Blueprint, request, jsonify, redirect
+from flask import Blueprint, request, redirect
 
 # from tts.controllers.slack.http.auth import validate_request_signature
 from tts.controllers.slack.http.constants import (
     COMMANDS,
     INVALID_FORM_MESSAGE,
-    RESPONSE_ACTION_CLEAR,
+    RESPONSE_ACTION_CLEAR_JSON,
 )
 from tts.controllers.slack.http.event_handlers import handle_event_callback
 from tts.controllers.slack.http.messages import read_message_for_channel
 from tts.controllers.slack.http.modals import handle_modal_submission, open_modal
 from tts.extensions import client_redis, client_slack
 from tts.helpers.decorators import handle_slack_exceptions
+from tts.helpers.responses import json_response, model_response
 
 from tts.models.slack_application import (
     SlackVerificationRequest,
@@ -50,7 +51,7 @@ def slack_app_events():
         # validate_request_signature(request)
         return handle_event_callback(data)
 
-    return jsonify(RESPONSE_ACTION_CLEAR), 460
+    return json_response(RESPONSE_ACTION_CLEAR_JSON), 460
 
 
 @slack_verification.route(Routes.VERIFICATION, methods=["POST"])
@@ -62,7 +63,7 @@ def slack_app_verification():
     response = SlackVerificationChallengeResponse(
         challenge=validate_req.challenge
     )
-    return response.model_dump_json(), 200
+    return model_response(response)
 
 
 @slack_commands.route(Routes.COMMANDS, methods=["POST"])
@@ -88,7 +89,7 @@ def slack_app_commands():
     elif command == COMMANDS["read"]:
         return read_message_for_channel(data)
 
-    return jsonify(RESPONSE_ACTION_CLEAR), 461
+    return json_response(RESPONSE_ACTION_CLEAR_JSON), 461
 
 
 @slack_interactions.route(Routes.INTERACTIONS, methods=["POST"])
@@ -107,4 +108,4 @@ def slack_app_interaction():
         client_slack.chat_postMessage(
             channel=validate_req.user.id, text=INVALID_FORM_MESSAGE
         )
-        return jsonify(RESPONSE_ACTION_CLEAR), 462
+        return json_response(RESPONSE_ACTION_CLEAR_JSON), 462
@@ -1,18 +1,25 @@
 from typing import final
 
-from slack_sdk import WebClient
-
 from tts.configuration import ProdConfig, TestConfig
-from tts.helpers.common import Config
+from tts.helpers.common import Config, Settings
 from tts.helpers.constants import EnvironmentVariables
-from tts.models.redis.client import RedisClient
+from tts.models.redis.client import AsyncRedisClient, RedisClient
+from tts.models.slack_application.client import (
+    InstrumentedAsyncWebClient,
+    InstrumentedWebClient,
+)
 
 
-config_tts: final = Config()
+config_tts: final = Config(settings_class=Settings)
 env_variables: final = EnvironmentVariables()
 
 client_redis: final = RedisClient()
-client_slack = WebClient(token=env_variables.SLACK_BOT_OAUTH_TOKEN)
+client_slack = InstrumentedWebClient(token=env_variables.SLACK_BOT_OAUTH_TOKEN)
+
+client_redis_async: final = AsyncRedisClient()
+client_slack_async = InstrumentedAsyncWebClient(
+    token=env_variables.SLACK_BOT_OAUTH_TOKEN
+)
 
 configurations = {
     "production": ProdConfig,
@@ -0,0 +1,70 @@
+from dataclasses import dataclass
+from typing import Callable, Mapping
+from urllib.parse import parse_qsl
+
+import orjson
+
+from tts.helpers.responses import JSON_MIMETYPE
+
+
+@dataclass(frozen=True, slots=True)
+class AsgiRequest:
+    """HTTP request of the async routes, the header names are lowercase."""
+
+    method: str
+    path: str
+    headers: Mapping[str, str]
+    body: bytes
+
+    def json(self) -> any:
+        """Return the JSON body."""
+        return orjson.loads(self.body)
+
+    def form(self) -> dict:
+        """Return the fields of the url-encoded form body."""
+        return dict(parse_qsl(self.body.decode(), keep_blank_values=True))
+
+
+@dataclass(frozen=True, slots=True)
+class AsgiResponse:
+    """HTTP response of the async routes with a serialized JSON body."""
+
+    body: bytes = b""
+    status: int = 200
+    headers: tuple[tuple[bytes, bytes], ...] = ()
+    content_type: str = JSON_MIMETYPE
+
+
+async def read_request(scope: dict, receive: Callable) -> AsgiRequest:
+    """Read the request of the HTTP scope with its whole body."""
+    chunks = []
+    while True:
+        message = await receive()
+        chunks.append(message.get("body", b""))
+        if not message.get("more_body"):
+            break
+    return AsgiRequest(
+        method=scope["method"],
+        path=scope["path"],
+        headers={
+            name.decode("latin-1"): value.decode("latin-1")
+            for name, value in scope["headers"]
+        },
+        body=b"".join(chunks),
+    )
+
+
+async def send_response(send: Callable, response: AsgiResponse) -> None:
+    """Send the response of the HTTP scope."""
+    await send(
+        {
+            "type": "http.response.start",
+            "status": response.status,
+            "headers": [
+                (b"content-type", response.content_type.encode()),
+                (b"content-length", str(len(response.body)).encode()),
+                *response.headers,
+            ],
+        }
+    )
+    await send({"type": "http.response.body", "body": response.body})
@@ -0,0 +1,63 @@
+import json
+import re
+from typing import Callable, Iterable, Optional
+
+from tts.helpers.metrics import ATTACK_VECTOR_HITS
+
+
+def read_deny_list(path: str) -> list:
+    """Return the path prefixes of the deny-list file, without the comments."""
+    with open(path) as deny_list:
+        return [
+            line.strip()
+            for line in deny_list
+            if line.strip() and not line.lstrip().startswith("#")
+        ]
+
+
+class AttackVectorMatcher:
+    """Path prefixes compiled once into a single regular expression.
+
+    The longest prefixes are tried first, so a hit is counted for the most
+    specific prefix, e.g. "/.env.bak" rather than "/.env".
+    """
+
+    def __init__(self, prefixes: Iterable[str]):
+        self.prefixes = sorted(set(prefixes), key=len, reverse=True)
+        self._pattern = re.compile(
+            "|".join(map(re.escape, self.prefixes)) or r"(?!)"
+        )
+
+    def match(self, path: str) -> Optional[str]:
+        """Return the prefix the path starts with, None for a safe path."""
+        match = self._pattern.match(path)
+        return match.group() if match else None
+
+
+class AttackVectorMiddleware:
+    """WSGI middleware rejecting the attack vectors before Flask dispatch.
+
+    The rejected requests skip the request context, the rate limiter and the
+    routing, the hits are counted by prefix. The leading slashes of the path
+    are collapsed first, so "//.env" is rejected as "/.env".
+    """
+
+    def __init__(
+        self, wsgi_app: Callable, matcher: AttackVectorMatcher, message: str
+    ):
+        self.wsgi_app = wsgi_app
+        self.matcher = matcher
+        self.body = json.dumps({"message": message}).encode()
+        self.headers = [
+            ("Content-Type", "application/json"),
+            ("Content-Length", str(len(self.body))),
+        ]
+
+    def __call__(self, environ: dict, start_response: Callable) -> Iterable:
+        path = "/" + environ.get("PATH_INFO", "").lstrip("/")
+        prefix = self.matcher.match(path)
+        if prefix is None:
+            return self.wsgi_app(environ, start_response)
+        ATTACK_VECTOR_HITS.labels(pattern=prefix).inc()
+        start_response("403 FORBIDDEN", self.headers)
+        return [self.body]
@@ -0,0 +1,205 @@
+import asyncio
+import functools
+import logging
+import os
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Coroutine
+
+from tts.helpers.metrics import (
+    BACKGROUND_QUEUE_DEPTH,
+    BACKGROUND_TASK_ERRORS,
+    BACKGROUND_TASKS_DROPPED,
+)
+
+logger = logging.getLogger(__name__)
+
+
+class BoundedExecutor:
+    """Background worker threads consuming a bounded queue of tasks.
+
+    When the queue is full, ``drop_newest`` rejects the submitted task and
+    ``drop_oldest`` discards the oldest queued task to make room for it.
+    """
+
+    DROP_NEWEST = "drop_newest"
+    DROP_OLDEST = "drop_oldest"
+
+    def __init__(
+        self,
+        name: str,
+        max_workers: int,
+        max_queue_size: int,
+        drop_policy: str = DROP_NEWEST,
+    ):
+        if drop_policy not in (self.DROP_NEWEST, self.DROP_OLDEST):
+            raise ValueError(f"Invalid drop policy '{drop_policy}'.")
+        self.name = name
+        self.max_workers = max_workers
+        self.max_queue_size = max_queue_size
+        self.drop_policy = drop_policy
+        self._lock = threading.Lock()
+        self._queue = None
+        self._workers = []
+        self._pid = None
+
+    def submit(self, fn: Callable, *args, **kwargs) -> bool:
+        """Queue the task, return False when it was rejected."""
+        self._ensure_workers()
+        task = (fn, args, kwargs)
+        try:
+            self._queue.put_nowait(task)
+        except queue.Full:
+            if self.drop_policy == self.DROP_NEWEST or not self._replace(task):
+                BACKGROUND_TASKS_DROPPED.labels(executor=self.name).inc()
+                return False
+        BACKGROUND_QUEUE_DEPTH.labels(executor=self.name).set(
+            self._queue.qsize()
+        )
+        return True
+
+    def join(self) -> None:
+        """Wait until all the queued tasks are processed."""
+        if self._queue is not None:
+            self._queue.join()
+
+    def _replace(self, task: tuple) -> bool:
+        """Discard the oldest queued task and queue the new one."""
+        try:
+            self._queue.get_nowait()
+            self._queue.task_done()
+        except queue.Empty:
+            pass
+        else:
+            BACKGROUND_TASKS_DROPPED.labels(executor=self.name).inc()
+        try:
+            self._queue.put_nowait(task)
+        except queue.Full:
+            return False
+        return True
+
+    def _ensure_workers(self) -> None:
+        """Start the worker threads once per process."""
+        if self._pid == os.getpid():
+            return
+        with self._lock:
+            if self._pid == os.getpid():
+                return
+            self._queue = queue.Queue(maxsize=self.max_queue_size)
+            self._workers = [
+                threading.Thread(
+                    target=self._run,
+                    name=f"tts-{self.name}-{index}",
+                    daemon=True,
+                )
+                for index in range(self.max_workers)
+            ]
+            for worker in self._workers:
+                worker.start()
+            self._pid = os.getpid()
+
+    def _run(self) -> None:
+        """Process the queued tasks until the process exits."""
+        while True:
+            fn, args, kwargs = self._queue.get()
+            try:
+                fn(*args, **kwargs)
+            except Exception:  # noqa
+                BACKGROUND_TASK_ERRORS.labels(executor=self.name).inc()
+                logger.exception("Background task of '%s' failed.", self.name)
+            finally:
+                self._queue.task_done()
+                BACKGROUND_QUEUE_DEPTH.labels(executor=self.name).set(
+                    self._queue.qsize()
+                )
+
+
+class AsyncBoundedExecutor:
+    """Worker threads running the blocking calls of the coroutines.
+
+    At most ``max_pending`` calls are queued or running, the other coroutines
+    wait for a free slot without blocking the event loop.
+    """
+
+    def __init__(self, name: str, max_workers: int, max_pending: int):
+        self.name = name
+        self.max_workers = max_workers
+        self.max_pending = max_pending
+        self._executor = None
+        self._slots = None
+        self._pending = 0
+        self._pid = None
+
+    async def run(self, fn: Callable, *args, **kwargs) -> any:
+        """Run the call in a worker thread and return its result."""
+        self._ensure_executor()
+        async with self._slots:
+            self._pending += 1
+            BACKGROUND_QUEUE_DEPTH.labels(executor=self.name).set(self._pending)
+            try:
+                return await asyncio.get_running_loop().run_in_executor(
+                    self._executor, functools.partial(fn, *args, **kwargs)
+                )
+            finally:
+                self._pending -= 1
+                BACKGROUND_QUEUE_DEPTH.labels(executor=self.name).set(
+                    self._pending
+                )
+
+    def shutdown(self) -> None:
+        """Stop the worker threads once the running calls complete."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor, self._pid = None, None
+
+    def _ensure_executor(self) -> None:
+        """Start the worker threads once per process."""
+        if self._pid == os.getpid():
+            return
+        self._executor = ThreadPoolExecutor(
+            max_workers=self.max_workers, thread_name_prefix=f"tts-{self.name}"
+        )
+        self._slots = asyncio.Semaphore(self.max_pending)
+        self._pid = os.getpid()
+
+
+class BackgroundTasks:
+    """Bounded set of the coroutines running in the background of the loop.
+
+    A new coroutine is rejected while ``max_tasks`` coroutines are running.
+    """
+
+    def __init__(self, name: str, max_tasks: int):
+        self.name = name
+        self.max_tasks = max_tasks
+        self._tasks = set()
+
+    def start(self, coroutine: Coroutine) -> bool:
+        """Run the coroutine in the background, return False when rejected."""
+        if len(self._tasks) >= self.max_tasks:
+            coroutine.close()
+            BACKGROUND_TASKS_DROPPED.labels(executor=self.name).inc()
+            return False
+        task = asyncio.create_task(coroutine)
+        self._tasks.add(task)
+        task.add_done_callback(self._done)
+        BACKGROUND_QUEUE_DEPTH.labels(executor=self.name).set(len(self._tasks))
+        return True
+
+    async def join(self) -> None:
+        """Wait until all the running coroutines complete."""
+        while self._tasks:
+            await asyncio.gather(*self._tasks, return_exceptions=True)
+
+    def _done(self, task: asyncio.Task) -> None:
+        """Forget the completed task and report its failure."""
+        self._tasks.discard(task)
+        BACKGROUND_QUEUE_DEPTH.labels(executor=self.name).set(len(self._tasks))
+        if not task.cancelled() and task.exception() is not None:
+            BACKGROUND_TASK_ERRORS.labels(executor=self.name).inc()
+            logger.error(
+                "Background task of '%s' failed.",
+                self.name,
+                exc_info=task.exception(),
+            )
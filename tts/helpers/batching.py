@@ -0,0 +1,99 @@
+import os
+import queue
+import threading
+import time
+from concurrent.futures import Future
+from typing import Callable, Optional
+
+from tts.helpers.metrics import TRANSFORMER_BATCH_SIZE, TRANSFORMER_QUEUE_DEPTH
+
+
+class MicroBatcher:
+    """Group concurrent requests into a single batched scoring call.
+
+    Messages submitted within ``window_ms`` of the first queued message are
+    scored together, up to ``max_batch_size`` messages per call. A caller
+    waits up to ``timeout`` seconds for its score, None waits forever.
+    """
+
+    def __init__(
+        self,
+        score_batch: Callable[[list], list],
+        window_ms: float,
+        max_batch_size: int,
+        timeout: Optional[float] = None,
+    ):
+        self.score_batch = score_batch
+        self.window = window_ms / 1000
+        self.max_batch_size = max_batch_size
+        self.timeout = timeout
+        self._lock = threading.Lock()
+        self._queue = None
+        self._worker = None
+        self._pid = None
+
+    def submit(self, message: str) -> dict:
+        """Score the message together with the concurrently submitted ones."""
+        if self.window <= 0 or self.max_batch_size <= 1:
+            TRANSFORMER_BATCH_SIZE.observe(1)
+            return self.score_batch([message])[0]
+
+        future = Future()
+        self._ensure_worker()
+        self._queue.put((message, future))
+        TRANSFORMER_QUEUE_DEPTH.set(self._queue.qsize())
+        return future.result(timeout=self.timeout)
+
+    def _ensure_worker(self) -> None:
+        """Start the scheduler thread once per process."""
+        if self._pid == os.getpid() and self._worker.is_alive():
+            return
+        with self._lock:
+            if self._pid == os.getpid() and self._worker.is_alive():
+                return
+            self._queue = queue.Queue()
+            self._worker = threading.Thread(
+                target=self._run, name="tts-micro-batcher", daemon=True
+            )
+            self._worker.start()
+            self._pid = os.getpid()
+
+    def _collect(self) -> list:
+        """Wait for a message and collect the batch around it."""
+        batch = [self._queue.get()]
+        deadline = time.monotonic() + self.window
+        while len(batch) < self.max_batch_size:
+            timeout = deadline - time.monotonic()
+            if timeout <= 0:
+                break
+            try:
+                batch.append(self._queue.get(timeout=timeout))
+            except queue.Empty:
+                break
+        return batch
+
+    def _run(self) -> None:
+        """Score the collected batches until the process exits.
+
+        Every future of a batch is resolved, a failing or incomplete scoring
+        call is raised to the callers still waiting, so the thread survives.
+        """
+        while True:
+            batch = self._collect()
+            TRANSFORMER_QUEUE_DEPTH.set(self._queue.qsize())
+            TRANSFORMER_BATCH_SIZE.observe(len(batch))
+
+            messages = list(dict.fromkeys(message for message, _ in batch))
+            try:
+                scores = self.score_batch(messages)
+                if len(scores) != len(messages):
+                    raise ValueError(
+                        f"{len(scores)} scores for {len(messages)} messages."
+                    )
+                scores = dict(zip(messages, scores))
+                for message, future in batch:
+                    future.set_result(scores[message])
+            except Exception as e:
+                for _, future in batch:
+                    if not future.done():
+                        future.set_exception(e)
@@ -0,0 +1,120 @@
+import hashlib
+import json
+import os
+import shutil
+from typing import Optional
+
+MANIFEST_FILE = "manifest.json"
+
+
+def file_digest(path: str) -> str:
+    """Return the sha256 digest of the file."""
+    with open(path, "rb") as file:
+        return hashlib.file_digest(file, "sha256").hexdigest()
+
+
+def build_model_bundle(model_name: str, bundle_path: str) -> str:
+    """Save the weights, tokenizer and config of the model to a bundle.
+
+    The manifest holds the sha256 digest of each file and the version of the
+    bundle, derived from the model name and the digests.
+
+    :param model_name: (str) The name of the pretrained model.
+    :param bundle_path: (str) The directory of the bundle.
+    :returns: (str) The version of the bundle.
+    """
+    from transformers import (
+        DistilBertTokenizerFast,
+        TFDistilBertForSequenceClassification,
+    )
+
+    temporary_path = f"{bundle_path}.tmp"
+    shutil.rmtree(temporary_path, ignore_errors=True)
+    TFDistilBertForSequenceClassification.from_pretrained(
+        model_name
+    ).save_pretrained(temporary_path, safe_serialization=True)
+    DistilBertTokenizerFast.from_pretrained(model_name).save_pretrained(
+        temporary_path
+    )
+
+    files = {
+        name: file_digest(os.path.join(temporary_path, name))
+        for name in sorted(os.listdir(temporary_path))
+    }
+    version = write_manifest(temporary_path, model_name, files)
+
+    shutil.rmtree(bundle_path, ignore_errors=True)
+    os.replace(temporary_path, bundle_path)
+    return version
+
+
+def add_bundle_file(bundle_path: str, name: str) -> str:
+    """Add a file exported to the bundle to the digests of its manifest.
+
+    The version of the bundle changes with the content of the file, e.g. the
+    ONNX model exported by ``export_onnx_model.py``.
+
+    :param bundle_path: (str) The directory of the bundle.
+    :param name: (str) The path of the file relative to the bundle.
+    :returns: (str) The new version of the bundle.
+    """
+    manifest = read_manifest(bundle_path)
+    if manifest is None:
+        raise ValueError(f"Model bundle '{bundle_path}' has no manifest.")
+    if os.path.isabs(name) or os.path.normpath(name).startswith(os.pardir):
+        raise ValueError(f"File '{name}' is not in the model bundle.")
+    files = dict(manifest["files"])
+    files[name] = file_digest(os.path.join(bundle_path, name))
+    return write_manifest(bundle_path, manifest["model_name"], files)
+
+
+def write_manifest(bundle_path: str, model_name: str, files: dict) -> str:
+    """Write the manifest of the bundle files, return the bundle version."""
+    content = hashlib.sha256(
+        "\n".join(
+            f"{name}:{digest}" for name, digest in sorted(files.items())
+        ).encode()
+    ).hexdigest()
+    version = f"{model_name}@{content[:12]}"
+    manifest_path = os.path.join(bundle_path, MANIFEST_FILE)
+    with open(f"{manifest_path}.tmp", "w") as manifest:
+        json.dump(
+            {"model_name": model_name, "version": version, "files": files},
+            manifest,
+            indent=2,
+        )
+    os.replace(f"{manifest_path}.tmp", manifest_path)
+    return version
+
+
+def read_manifest(bundle_path: str) -> Optional[dict]:
+    """Return the manifest of the bundle, or None when there is no bundle."""
+    try:
+        with open(os.path.join(bundle_path, MANIFEST_FILE)) as manifest:
+            return json.load(manifest)
+    except FileNotFoundError:
+        return None
+
+
+def verify_model_bundle(bundle_path: str) -> None:
+    """Check the files of the bundle against the digests of its manifest."""
+    manifest = read_manifest(bundle_path)
+    if manifest is None:
+        raise ValueError(f"Model bundle '{bundle_path}' has no manifest.")
+    for name, digest in manifest["files"].items():
+        path = os.path.join(bundle_path, name)
+        if not os.path.isfile(path) or file_digest(path) != digest:
+            raise ValueError(
+                f"Model bundle file '{name}' does not match the manifest."
+            )
+
+
+def model_source(model_name: str, bundle_path: str) -> str:
+    """Return the verified bundle directory to load the model from.
+
+    The model is resolved by its name when there is no bundle.
+    """
+    if read_manifest(bundle_path) is None:
+        return model_name
+    verify_model_bundle(bundle_path)
+    return bundle_path
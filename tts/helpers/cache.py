@@ -0,0 +1,219 @@
+import asyncio
+import hashlib
+import json
+import os
+import threading
+import time
+import unicodedata
+from collections import OrderedDict
+from typing import Callable, Optional
+
+from redis.exceptions import RedisError
+
+from tts.helpers.metrics import CACHE_REQUESTS
+from tts.models.redis.client import RedisClient
+
+
+class LRUCache:
+    """Thread-safe in-process LRU cache with a time to live."""
+
+    def __init__(self, maxsize: int, ttl_seconds: float):
+        self.maxsize = maxsize
+        self.ttl_seconds = ttl_seconds
+        self._items: OrderedDict[str, tuple[float, any]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[any]:
+        """Return the value, or None when missing or expired."""
+        with self._lock:
+            item = self._items.get(key)
+            if item is None:
+                return None
+            expires_at, value = item
+            if expires_at < time.monotonic():
+                del self._items[key]
+                return None
+            self._items.move_to_end(key)
+            return value
+
+    def set(self, key: str, value: any) -> None:
+        """Store the value, evicting the least recently used one if full."""
+        with self._lock:
+            self._store(key, value)
+
+    def add(self, key: str, value: any) -> bool:
+        """Store the value only if the key is missing or expired."""
+        with self._lock:
+            item = self._items.get(key)
+            if item is not None and item[0] >= time.monotonic():
+                return False
+            self._store(key, value)
+            return True
+
+    def _store(self, key: str, value: any) -> None:
+        """Store the value, the caller holds the lock."""
+        if self.maxsize <= 0:
+            return
+        self._items[key] = (time.monotonic() + self.ttl_seconds, value)
+        self._items.move_to_end(key)
+        while len(self._items) > self.maxsize:
+            self._items.popitem(last=False)
+
+    def delete(self, key: str) -> None:
+        """Remove the value."""
+        with self._lock:
+            self._items.pop(key, None)
+
+    def clear(self) -> None:
+        """Remove all values."""
+        with self._lock:
+            self._items.clear()
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+
+class TieredCache:
+    """In-process LRU cache backed by an optional shared Redis tier.
+
+    Values must be JSON serializable to be stored in Redis. Redis errors are
+    treated as misses, so the cache never fails the request.
+
+    The coroutines use ``aget``, ``aset``, ``aadd`` and ``adelete``, which
+    call the Redis tier in a thread, so a slow Redis does not block the
+    event loop.
+
+    With ``publish_evictions`` the deleted keys are published to the other
+    processes, which drop them from their in-process tier, so they do not
+    serve a replaced value until it expires.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        maxsize: int,
+        ttl_seconds: int,
+        redis_client: Optional[RedisClient] = None,
+        publish_evictions: bool = False,
+    ):
+        self.name = name
+        self.ttl_seconds = ttl_seconds
+        self.local = LRUCache(maxsize=maxsize, ttl_seconds=ttl_seconds)
+        self.redis_client = redis_client
+        self.publish_evictions = publish_evictions and redis_client is not None
+        self._subscribed_pid: Optional[int] = None
+        self._subscribe_lock = threading.Lock()
+
+    def redis_key(self, key: str) -> str:
+        """Return the key of the value in Redis."""
+        return f"cache:{self.name}:{key}"
+
+    @property
+    def evictions_channel(self) -> str:
+        """Return the Redis channel of the deleted keys."""
+        return f"cache:{self.name}:evictions"
+
+    def subscribe_evictions(self) -> None:
+        """Subscribe the current process to the deleted keys, once per pid.
+
+        The subscription thread does not survive a fork, so each worker
+        subscribes on its first use of the cache.
+        """
+        pid = os.getpid()
+        if not self.publish_evictions or self._subscribed_pid == pid:
+            return
+        with self._subscribe_lock:
+            if self._subscribed_pid == pid:
+                return
+            self._subscribed_pid = pid
+            try:
+                self.redis_client.subscribe(
+                    self.evictions_channel, self.local.delete
+                )
+            except RedisError:
+                pass
+
+    def get(self, key: str) -> Optional[any]:
+        """Return the cached value, or None on a miss."""
+        self.subscribe_evictions()
+        value = self.local.get(key)
+        if value is None and self.redis_client:
+            try:
+                cached = self.redis_client.get_cached_value(self.redis_key(key))
+            except RedisError:
+                cached = None
+            if cached is not None:
+                value = json.loads(cached)
+                self.local.set(key, value)
+
+        CACHE_REQUESTS.labels(
+            cache=self.name, result="miss" if value is None else "hit"
+        ).inc()
+        return value
+
+    def set(self, key: str, value: any) -> None:
+        """Store the value in both tiers."""
+        self.local.set(key, value)
+        if self.redis_client:
+            try:
+                self.redis_client.set_cached_value(
+                    self.redis_key(key), json.dumps(value), self.ttl_seconds
+                )
+            except RedisError:
+                pass
+
+    def add(self, key: str, value: any) -> bool:
+        """Store the value only if the key is missing in both tiers."""
+        if not self.local.add(key, value):
+            return False
+        if self.redis_client:
+            try:
+                return self.redis_client.add_cached_value(
+                    self.redis_key(key), json.dumps(value), self.ttl_seconds
+                )
+            except RedisError:
+                pass
+        return True
+
+    def delete(self, key: str) -> None:
+        """Remove the value from both tiers and the other processes."""
+        self.local.delete(key)
+        if self.redis_client:
+            try:
+                self.redis_client.delete_cached_value(self.redis_key(key))
+                if self.publish_evictions:
+                    self.redis_client.publish_message(
+                        self.evictions_channel, key
+                    )
+            except RedisError:
+                pass
+
+    async def aget(self, key: str) -> Optional[any]:
+        """Return the cached value from a coroutine."""
+        return await self._run(self.get, key)
+
+    async def aset(self, key: str, value: any) -> None:
+        """Store the value in both tiers from a coroutine."""
+        await self._run(self.set, key, value)
+
+    async def aadd(self, key: str, value: any) -> bool:
+        """Store the value only if the key is missing, from a coroutine."""
+        return await self._run(self.add, key, value)
+
+    async def adelete(self, key: str) -> None:
+        """Remove the value from both tiers from a coroutine."""
+        await self._run(self.delete, key)
+
+    async def _run(self, method: Callable, *args) -> any:
+        """Call the method in a thread when it reaches the Redis tier."""
+        if self.redis_client is None:
+            return method(*args)
+        return await asyncio.to_thread(method, *args)
+
+
+def content_key(*parts: str) -> str:
+    """Return a content hash of the normalized parts."""
+    normalized = (
+        " ".join(unicodedata.normalize("NFC", part).split()) for part in parts
+    )
+    return hashlib.sha256("\x1f".join(normalized).encode()).hexdigest()
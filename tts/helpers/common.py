@@ -1,24 +1,348 @@
+import ast
 import configparser
+import logging
+import signal
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import ClassVar, Literal, Mapping, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class ConfigSection:
+    """Immutable section of the configuration, the values are strings."""
+
+    __slots__ = ("_values",)
+
+    def __init__(self, section: Mapping[str, str]):
+        object.__setattr__(self, "_values", MappingProxyType(dict(section)))
+
+    def __getattr__(self, key):
+        """Get a key as an attribute."""
+        try:
+            return self._values[key]
+        except KeyError:
+            raise AttributeError(f"Key '{key}' not found in section.") from None
+
+    def __setattr__(self, key, value):
+        raise AttributeError("Configuration sections are immutable.")
+
+
+@dataclass(frozen=True, slots=True)
+class Settings:
+    """Typed settings of the configuration, validated at load.
+
+    The keys of ``RELOADABLE`` are read on every use and apply to the next
+    requests after a reload, the other keys size the models, caches, pools
+    and threads created at startup and apply after a restart. Without
+    ``warmup_models`` the models scoring the default sentiment type are
+    warmed up.
+    """
+
+    RELOADABLE: ClassVar[frozenset[str]] = frozenset(
+        {
+            "sentiment_type",
+            "rate_limiter",
+            "rate_limit_tiers",
+            "api_key_tiers",
+            "vader_conclusive_threshold",
+            "response_gzip_min_size",
+            "response_gzip_level",
+        }
+    )
+    POSITIVE_INTEGERS: ClassVar[tuple[str, ...]] = (
+        "transformer_max_batch_size",
+        "transformer_bucket_size",
+        "result_cache_ttl",
+        "scoring_workers",
+        "pool_size",
+        "pool_timeout",
+        "channel_message_cache_ttl",
+        "event_workers",
+        "event_queue_size",
+        "event_dedup_ttl",
+        "wsgi_workers",
+        "inference_workers",
+        "inference_max_pending",
+        "event_max_tasks",
+    )
+    NON_NEGATIVE_INTEGERS: ClassVar[tuple[str, ...]] = (
+        "tokenizer_cache_size",
+        "result_cache_size",
+        "max_overflow",
+        "pool_recycle",
+        "statement_timeout",
+        "channel_message_cache_size",
+    )
+
+    SENTIMENT_TYPE_MODELS: ClassVar[Mapping[str, tuple[str, ...]]] = {
+        "vader": ("vader",),
+        "transformer": ("transformer",),
+        "all": ("vader", "transformer"),
+    }
+
+    environment: Literal["production", "testing"]
+    sentiment_type: Literal["vader", "transformer", "all"]
+    web_interface: bool
+    preload_models: tuple[str, ...]
+    warmup_models: tuple[str, ...]
+    warmup_batch_sizes: tuple[int, ...]
+    rate_limiter: tuple[int, int]
+    rate_limit_tiers: Mapping[str, tuple[int, int]]
+    api_key_tiers: Mapping[str, str]
+    transformer_backend: Literal["tensorflow", "onnx"]
+    transformer_batch_window_ms: float
+    transformer_max_batch_size: int
+    transformer_batch_timeout: float
+    transformer_bucket_size: int
+    tokenizer_cache_size: int
+    result_cache_size: int
+    result_cache_ttl: int
+    result_cache_redis: bool
+    vader_conclusive_threshold: Optional[float]
+    scoring_workers: int
+    response_gzip_min_size: Optional[int]
+    response_gzip_level: int
+    pool_size: int
+    max_overflow: int
+    pool_timeout: int
+    pool_recycle: int
+    pool_pre_ping: bool
+    statement_timeout: int
+    channel_message_cache_size: int
+    channel_message_cache_ttl: int
+    channel_message_cache_redis: bool
+    event_workers: int
+    event_queue_size: int
+    event_drop_policy: Literal["drop_newest", "drop_oldest"]
+    event_dedup_ttl: int
+    event_dedup_redis: bool
+    wsgi_workers: int
+    inference_workers: int
+    inference_max_pending: int
+    event_max_tasks: int
+
+    @classmethod
+    def from_sections(cls, sections: Mapping[str, ConfigSection]) -> "Settings":
+        """Parse the settings from the sections of the configuration."""
+        project, database = sections["project"], sections["database"]
+        slack, asgi = sections["slack"], sections["asgi"]
+        return cls(
+            environment=project.environment,
+            sentiment_type=project.sentiment_type,
+            web_interface=bool(ast.literal_eval(project.web_interface)),
+            preload_models=tuple(ast.literal_eval(project.preload_models)),
+            warmup_models=(
+                tuple(ast.literal_eval(project.warmup_models))
+                or cls.SENTIMENT_TYPE_MODELS.get(project.sentiment_type, ())
+            ),
+            warmup_batch_sizes=tuple(
+                ast.literal_eval(project.warmup_batch_sizes)
+            ),
+            rate_limiter=tuple(ast.literal_eval(project.rate_limiter)),
+            rate_limit_tiers=MappingProxyType(
+                {
+                    tier: tuple(limits)
+                    for tier, limits in ast.literal_eval(
+                        project.rate_limit_tiers
+                    ).items()
+                }
+            ),
+            api_key_tiers=MappingProxyType(
+                ast.literal_eval(project.api_key_tiers)
+            ),
+            transformer_backend=project.transformer_backend,
+            transformer_batch_window_ms=float(
+                project.transformer_batch_window_ms
+            ),
+            transformer_max_batch_size=int(project.transformer_max_batch_size),
+            transformer_batch_timeout=float(project.transformer_batch_timeout),
+            transformer_bucket_size=int(project.transformer_bucket_size),
+            tokenizer_cache_size=int(project.tokenizer_cache_size),
+            result_cache_size=int(project.result_cache_size),
+            result_cache_ttl=int(project.result_cache_ttl),
+            result_cache_redis=bool(
+                ast.literal_eval(project.result_cache_redis)
+            ),
+            vader_conclusive_threshold=ast.literal_eval(
+                project.vader_conclusive_threshold
+            ),
+            scoring_workers=int(project.scoring_workers),
+            response_gzip_min_size=ast.literal_eval(
+                project.response_gzip_min_size
+            ),
+            response_gzip_level=int(project.response_gzip_level),
+            pool_size=int(database.pool_size),
+            max_overflow=int(database.max_overflow),
+            pool_timeout=int(database.pool_timeout),
+            pool_recycle=int(database.pool_recycle),
+            pool_pre_ping=bool(ast.literal_eval(database.pool_pre_ping)),
+            statement_timeout=int(database.statement_timeout),
+            channel_message_cache_size=int(database.channel_message_cache_size),
+            channel_message_cache_ttl=int(database.channel_message_cache_ttl),
+            channel_message_cache_redis=bool(
+                ast.literal_eval(database.channel_message_cache_redis)
+            ),
+            event_workers=int(slack.event_workers),
+            event_queue_size=int(slack.event_queue_size),
+            event_drop_policy=slack.event_drop_policy,
+            event_dedup_ttl=int(slack.event_dedup_ttl),
+            event_dedup_redis=bool(ast.literal_eval(slack.event_dedup_redis)),
+            wsgi_workers=int(asgi.wsgi_workers),
+            inference_workers=int(asgi.inference_workers),
+            inference_max_pending=int(asgi.inference_max_pending),
+            event_max_tasks=int(asgi.event_max_tasks),
+        )
+
+    def __post_init__(self):
+        if self.environment not in ("production", "testing"):
+            raise ValueError(f"Invalid environment '{self.environment}'.")
+        if self.sentiment_type not in ("vader", "transformer", "all"):
+            raise ValueError(f"Invalid sentiment type '{self.sentiment_type}'.")
+        for limits in (self.rate_limiter, *self.rate_limit_tiers.values()):
+            if len(limits) != 2 or not all(
+                isinstance(limit, int) and limit > 0 for limit in limits
+            ):
+                raise ValueError(f"Invalid rate limit {limits}.")
+        if not set(self.api_key_tiers.values()) <= set(self.rate_limit_tiers):
+            raise ValueError("Invalid API key rate limit tier.")
+        if not all(
+            isinstance(size, int) and size > 0
+            for size in self.warmup_batch_sizes
+        ):
+            raise ValueError("Invalid warm-up batch size.")
+        if self.transformer_backend not in ("tensorflow", "onnx"):
+            raise ValueError("Invalid transformer backend.")
+        if self.event_drop_policy not in ("drop_newest", "drop_oldest"):
+            raise ValueError(f"Invalid drop policy '{self.event_drop_policy}'.")
+        for name in self.POSITIVE_INTEGERS:
+            if getattr(self, name) <= 0:
+                raise ValueError(f"Invalid {name}, it must be positive.")
+        for name in self.NON_NEGATIVE_INTEGERS:
+            if getattr(self, name) < 0:
+                raise ValueError(f"Invalid {name}, it must not be negative.")
+        if self.transformer_batch_window_ms < 0:
+            raise ValueError("Invalid transformer batch window.")
+        if self.transformer_batch_timeout <= 0:
+            raise ValueError("Invalid transformer batch timeout.")
+        if not (
+            self.vader_conclusive_threshold is None
+            or isinstance(self.vader_conclusive_threshold, (int, float))
+            and self.vader_conclusive_threshold > 0
+        ):
+            raise ValueError("The VADER conclusive threshold must be positive.")
+        if not (
+            self.response_gzip_min_size is None
+            or isinstance(self.response_gzip_min_size, int)
+            and self.response_gzip_min_size >= 0
+        ):
+            raise ValueError("Invalid response gzip minimum size.")
+        if not 0 <= self.response_gzip_level <= 9:
+            raise ValueError("Invalid response gzip level.")
+
+
+@dataclass(frozen=True, slots=True)
+class ConfigSnapshot:
+    """Sections and typed settings parsed from one read of the file."""
+
+    sections: Mapping[str, ConfigSection]
+    settings: Optional[Settings]
+
+    def values(self) -> dict[tuple[str, str], str]:
+        """Return the raw values of the snapshot by section and key."""
+        return {
+            (name, key): value
+            for name, section in self.sections.items()
+            for key, value in section._values.items()
+        }
 
 
 class Config:
-    def __init__(self, file_path: str = "config.ini"):
-        self.config = configparser.ConfigParser()
-        self.config.read(file_path)
+    """Configuration read from the ini file.
+
+    The file is parsed once into an immutable snapshot. ``reload`` replaces
+    the whole snapshot at once, a request reads either the previous or the
+    new configuration, never a mix of both.
+
+    A reload applies to the ``RELOADABLE`` keys of the settings, which are
+    read on every use. The other keys configure the models, caches, pools
+    and threads created at startup, ``reload`` returns the changed ones and
+    they apply after a restart.
+    """
+
+    __slots__ = ("file_path", "settings_class", "snapshot")
+
+    def __init__(
+        self,
+        file_path: str = "config.ini",
+        settings_class: Optional[type[Settings]] = None,
+    ):
+        self.file_path = file_path
+        self.settings_class = settings_class
+        self.snapshot = self.load()
+
+    def load(self) -> ConfigSnapshot:
+        """Parse and validate the file into a new snapshot."""
+        parser = configparser.ConfigParser()
+        parser.read(self.file_path)
+        sections = MappingProxyType(
+            {name: ConfigSection(parser[name]) for name in parser.sections()}
+        )
+        settings = (
+            self.settings_class.from_sections(sections)
+            if self.settings_class
+            else None
+        )
+        return ConfigSnapshot(sections=sections, settings=settings)
+
+    def reload(self) -> list[str]:
+        """Read the file again, an invalid file keeps the current snapshot.
+
+        :returns: (list) The changed keys that apply after a restart only.
+        """
+        snapshot = self.load()
+        reloadable = getattr(self.settings_class, "RELOADABLE", frozenset())
+        previous, current = self.snapshot.values(), snapshot.values()
+        restart_keys = [
+            f"{section}.{key}"
+            for section, key in sorted(previous.keys() | current.keys())
+            if key not in reloadable
+            and previous.get((section, key)) != current.get((section, key))
+        ]
+        self.snapshot = snapshot
+        return restart_keys
+
+    @property
+    def settings(self) -> Optional[Settings]:
+        """Return the typed settings of the current snapshot."""
+        return self.snapshot.settings
 
     def __getattr__(self, section):
         """Get a section as an attribute."""
-        if section in self.config:
-            return ConfigSection(self.config[section])
-        raise AttributeError(f"Section '{section}' not found in configuration.")
+        try:
+            return self.snapshot.sections[section]
+        except KeyError:
+            raise AttributeError(
+                f"Section '{section}' not found in configuration."
+            ) from None
 
 
-class ConfigSection:
-    def __init__(self, section):
-        self.section = section
+def reload_on_signal(config: Config, signum: int = signal.SIGHUP) -> None:
+    """Reload the configuration when the process receives the signal."""
 
-    def __getattr__(self, key):
-        """Get a key as an attribute."""
-        if key in self.section:
-            return self.section[key]
-        raise AttributeError(f"Key '{key}' not found in section.")
+    def reload(signum, frame) -> None:
+        try:
+            restart_keys = config.reload()
+        except Exception:
+            logger.exception(
+                "Configuration reload failed, the current one is kept."
+            )
+        else:
+            logger.info("Configuration reloaded from '%s'.", config.file_path)
+            if restart_keys:
+                logger.warning(
+                    "Changed keys applying after a restart: %s.",
+                    ", ".join(restart_keys),
+                )
+
+    signal.signal(signum, reload)
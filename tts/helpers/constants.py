@@ -23,3 +23,11 @@ class EnvironmentVariables:
     REDIS_HOST = os.environ.get("REDIS_HOST", "redis")
     REDIS_PORT = os.environ.get("REDIS_PORT", 6379)
     REDIS_PASSWORD = os.environ.get("REDIS_PASSWORD")
+    REDIS_MAX_CONNECTIONS = os.environ.get("REDIS_MAX_CONNECTIONS", 20)
+    REDIS_SOCKET_TIMEOUT = os.environ.get("REDIS_SOCKET_TIMEOUT", 2)
+    REDIS_SOCKET_CONNECT_TIMEOUT = os.environ.get(
+        "REDIS_SOCKET_CONNECT_TIMEOUT", 2
+    )
+    REDIS_HEALTH_CHECK_INTERVAL = os.environ.get(
+        "REDIS_HEALTH_CHECK_INTERVAL", 30
+    )
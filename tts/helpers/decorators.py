@@ -2,10 +2,15 @@ from functools import wraps
 from flask import jsonify, request, current_app
 from pydantic import ValidationError
 from slack_sdk.errors import SlackApiError
-from redis.exceptions import ConnectionError as RedisConnectionError
+from redis.exceptions import (
+    ConnectionError as RedisConnectionError,
+    TimeoutError as RedisTimeoutError,
+)
 
-from tts.controllers.slack.http.constants import RESPONSE_ACTION_CLEAR
+from tts.controllers.slack.http.constants import RESPONSE_ACTION_CLEAR_JSON
+from tts.helpers.asgi import AsgiResponse
 from tts.helpers.constants import EnvironmentVariables
+from tts.helpers.responses import json_response
 
 
 def handle_exceptions(func):
@@ -25,6 +30,19 @@ def handle_exceptions(func):
     return wrapper
 
 
+def slack_exception_status(exception: Exception) -> int:
+    """Return the status code of the Slack API response to the exception."""
+    if isinstance(exception, ValidationError):
+        return 422
+    if isinstance(exception, IndexError):
+        return 404
+    if isinstance(exception, SlackApiError):
+        return 503
+    if isinstance(exception, (RedisConnectionError, RedisTimeoutError)):
+        return 504
+    return 500
+
+
 def handle_slack_exceptions(func):
     """Handle exceptions in the Slack API."""
 
@@ -32,16 +50,24 @@ def handle_slack_exceptions(func):
     def wrapper(*args, **kwargs):
         try:
             return func(*args, **kwargs)
-        except ValidationError:
-            return jsonify(RESPONSE_ACTION_CLEAR), 422
-        except IndexError:
-            return jsonify(RESPONSE_ACTION_CLEAR), 404
-        except SlackApiError:
-            return jsonify(RESPONSE_ACTION_CLEAR), 503
-        except RedisConnectionError:
-            return jsonify(RESPONSE_ACTION_CLEAR), 504
-        except Exception:  # noqa
-            return jsonify(RESPONSE_ACTION_CLEAR), 500
+        except Exception as e:  # noqa
+            status = slack_exception_status(e)
+            return json_response(RESPONSE_ACTION_CLEAR_JSON), status
+
+    return wrapper
+
+
+def handle_async_slack_exceptions(func):
+    """Handle exceptions in the async Slack API."""
+
+    @wraps(func)
+    async def wrapper(*args, **kwargs):
+        try:
+            return await func(*args, **kwargs)
+        except Exception as e:  # noqa
+            return AsgiResponse(
+                RESPONSE_ACTION_CLEAR_JSON, slack_exception_status(e)
+            )
 
     return wrapper
 
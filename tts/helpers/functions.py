@@ -1,36 +1,122 @@
-import functools
+import os
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional
 
 from langdetect import detect, LangDetectException
-
-from tts.extensions import config_tts
+from pydantic import ValidationError
+
+from tts.extensions import config_tts, client_redis
+from tts.helpers.batching import MicroBatcher
+from tts.helpers.bundle import model_source, read_manifest
+from tts.helpers.cache import TieredCache, content_key
+from tts.helpers.inference import OnnxBackend, TensorFlowBackend
+from tts.helpers.metrics import MODEL_INFERENCES, stage_timer
+from tts.helpers.registry import LazyModel, ModelRegistry
+from tts.helpers.warmup import ModelWarmup
 from tts.models.sentiment import SentimentRequest
 
 
-def load_models():
-    """Load the sentiment analysis models."""
-    from transformers import (
-        pipeline,
-        TFDistilBertForSequenceClassification,
-        DistilBertTokenizer,
-    )
+TRANSFORMER_MODEL_NAME = (
+    "distilbert/distilbert-base-uncased-finetuned-sst-2-english"  # noqa
+)
+
+
+VADER_LEXICON_PATH = config_tts.project.vader_lexicon_path
+
+
+def load_vader_model():
+    """Load the VADER sentiment analysis model.
+
+    The lexicon compiled by ``download_nltk_data.py`` is memory-mapped, the
+    NLTK lexicon is parsed when it is not compiled.
+    """
+    if os.path.exists(VADER_LEXICON_PATH):
+        from tts.helpers.vader import (
+            CompiledSentimentIntensityAnalyzer,
+            load_lexicon,
+        )
+
+        return CompiledSentimentIntensityAnalyzer(
+            *load_lexicon(VADER_LEXICON_PATH)
+        )
+
     from nltk.sentiment.vader import SentimentIntensityAnalyzer
 
-    vader_analyzer_ = SentimentIntensityAnalyzer()
+    return SentimentIntensityAnalyzer()
+
+
+def load_vader_bulk_model():
+    """Load the VADER model scoring many messages at once."""
+    from tts.helpers.vader import BulkVaderAnalyzer, load_lexicon
+
+    if os.path.exists(VADER_LEXICON_PATH):
+        return BulkVaderAnalyzer(*load_lexicon(VADER_LEXICON_PATH))
+    return BulkVaderAnalyzer.from_lexicon(model_registry.get("vader").lexicon)
 
-    model_name = (
-        "distilbert/distilbert-base-uncased-finetuned-sst-2-english"  # noqa
-    )
-    tokenizer = DistilBertTokenizer.from_pretrained(model_name)
-    model = TFDistilBertForSequenceClassification.from_pretrained(model_name)
-    transformer_sentiment_ = pipeline(
-        "sentiment-analysis", model=model, tokenizer=tokenizer
-    )
 
-    return vader_analyzer_, transformer_sentiment_
+TRANSFORMER_BACKEND = config_tts.settings.transformer_backend
 
 
-vader_analyzer, transformer_sentiment = load_models()
+MODEL_BUNDLE_PATH = config_tts.project.model_bundle_path
+model_bundle_manifest = read_manifest(MODEL_BUNDLE_PATH)
+TRANSFORMER_MODEL_VERSION = (
+    model_bundle_manifest["version"]
+    if model_bundle_manifest
+    else TRANSFORMER_MODEL_NAME
+)
+
+
+def load_transformer_model():
+    """Load the transformer sentiment analysis model on the configured backend.
+
+    The model is loaded from the verified model bundle when it is built.
+    """
+    source = model_source(TRANSFORMER_MODEL_NAME, MODEL_BUNDLE_PATH)
+    options = {
+        "bucket_size": config_tts.settings.transformer_bucket_size,
+        "cache_size": config_tts.settings.tokenizer_cache_size,
+    }
+    if TRANSFORMER_BACKEND == "onnx":
+        return OnnxBackend(
+            source, config_tts.project.onnx_model_path, **options
+        )
+    return TensorFlowBackend(source, **options)
+
+
+model_registry = ModelRegistry(
+    LazyModel("vader", load_vader_model, version="nltk-vader-lexicon"),
+    LazyModel(
+        "vader_bulk", load_vader_bulk_model, version="nltk-vader-lexicon"
+    ),
+    LazyModel(
+        "transformer",
+        load_transformer_model,
+        version=f"{TRANSFORMER_MODEL_VERSION}:{TRANSFORMER_BACKEND}",
+    ),
+)
+
+result_cache = TieredCache(
+    name="sentiment",
+    maxsize=config_tts.settings.result_cache_size,
+    ttl_seconds=config_tts.settings.result_cache_ttl,
+    redis_client=(
+        client_redis if config_tts.settings.result_cache_redis else None
+    ),
+)
+
+
+scoring_executors: dict[int, ThreadPoolExecutor] = {}
+
+
+def get_scoring_executor() -> ThreadPoolExecutor:
+    """Return the executor of the current process for concurrent scoring."""
+    pid = os.getpid()
+    if pid not in scoring_executors:
+        scoring_executors[pid] = ThreadPoolExecutor(
+            max_workers=config_tts.settings.scoring_workers,
+            thread_name_prefix="tts-scoring",
+        )
+    return scoring_executors[pid]
 
 
 def prepare_sentiment_analysis_models(
@@ -38,32 +124,148 @@ def prepare_sentiment_analysis_models(
 ) -> tuple:
     """Prepare the sentiment analysis based on the sentiment type."""
 
-    match sentiment_type_from_request or config_tts.project.sentiment_type:
+    match sentiment_type_from_request or config_tts.settings.sentiment_type:
         case "vader":
-            return vader_analyzer, None
+            return model_registry.get("vader"), None
         case "transformer":
-            return None, transformer_sentiment
+            return None, model_registry.get("transformer")
         case "all":
-            return vader_analyzer, transformer_sentiment
+            return (
+                model_registry.get("vader"),
+                model_registry.get("transformer"),
+            )
         case _:
             raise ValueError("Invalid sentiment type.")
 
 
-@functools.lru_cache(maxsize=5)
+def sentiment_cache_key(sentiment_type_: str, message: str) -> str:
+    """Return the result cache key of the message for the sentiment type."""
+    models = (
+        ("vader", "transformer")
+        if sentiment_type_ == "all"
+        else (sentiment_type_,)
+    )
+    versions = (model_registry.version(model) for model in models)
+    return content_key(message, sentiment_type_, *versions)
+
+
 def get_sentiment_scores(sentiment_type_, message, models):
-    """Get sentiment scores based on the sentiment type."""
+    """Get sentiment scores based on the sentiment type, cached by content."""
+    cache_key = sentiment_cache_key(sentiment_type_, message)
+    scores = result_cache.get(cache_key)
+    if scores is None:
+        scores = score_sentiment(sentiment_type_, message, models)
+        result_cache.set(cache_key, scores)
+    return tuple(scores)
+
+
+def score_sentiment(sentiment_type_, message, models):
+    """Score the message with the models of the sentiment type.
+
+    "all" submits the message to the transformer first and scores it with
+    VADER meanwhile, the transformer result is not waited for when VADER
+    alone settles the message.
+    """
     if sentiment_type_ == "vader":
         sia, _ = models
-        return None, sia.polarity_scores(message)
+        return None, vader_polarity_scores(sia, message)
     elif sentiment_type_ == "transformer":
-        _, transformer_sentiment_ = models
-        transformer_sentiment_scores = transformer_sentiment_(message)
-        return transformer_sentiment_scores[0], None
+        return transformer_batcher.submit(message), None
     else:
-        sia, transformer_sentiment_ = models
-        vader_sentiment_scores = sia.polarity_scores(message)
-        transformer_sentiment_scores = transformer_sentiment_(message)
-        return transformer_sentiment_scores[0], vader_sentiment_scores
+        sia, _ = models
+        transformer_future = get_scoring_executor().submit(
+            transformer_batcher.submit, message
+        )
+        vader_sentiment_scores = vader_polarity_scores(sia, message)
+        if is_vader_conclusive(vader_sentiment_scores):
+            transformer_future.cancel()
+            return None, vader_sentiment_scores
+        return transformer_future.result(), vader_sentiment_scores
+
+
+def vader_polarity_scores(sia, message: str) -> dict:
+    """Score the message with the VADER model."""
+    MODEL_INFERENCES.labels(model="vader").inc()
+    with stage_timer("vader"):
+        return sia.polarity_scores(message)
+
+
+def is_vader_conclusive(vader_scores: dict) -> bool:
+    """Check if the VADER scores alone decide the result of both models.
+
+    Any positive compound score is "definitely not negative" whatever the
+    transformer score is, so the transformer can be skipped. The threshold
+    is read on every call, a reload of the configuration applies it.
+    """
+    threshold = config_tts.settings.vader_conclusive_threshold
+    return threshold is not None and vader_scores["compound"] >= threshold
+
+
+def get_transformer_batch_scores(
+    transformer_sentiment_, messages: list
+) -> list:
+    """Score several messages with a single forward pass of the transformer.
+
+    :param transformer_sentiment_: (TransformerBackend) The transformer model.
+    :param messages: (list) The messages to score.
+    :returns: (list) The ``{"label", "score"}`` scores in the order of messages.
+    """
+    if not messages:
+        return []
+    MODEL_INFERENCES.labels(model="transformer").inc(len(messages))
+    return transformer_sentiment_.score(messages)
+
+
+transformer_batcher = MicroBatcher(
+    score_batch=lambda messages: get_transformer_batch_scores(
+        model_registry.get("transformer"), messages
+    ),
+    window_ms=config_tts.settings.transformer_batch_window_ms,
+    max_batch_size=config_tts.settings.transformer_max_batch_size,
+    timeout=config_tts.settings.transformer_batch_timeout,
+)
+
+
+WARMUP_MESSAGES = (
+    "Great job!",
+    "The meeting ran late and nobody had answers to the questions.",
+    "Thank you for the detailed review of the release plan, the comments "
+    "about the database migration and the rollback steps were really "
+    "helpful, although I am still worried that the deadline is too close "
+    "and that the team will not have enough time to test everything before "
+    "the customers start using the new features next week.",
+)
+
+
+def warm_up_models(names: tuple, batch_sizes: tuple) -> None:
+    """Run representative messages through the models at the batch sizes.
+
+    :param names: (tuple) The names of the models to warm up.
+    :param batch_sizes: (tuple) The number of messages scored at once.
+    """
+    for name in names:
+        model = model_registry.get(name)
+        for batch_size in batch_sizes:
+            messages = [
+                WARMUP_MESSAGES[i % len(WARMUP_MESSAGES)]
+                for i in range(batch_size)
+            ]
+            match name:
+                case "vader":
+                    for message in messages:
+                        model.polarity_scores(message)
+                case "vader_bulk":
+                    model.polarity_scores_batch(messages)
+                case "transformer":
+                    get_transformer_batch_scores(model, messages)
+
+
+model_warmup = ModelWarmup(
+    lambda: warm_up_models(
+        config_tts.settings.warmup_models,
+        config_tts.settings.warmup_batch_sizes,
+    )
+)
 
 
 def determine_sentiment_all_models(
@@ -98,6 +300,26 @@ def determine_sentiment_all_models(
     return "possibly not negative"
 
 
+def determine_sentiment(
+    sentiment_type_: str,
+    transformers_scores: Optional[dict],
+    vader_scores: Optional[dict],
+) -> str:
+    """Determine the final sentiment classification for the sentiment type.
+
+    For "all" without transformer scores, the transformer was skipped on
+    conclusive VADER scores.
+
+    :param sentiment_type_: (str) The sentiment type of the request.
+    :param transformers_scores: (dict) The scores from the transformer model.
+    :param vader_scores: (dict) The scores from the VADER model.
+    :returns: (str) Final sentiment classification.
+    """
+    if sentiment_type_ == "all" and not transformers_scores:
+        return "definitely not negative"
+    return determine_sentiment_all_models(transformers_scores, vader_scores)
+
+
 def determine_sentiment_vader(vader_scores: dict):
     """Determine if the text is genuinely negative based on the VADER sentiment model.
 
@@ -130,24 +352,132 @@ def analyze_sentiment(
 ) -> str:
     """Analyze the sentiment of the given message."""
     data = {
-        "sentiment_type": sentiment_type or config_tts.project.sentiment_type,
+        "sentiment_type": sentiment_type or config_tts.settings.sentiment_type,
         "text": message,
     }
-    sentiment_request = SentimentRequest(**data)
+    with stage_timer("validation"):
+        sentiment_request = SentimentRequest(**data)
 
-    models = prepare_sentiment_analysis_models(sentiment_request.sentiment_type)
+    with stage_timer("model_selection"):
+        models = prepare_sentiment_analysis_models(
+            sentiment_request.sentiment_type
+        )
     transformer_sentiment_score, vader_sentiment_scores = get_sentiment_scores(
         sentiment_type_=sentiment_request.sentiment_type,
         message=sentiment_request.text,
         models=models,
     )
-    sentiment_result = determine_sentiment_all_models(
-        transformers_scores=transformer_sentiment_score,
-        vader_scores=vader_sentiment_scores,
-    )
+    with stage_timer("determine"):
+        sentiment_result = determine_sentiment(
+            sentiment_type_=sentiment_request.sentiment_type,
+            transformers_scores=transformer_sentiment_score,
+            vader_scores=vader_sentiment_scores,
+        )
     return sentiment_result
 
 
+def analyze_sentiment_batch(items: list) -> list:
+    """Analyze the sentiment of several messages in the request order.
+
+    The VADER and the transformer messages of the whole batch are scored
+    together, except the "all" messages with conclusive VADER scores for
+    the transformer.
+
+    :param items: (list) The JSON items of the batch request.
+    :returns: (list) The sentiment result or ``ValidationError`` of each item.
+    """
+    results, sentiment_requests, scores, cache_keys = {}, {}, {}, {}
+    for index, item in enumerate(items):
+        data = (
+            {
+                "sentiment_type": item.get("sentiment_type")
+                or config_tts.settings.sentiment_type,
+                "text": item.get("text"),
+            }
+            if isinstance(item, dict)
+            else item
+        )
+        try:
+            with stage_timer("validation"):
+                sentiment_request = SentimentRequest.model_validate(data)
+        except ValidationError as e:
+            results[index] = e
+            continue
+        sentiment_requests[index] = sentiment_request
+        cache_keys[index] = sentiment_cache_key(
+            sentiment_request.sentiment_type, sentiment_request.text
+        )
+        cached_scores = result_cache.get(cache_keys[index])
+        if cached_scores is not None:
+            scores[index] = cached_scores
+
+    vader_indexes = [
+        index
+        for index, sentiment_request in sentiment_requests.items()
+        if index not in scores
+        and sentiment_request.sentiment_type != "transformer"
+    ]
+    vader_scores = {}
+    if vader_indexes:
+        sia = model_registry.get("vader_bulk")
+        MODEL_INFERENCES.labels(model="vader_bulk").inc(len(vader_indexes))
+        with stage_timer("vader"):
+            vader_scores = dict(
+                zip(
+                    vader_indexes,
+                    sia.polarity_scores_batch(
+                        [
+                            sentiment_requests[index].text
+                            for index in vader_indexes
+                        ]
+                    ),
+                )
+            )
+    transformer_messages = list(
+        dict.fromkeys(
+            sentiment_request.text
+            for index, sentiment_request in sentiment_requests.items()
+            if index not in scores
+            and sentiment_request.sentiment_type != "vader"
+            and not (
+                sentiment_request.sentiment_type == "all"
+                and is_vader_conclusive(vader_scores[index])
+            )
+        )
+    )
+    transformer_scores = {}
+    if transformer_messages:
+        transformer_scores = dict(
+            zip(
+                transformer_messages,
+                get_transformer_batch_scores(
+                    model_registry.get("transformer"), transformer_messages
+                ),
+            )
+        )
+
+    for index, sentiment_request in sentiment_requests.items():
+        if index not in scores:
+            scores[index] = (
+                (
+                    transformer_scores.get(sentiment_request.text)
+                    if sentiment_request.sentiment_type != "vader"
+                    else None
+                ),
+                vader_scores.get(index),
+            )
+            result_cache.set(cache_keys[index], scores[index])
+
+        transformer_sentiment_scores, vader_sentiment_scores = scores[index]
+        with stage_timer("determine"):
+            results[index] = determine_sentiment(
+                sentiment_type_=sentiment_request.sentiment_type,
+                transformers_scores=transformer_sentiment_scores,
+                vader_scores=vader_sentiment_scores,
+            )
+    return [results[index] for index in range(len(items))]
+
+
 def is_negative_sentiment(sentiment_result: str) -> bool:
     """Checks if the sentiment is negative."""
     return "negative" in sentiment_result and "not" not in sentiment_result
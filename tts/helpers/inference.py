@@ -0,0 +1,212 @@
+import math
+import os
+import threading
+
+import numpy as np
+
+from tts.helpers.cache import LRUCache, content_key
+from tts.helpers.metrics import (
+    CACHE_REQUESTS,
+    TRANSFORMER_PADDING_EFFICIENCY,
+    stage_timer,
+)
+
+
+class TransformerBackend:
+    """Transformer sentiment model scoring messages with an inference runtime.
+
+    The backends share the tokenizer and the ``{"label", "score"}`` output,
+    only the forward pass returning the logits differs.
+
+    The messages are truncated at the max sequence length of the model and
+    their token ids are cached by content. A batch is sorted by token length
+    and split into buckets of ``bucket_size`` messages, each bucket is padded
+    to its longest message only.
+    """
+
+    def __init__(
+        self,
+        tokenizer,
+        model_config,
+        bucket_size: int = 8,
+        cache_size: int = 4096,
+    ):
+        self.tokenizer = tokenizer
+        self.id2label = model_config.id2label
+        self.max_length = min(
+            tokenizer.model_max_length, model_config.max_position_embeddings
+        )
+        self.bucket_size = max(bucket_size, 1)
+        self.encodings = LRUCache(maxsize=cache_size, ttl_seconds=math.inf)
+        self._tokenizer_lock = threading.Lock()
+
+    def logits(self, inputs: dict) -> np.ndarray:
+        """Run the forward pass on the tokenized messages."""
+        raise NotImplementedError
+
+    def score(self, messages: list) -> list:
+        """Score several messages with as few padded tokens as possible.
+
+        :param messages: (list) The messages to score.
+        :returns: (list) The ``{"label", "score"}`` scores in the order of messages.
+        """
+        with stage_timer("tokenization"):
+            encodings = self.encode(messages)
+        order = sorted(range(len(messages)), key=lambda i: len(encodings[i]))
+        scores = [None] * len(messages)
+        for start in range(0, len(order), self.bucket_size):
+            bucket = order[start : start + self.bucket_size]
+            inputs = self.pad([encodings[i] for i in bucket])
+            with stage_timer("forward_pass"):
+                logits = self.logits(inputs)
+            exponents = np.exp(logits - logits.max(axis=-1, keepdims=True))
+            probabilities = exponents / exponents.sum(axis=-1, keepdims=True)
+            for i, row in zip(bucket, probabilities):
+                scores[i] = {
+                    "label": self.id2label[int(row.argmax())],
+                    "score": float(row.max()),
+                }
+        return scores
+
+    def encode(self, messages: list) -> list:
+        """Return the token ids of the messages, truncated at the max length."""
+        keys = {message: content_key(message) for message in messages}
+        encodings = {
+            message: self.encodings.get(key) for message, key in keys.items()
+        }
+        missing = [message for message, ids in encodings.items() if ids is None]
+        CACHE_REQUESTS.labels(cache="tokenizer", result="hit").inc(
+            len(encodings) - len(missing)
+        )
+        CACHE_REQUESTS.labels(cache="tokenizer", result="miss").inc(
+            len(missing)
+        )
+        if missing:
+            # the fast tokenizer cannot encode from several threads at once
+            with self._tokenizer_lock:
+                input_ids = self.tokenizer(
+                    missing, truncation=True, max_length=self.max_length
+                )["input_ids"]
+            for message, ids in zip(missing, input_ids):
+                encodings[message] = ids
+                self.encodings.set(keys[message], ids)
+        return [encodings[message] for message in messages]
+
+    def pad(self, encodings: list) -> dict:
+        """Pad the token ids to the longest of them and record the padding."""
+        input_ids = np.full(
+            (len(encodings), max(len(ids) for ids in encodings)),
+            self.tokenizer.pad_token_id,
+            dtype=np.int64,
+        )
+        attention_mask = np.zeros_like(input_ids)
+        for row, ids in enumerate(encodings):
+            input_ids[row, : len(ids)] = ids
+            attention_mask[row, : len(ids)] = 1
+        TRANSFORMER_PADDING_EFFICIENCY.observe(
+            attention_mask.sum() / attention_mask.size
+        )
+        return {"input_ids": input_ids, "attention_mask": attention_mask}
+
+
+class TensorFlowBackend(TransformerBackend):
+    """DistilBERT run by TensorFlow."""
+
+    def __init__(self, source: str, **options):
+        from transformers import (
+            DistilBertTokenizerFast,
+            TFDistilBertForSequenceClassification,
+        )
+
+        self.model = TFDistilBertForSequenceClassification.from_pretrained(
+            source
+        )
+        super().__init__(
+            DistilBertTokenizerFast.from_pretrained(source),
+            self.model.config,
+            **options,
+        )
+
+    def logits(self, inputs: dict) -> np.ndarray:
+        return self.model(
+            input_ids=inputs["input_ids"],
+            attention_mask=inputs["attention_mask"],
+        ).logits.numpy()
+
+
+class OnnxBackend(TransformerBackend):
+    """DistilBERT exported to ONNX and run by ONNX Runtime on the CPU.
+
+    TensorFlow is not imported, the model is exported beforehand by
+    ``export_onnx_model``.
+    """
+
+    def __init__(self, source: str, model_path: str, **options):
+        import onnxruntime
+        from transformers import AutoConfig, DistilBertTokenizerFast
+
+        self.session = onnxruntime.InferenceSession(
+            model_path, providers=["CPUExecutionProvider"]
+        )
+        super().__init__(
+            DistilBertTokenizerFast.from_pretrained(source),
+            AutoConfig.from_pretrained(source),
+            **options,
+        )
+
+    def logits(self, inputs: dict) -> np.ndarray:
+        (logits,) = self.session.run(
+            ["logits"],
+            {
+                "input_ids": inputs["input_ids"].astype(np.int32),
+                "attention_mask": inputs["attention_mask"].astype(np.int32),
+            },
+        )
+        return logits
+
+
+def export_onnx_model(
+    source: str, model_path: str, quantize: bool = True
+) -> None:
+    """Export the TensorFlow model to ONNX for the ``OnnxBackend``.
+
+    :param source: (str) The model bundle directory or the pretrained model name.
+    :param model_path: (str) The path of the exported ONNX model.
+    :param quantize: (bool) Quantize the weights to INT8 dynamically.
+    """
+    import tempfile
+
+    import tensorflow as tf
+    import tf2onnx
+    from onnxruntime.quantization import QuantType, quantize_dynamic
+    from transformers import TFDistilBertForSequenceClassification
+
+    model = TFDistilBertForSequenceClassification.from_pretrained(source)
+    input_signature = (
+        tf.TensorSpec((None, None), tf.int32, name="input_ids"),
+        tf.TensorSpec((None, None), tf.int32, name="attention_mask"),
+    )
+
+    @tf.function(input_signature=input_signature)
+    def forward(input_ids, attention_mask):
+        return {
+            "logits": model(
+                input_ids=input_ids, attention_mask=attention_mask
+            ).logits
+        }
+
+    os.makedirs(os.path.dirname(model_path) or ".", exist_ok=True)
+    if not quantize:
+        tf2onnx.convert.from_function(
+            forward, input_signature, opset=13, output_path=model_path
+        )
+        return
+
+    with tempfile.TemporaryDirectory() as directory:
+        float_model_path = os.path.join(directory, "model.onnx")
+        tf2onnx.convert.from_function(
+            forward, input_signature, opset=13, output_path=float_model_path
+        )
+        quantize_dynamic(
+            float_model_path, model_path, weight_type=QuantType.QInt8
+        )
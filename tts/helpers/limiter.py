@@ -0,0 +1,63 @@
+import hashlib
+from functools import lru_cache
+from typing import Optional
+
+from flask import request
+from flask_limiter.util import get_remote_address
+
+from tts.extensions import config_tts, client_redis
+
+
+def rate_limit(per_minute: int, per_second: int) -> str:
+    """Return the rate limit of the requests per minute and per second."""
+    return f"{per_minute} per minute; {per_second} per second"
+
+
+@lru_cache(maxsize=256)
+def api_key_digest(api_key: str) -> str:
+    """Return the sha256 digest of the API key."""
+    return hashlib.sha256(api_key.encode()).hexdigest()
+
+
+def api_key_tier(api_key: Optional[str]) -> Optional[str]:
+    """Return the rate limit tier of the API key, None for unknown keys."""
+    if not api_key:
+        return None
+    return config_tts.settings.api_key_tiers.get(api_key_digest(api_key))
+
+
+def rate_limit_key() -> str:
+    """Return the identity the request is rate limited by.
+
+    The API keys with a tier share their quota whatever the client address,
+    the other requests are limited by address, so random keys do not get a
+    quota of their own.
+    """
+    api_key = request.headers.get("Authorization")
+    if api_key_tier(api_key):
+        return f"api_key:{api_key_digest(api_key)[:16]}"
+    return get_remote_address()
+
+
+def rate_limit_value() -> str:
+    """Return the rate limit of the tier of the request API key.
+
+    The limits are read from the current configuration, a reload applies
+    them to the next requests.
+    """
+    settings = config_tts.settings
+    tier = api_key_tier(request.headers.get("Authorization"))
+    return rate_limit(
+        *(settings.rate_limit_tiers[tier] if tier else settings.rate_limiter)
+    )
+
+
+def limiter_storage_options(storage_uri: str) -> dict:
+    """Return the options of the rate limiter storage.
+
+    The Redis storage uses the connection pool of the service, the limits
+    are shared by all the workers and replicas.
+    """
+    if storage_uri.startswith("redis"):
+        return {"connection_pool": client_redis.get_pool()}
+    return {}
@@ -0,0 +1,159 @@
+from typing import final
+
+from prometheus_client import Counter, Gauge, Histogram
+
+
+TRANSFORMER_QUEUE_DEPTH: final = Gauge(
+    "tts_transformer_queue_depth",
+    "Transformer requests waiting for the micro-batching scheduler.",
+    multiprocess_mode="livesum",
+)
+TRANSFORMER_BATCH_SIZE: final = Histogram(
+    "tts_transformer_batch_size",
+    "Number of messages scored in one transformer forward pass.",
+    buckets=(1, 2, 4, 8, 16, 32, 64),
+)
+TRANSFORMER_PADDING_EFFICIENCY: final = Histogram(
+    "tts_transformer_padding_efficiency",
+    "Share of real tokens in the padded inputs of a transformer forward pass.",
+    buckets=(0.25, 0.5, 0.6, 0.7, 0.8, 0.9, 0.95, 1.0),
+)
+CACHE_REQUESTS: final = Counter(
+    "tts_cache_requests",
+    "Cache lookups by cache name and result.",
+    ["cache", "result"],
+)
+DB_POOL_CHECKOUT_SECONDS: final = Histogram(
+    "tts_db_pool_checkout_seconds",
+    "Time to check out a connection from the database pool.",
+    buckets=(0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1, 5, 10),
+)
+DB_POOL_OVERFLOW_CONNECTIONS: final = Counter(
+    "tts_db_pool_overflow_connections",
+    "Connections opened beyond the database pool size.",
+)
+DB_POOL_CHECKED_OUT: final = Gauge(
+    "tts_db_pool_checked_out",
+    "Database connections currently checked out of the pool.",
+    multiprocess_mode="livesum",
+)
+DB_POOL_CONNECTIONS_CREATED: final = Counter(
+    "tts_db_pool_connections_created",
+    "Connections opened by the database pool.",
+)
+REDIS_POOL_CHECKOUTS: final = Counter(
+    "tts_redis_pool_checkouts",
+    "Connections checked out of the Redis pool.",
+)
+REDIS_POOL_CONNECTIONS_CREATED: final = Counter(
+    "tts_redis_pool_connections_created",
+    "Connections opened by the Redis pool, the other checkouts reuse one.",
+)
+BACKGROUND_QUEUE_DEPTH: final = Gauge(
+    "tts_background_queue_depth",
+    "Tasks waiting in the background executor queue.",
+    ["executor"],
+    multiprocess_mode="livesum",
+)
+BACKGROUND_TASKS_DROPPED: final = Counter(
+    "tts_background_tasks_dropped",
+    "Tasks dropped because the background executor queue was full.",
+    ["executor"],
+)
+BACKGROUND_TASK_ERRORS: final = Counter(
+    "tts_background_task_errors",
+    "Background tasks that raised an exception.",
+    ["executor"],
+)
+LATENCY_BUCKETS: final = (
+    0.00005,
+    0.0001,
+    0.00025,
+    0.0005,
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1,
+    2.5,
+    5,
+)
+HTTP_REQUESTS: final = Counter(
+    "tts_http_requests",
+    "HTTP requests by route, method and status code.",
+    ["route", "method", "status"],
+)
+HTTP_REQUEST_SECONDS: final = Histogram(
+    "tts_http_request_seconds",
+    "Time to handle an HTTP request by route and method.",
+    ["route", "method"],
+    buckets=LATENCY_BUCKETS,
+)
+RATE_LIMITED_REQUESTS: final = Counter(
+    "tts_rate_limited_requests",
+    "Requests rejected by the rate limiter by route and limit.",
+    ["route", "limit"],
+)
+RATE_LIMIT_DECISION_SECONDS: final = Histogram(
+    "tts_rate_limit_decision_seconds",
+    "Time for the rate limiter to allow or reject a request.",
+    ["result"],
+    buckets=LATENCY_BUCKETS,
+)
+ATTACK_VECTOR_HITS: final = Counter(
+    "tts_attack_vector_hits",
+    "Requests rejected for an attack vector path by deny-list prefix.",
+    ["pattern"],
+)
+MODEL_INFERENCES: final = Counter(
+    "tts_model_inferences",
+    "Messages scored by the sentiment models by model.",
+    ["model"],
+)
+PIPELINE_STAGE_SECONDS: final = Histogram(
+    "tts_pipeline_stage_seconds",
+    "Time spent in a stage of the sentiment analysis pipeline.",
+    ["stage"],
+    buckets=LATENCY_BUCKETS,
+)
+EXTERNAL_CALL_SECONDS: final = Histogram(
+    "tts_external_call_seconds",
+    "Time spent in a call to Slack, Postgres or Redis by operation.",
+    ["service", "operation"],
+    buckets=LATENCY_BUCKETS,
+)
+PIPELINE_STAGES: final = {
+    stage: PIPELINE_STAGE_SECONDS.labels(stage=stage)
+    for stage in (
+        "validation",
+        "model_selection",
+        "vader",
+        "tokenization",
+        "forward_pass",
+        "determine",
+    )
+}
+
+
+def stage_timer(stage: str):
+    """Time a stage of the sentiment analysis pipeline.
+
+    The histograms of the stages are bound once, timing a stage is a
+    dictionary lookup and two clock reads.
+
+    :param stage: (str) The name of the stage in ``PIPELINE_STAGES``.
+    :returns: The context manager observing the duration of the stage.
+    """
+    return PIPELINE_STAGES[stage].time()
+
+
+def external_call_timer(service: str, operation: str):
+    """Time a call to an external service."""
+    return EXTERNAL_CALL_SECONDS.labels(
+        service=service, operation=operation
+    ).time()
@@ -0,0 +1,71 @@
+import threading
+import time
+from typing import Callable, Iterable, Optional
+
+
+class LazyModel:
+    """Sentiment analysis model loaded on first use."""
+
+    NOT_LOADED = "not loaded"
+    LOADING = "loading"
+    LOADED = "loaded"
+    FAILED = "failed"
+
+    def __init__(self, name: str, loader: Callable[[], any], version: str):
+        self.name = name
+        self.loader = loader
+        self.version = version
+        self.state = self.NOT_LOADED
+        self.load_seconds: Optional[float] = None
+        self._model = None
+        self._lock = threading.Lock()
+
+    def get(self) -> any:
+        """Return the model, loading it on the first call."""
+        if self._model is None:
+            with self._lock:
+                if self._model is None:
+                    self._load()
+        return self._model
+
+    def _load(self) -> None:
+        """Run the loader and record the load state."""
+        self.state = self.LOADING
+        start = time.perf_counter()
+        try:
+            self._model = self.loader()
+        except Exception:
+            self.state = self.FAILED
+            raise
+        self.load_seconds = round(time.perf_counter() - start, 3)
+        self.state = self.LOADED
+
+
+class ModelRegistry:
+    """Registry of the lazily loaded sentiment analysis models."""
+
+    def __init__(self, *models: LazyModel):
+        self._models = {model.name: model for model in models}
+
+    def get(self, name: str) -> any:
+        """Return the model by name, loading it if needed."""
+        if name not in self._models:
+            raise ValueError(f"Unknown model '{name}'.")
+        return self._models[name].get()
+
+    def preload(self, names: Iterable[str]) -> None:
+        """Load the given models ahead of the first request."""
+        for name in names:
+            self.get(name)
+
+    def version(self, name: str) -> str:
+        """Return the version of the model by name."""
+        return self._models[name].version
+
+    def versions(self) -> dict[str, str]:
+        """Return the version of each model."""
+        return {name: model.version for name, model in self._models.items()}
+
+    def states(self) -> dict[str, str]:
+        """Return the load state of each model."""
+        return {name: model.state for name, model in self._models.items()}
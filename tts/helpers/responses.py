@@ -0,0 +1,81 @@
+import decimal
+import gzip
+from typing import final
+
+import orjson
+from flask import Response, request
+from flask.json.provider import JSONProvider
+from pydantic import BaseModel
+
+from tts.extensions import config_tts
+
+JSON_MIMETYPE: final = "application/json"
+
+
+def default(obj: any) -> any:
+    """Serialize the objects orjson does not support natively."""
+    if isinstance(obj, BaseModel):
+        return obj.model_dump(mode="json")
+    if isinstance(obj, decimal.Decimal):
+        return str(obj)
+    if hasattr(obj, "__html__"):
+        return str(obj.__html__())
+    raise TypeError(f"Object of type {type(obj).__name__} is not serializable.")
+
+
+def dumps(obj: any) -> bytes:
+    """Serialize the object to JSON bytes."""
+    return orjson.dumps(obj, default=default)
+
+
+class OrjsonProvider(JSONProvider):
+    """JSON provider of the application, ``jsonify`` serializes with orjson."""
+
+    def dumps(self, obj: any, **kwargs) -> str:
+        return dumps(obj).decode()
+
+    def loads(self, s: str | bytes, **kwargs) -> any:
+        return orjson.loads(s)
+
+    def response(self, *args, **kwargs) -> Response:
+        return json_response(dumps(self._prepare_response_obj(args, kwargs)))
+
+
+def json_response(body: bytes, status: int = 200) -> Response:
+    """Return the response of the serialized JSON body.
+
+    The static bodies are serialized once and shared by the responses.
+    """
+    return Response(body, status=status, mimetype=JSON_MIMETYPE)
+
+
+def model_response(
+    model: BaseModel, status: int = 200, compress: bool = False
+) -> Response:
+    """Return the JSON response of the pydantic model.
+
+    :param model: (BaseModel) The response model.
+    :param status: (int) The status code of the response.
+    :param compress: (bool) Compress the body for the clients accepting gzip.
+    """
+    response = json_response(dumps(model.model_dump()), status)
+    return gzip_response(response) if compress else response
+
+
+def gzip_response(response: Response) -> Response:
+    """Compress the body from ``response_gzip_min_size`` bytes with gzip."""
+    settings = config_tts.settings
+    if (
+        settings.response_gzip_min_size is None
+        or response.content_length < settings.response_gzip_min_size
+        or not request.accept_encodings["gzip"]
+    ):
+        return response
+    response.set_data(
+        gzip.compress(
+            response.get_data(), compresslevel=settings.response_gzip_level
+        )
+    )
+    response.headers["Content-Encoding"] = "gzip"
+    response.vary.add("Accept-Encoding")
+    return response
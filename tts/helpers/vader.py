@@ -0,0 +1,488 @@
+import math
+import mmap
+import os
+import string
+import struct
+from collections.abc import Mapping
+
+import numpy as np
+from nltk.sentiment.vader import SentimentIntensityAnalyzer, VaderConstants
+
+LEXICON_MAGIC = b"VADERLX2"
+LEXICON_HEADER = struct.Struct("<8sQQ")
+PUNCTUATION = set(VaderConstants.PUNC_LIST)
+IDIOM_WORDS = {
+    word
+    for phrase in (
+        *VaderConstants.SPECIAL_CASE_IDIOMS,
+        *VaderConstants.BOOSTER_DICT,
+    )
+    if " " in phrase
+    for word in phrase.split()
+}
+CONTEXT_WORDS = (
+    "at",
+    "but",
+    "kind",
+    "least",
+    "never",
+    "of",
+    "so",
+    "this",
+    "very",
+)
+
+
+class BulkVaderAnalyzer:
+    """VADER sentiment analysis of many texts at once with NumPy.
+
+    The texts are tokenized like ``SentimentIntensityAnalyzer`` and the
+    valences of all their tokens are looked up in an array indexed by the
+    word id, then the booster, negation, "least", "but" and punctuation
+    rules are applied to all tokens together. The scores match
+    ``SentimentIntensityAnalyzer.polarity_scores``.
+
+    The valences are indexed in place, the memory-mapped array of
+    ``load_lexicon`` stays the backing store.
+    """
+
+    def __init__(self, words: list, valences: np.ndarray):
+        """
+        :param words: (list) The sorted words of the lexicon.
+        :param valences: (np.ndarray) The valence of each word followed by
+            the NaN sentinel of the words out of the lexicon.
+        """
+        constants = VaderConstants()
+        extra_words = sorted(
+            {
+                *constants.BOOSTER_DICT,
+                *constants.NEGATE,
+                *CONTEXT_WORDS,
+                *IDIOM_WORDS,
+            }
+            - set(words)
+        )
+        self.words = [*words, *extra_words]
+        self.index = {word: i for i, word in enumerate(self.words)}
+        # the last id is the unknown word
+        self.unknown = len(self.words)
+        # the ids out of the lexicon are looked up in the sentinel slot
+        self.sentinel = len(words)
+        self.valences = valences
+        self.boosters = np.zeros(self.unknown + 1)
+        for word, scalar in constants.BOOSTER_DICT.items():
+            self.boosters[self.index[word]] = scalar
+        self.idiom_words = np.zeros(self.unknown + 1, dtype=bool)
+        for word in IDIOM_WORDS:
+            self.idiom_words[self.index[word]] = True
+        self.ids = {word: self.index[word] for word in CONTEXT_WORDS}
+        self.constants = constants
+
+    @classmethod
+    def from_lexicon(cls, lexicon: dict) -> "BulkVaderAnalyzer":
+        """Create the analyzer from the ``{word: valence}`` lexicon."""
+        words = sorted(lexicon)
+        return cls(
+            words, np.array([*(lexicon[word] for word in words), np.nan])
+        )
+
+    def polarity_scores(self, text: str) -> dict:
+        """Return the VADER scores of the text."""
+        return self.polarity_scores_batch([text])[0]
+
+    def polarity_scores_batch(self, texts: list) -> list:
+        """Return the VADER scores of the texts in their order.
+
+        :param texts: (list) The texts to score.
+        :returns: (list) The ``neg``, ``neu``, ``pos`` and ``compound`` scores.
+        """
+        tokens = self._tokenize(texts)
+        sentiments = self._sentiments(tokens)
+        return self._score_valences(texts, tokens, sentiments)
+
+    def _tokenize(self, texts: list) -> dict:
+        """Split the texts into words and gather the features of each word."""
+        words, offsets = [], [0]
+        lower_ids, raw_ids, upper, negated = [], [], [], []
+        positions, text_ids, first, cap_diff = [], [], [], []
+        for text_id, text in enumerate(texts):
+            text_words = self._words_and_emoticons(text)
+            offset = len(words)
+            first_positions = {}
+            allcap_words = 0
+            for position, word in enumerate(text_words):
+                lower = word.lower()
+                lower_ids.append(self.index.get(lower, self.unknown))
+                raw_ids.append(self.index.get(word, self.unknown))
+                is_upper = word.isupper()
+                allcap_words += is_upper
+                upper.append(is_upper)
+                negated.append(lower in self.constants.NEGATE or "n't" in lower)
+                positions.append(position)
+                first.append(
+                    offset + first_positions.setdefault(word, position)
+                )
+            words.extend(text_words)
+            offsets.append(len(words))
+            text_ids.extend([text_id] * len(text_words))
+            cap_diff.extend(
+                [0 < len(text_words) - allcap_words < len(text_words)]
+                * len(text_words)
+            )
+        return {
+            "words": words,
+            "offsets": offsets,
+            "lower_ids": np.array(lower_ids, dtype=np.intp),
+            "raw_ids": np.array(raw_ids, dtype=np.intp),
+            "upper": np.array(upper, dtype=bool),
+            "negated": np.array(negated, dtype=bool),
+            "positions": np.array(positions, dtype=np.intp),
+            "text_ids": np.array(text_ids, dtype=np.intp),
+            "first": np.array(first, dtype=np.intp),
+            "cap_diff": np.array(cap_diff, dtype=bool),
+        }
+
+    @staticmethod
+    def _words_and_emoticons(text: str) -> list:
+        """Split the text into words without their leading or trailing punctuation."""
+        words_only = {
+            word
+            for word in VaderConstants.REGEX_REMOVE_PUNCTUATION.sub(
+                "", text
+            ).split()
+            if len(word) > 1
+        }
+        words = []
+        for word in text.split():
+            if len(word) <= 1:
+                continue
+            stripped = word.rstrip(string.punctuation)
+            if word[len(stripped) :] in PUNCTUATION and stripped in words_only:
+                word = stripped
+            else:
+                stripped = word.lstrip(string.punctuation)
+                if (
+                    word[: len(word) - len(stripped)] in PUNCTUATION
+                    and stripped in words_only
+                ):
+                    word = stripped
+            words.append(word)
+        return words
+
+    def _sentiments(self, tokens: dict) -> np.ndarray:
+        """Compute the valence of every word of the texts."""
+        constants = self.constants
+        lower_ids, raw_ids = tokens["lower_ids"], tokens["raw_ids"]
+        positions, upper = tokens["positions"], tokens["upper"]
+        negated, cap_diff = tokens["negated"], tokens["cap_diff"]
+        ids = self.ids
+        count = len(lower_ids)
+
+        def previous(values: np.ndarray, distance: int, fill) -> np.ndarray:
+            """Return the values of the words ``distance`` words before."""
+            shifted = np.full(count, fill, dtype=values.dtype)
+            shifted[distance:] = values[: count - distance]
+            return shifted
+
+        def following(values: np.ndarray, distance: int, fill) -> np.ndarray:
+            """Return the values of the words ``distance`` words after."""
+            shifted = np.full(count, fill, dtype=values.dtype)
+            shifted[: count - distance] = values[distance:]
+            return shifted
+
+        lexicon_valences = self.valences[np.minimum(lower_ids, self.sentinel)]
+        in_lexicon = ~np.isnan(lexicon_valences)
+        valences = np.where(in_lexicon, lexicon_valences, 0.0)
+        upper_cap_diff = upper & cap_diff
+        valences = np.where(
+            upper_cap_diff,
+            np.where(
+                valences > 0,
+                valences + constants.C_INCR,
+                valences - constants.C_INCR,
+            ),
+            valences,
+        )
+
+        so_or_this = (raw_ids == ids["so"]) | (raw_ids == ids["this"])
+        never = raw_ids == ids["never"]
+        for distance, dampening in ((1, 1.0), (2, 0.95), (3, 0.9)):
+            applies = (positions >= distance) & ~previous(
+                in_lexicon, distance, True
+            )
+            boosters = previous(self.boosters[lower_ids], distance, 0.0)
+            scalars = np.where(valences < 0, -boosters, boosters)
+            scalars = np.where(
+                (boosters != 0) & previous(upper_cap_diff, distance, False),
+                np.where(
+                    valences > 0,
+                    scalars + constants.C_INCR,
+                    scalars - constants.C_INCR,
+                ),
+                scalars,
+            )
+            if distance > 1:
+                scalars = np.where(scalars != 0, scalars * dampening, scalars)
+            boosted = valences + scalars
+
+            previous_negated = previous(negated, distance, False)
+            if distance == 1:
+                boosted = np.where(
+                    previous_negated, boosted * constants.N_SCALAR, boosted
+                )
+            elif distance == 2:
+                boosted = np.where(
+                    previous(never, 2, False) & previous(so_or_this, 1, False),
+                    boosted * 1.5,
+                    np.where(
+                        previous_negated,
+                        boosted * constants.N_SCALAR,
+                        boosted,
+                    ),
+                )
+            else:
+                boosted = np.where(
+                    previous(never, 3, False) & previous(so_or_this, 2, False)
+                    | previous(so_or_this, 1, False),
+                    boosted * 1.25,
+                    np.where(
+                        previous_negated,
+                        boosted * constants.N_SCALAR,
+                        boosted,
+                    ),
+                )
+                boosted = self._idioms_check(
+                    boosted, tokens, applies & in_lexicon
+                )
+            valences = np.where(applies, boosted, valences)
+
+        previous_least = (
+            (positions >= 1)
+            & ~previous(in_lexicon, 1, True)
+            & (previous(lower_ids, 1, self.unknown) == ids["least"])
+        )
+        before_least = previous(lower_ids, 2, self.unknown)
+        valences = np.where(
+            previous_least
+            & (
+                (positions == 1)
+                | ((before_least != ids["at"]) & (before_least != ids["very"]))
+            ),
+            valences * constants.N_SCALAR,
+            valences,
+        )
+
+        next_of = (following(lower_ids, 1, self.unknown) == ids["of"]) & (
+            following(positions, 1, 0) > positions
+        )
+        skipped = (self.boosters[lower_ids] != 0) | (
+            (lower_ids == ids["kind"]) & next_of
+        )
+        valences = np.where(in_lexicon & ~skipped, valences, 0.0)
+        return self._but_check(tokens, valences[tokens["first"]])
+
+    def _idioms_check(
+        self, valences: np.ndarray, tokens: dict, applies: np.ndarray
+    ) -> np.ndarray:
+        """Apply the idioms and the booster bi-grams around the words."""
+        idiom_words = self.idiom_words[tokens["raw_ids"]]
+        if not idiom_words.any():
+            return valences
+        valences = valences.copy()
+        words, offsets = tokens["words"], tokens["offsets"]
+        for index in np.flatnonzero(applies):
+            text_id = tokens["text_ids"][index]
+            start, end = offsets[text_id], offsets[text_id + 1]
+            if not idiom_words[start:end].any():
+                continue
+            valences[index] = self._idiom_valence(
+                valences[index], words[start:end], int(index - start)
+            )
+        return valences
+
+    def _idiom_valence(self, valence: float, words: list, i: int) -> float:
+        """Return the valence of the word changed by the idioms around it."""
+        idioms = self.constants.SPECIAL_CASE_IDIOMS
+        onezero = f"{words[i - 1]} {words[i]}"
+        twoonezero = f"{words[i - 2]} {words[i - 1]} {words[i]}"
+        twoone = f"{words[i - 2]} {words[i - 1]}"
+        threetwoone = f"{words[i - 3]} {words[i - 2]} {words[i - 1]}"
+        threetwo = f"{words[i - 3]} {words[i - 2]}"
+        for sequence in (onezero, twoonezero, twoone, threetwoone, threetwo):
+            if sequence in idioms:
+                valence = idioms[sequence]
+                break
+        if len(words) - 1 > i:
+            zeroone = f"{words[i]} {words[i + 1]}"
+            if zeroone in idioms:
+                valence = idioms[zeroone]
+        if len(words) - 1 > i + 1:
+            zeroonetwo = f"{words[i]} {words[i + 1]} {words[i + 2]}"
+            if zeroonetwo in idioms:
+                valence = idioms[zeroonetwo]
+        if (
+            threetwo in self.constants.BOOSTER_DICT
+            or twoone in self.constants.BOOSTER_DICT
+        ):
+            valence = valence + self.constants.B_DECR
+        return valence
+
+    def _but_check(self, tokens: dict, sentiments: np.ndarray) -> np.ndarray:
+        """Dampen the words before the first "but" and emphasize the words after it."""
+        buts = tokens["lower_ids"] == self.ids["but"]
+        if not buts.any():
+            return sentiments
+        text_ids, positions = tokens["text_ids"], tokens["positions"]
+        first_buts = np.full(text_ids.max() + 1, np.iinfo(np.intp).max)
+        np.minimum.at(first_buts, text_ids[buts], positions[buts])
+        first_but = first_buts[text_ids]
+        has_but = first_but != np.iinfo(np.intp).max
+        return np.where(
+            has_but & (positions < first_but),
+            sentiments * 0.5,
+            np.where(
+                has_but & (positions > first_but), sentiments * 1.5, sentiments
+            ),
+        )
+
+    def _score_valences(
+        self, texts: list, tokens: dict, sentiments: np.ndarray
+    ) -> list:
+        """Combine the valences of the words into the scores of each text."""
+        text_ids, count = tokens["text_ids"], len(texts)
+        words = np.bincount(text_ids, minlength=count)
+        sums = np.bincount(text_ids, weights=sentiments, minlength=count)
+        positive = np.bincount(
+            text_ids,
+            weights=np.where(sentiments > 0, sentiments + 1, 0.0),
+            minlength=count,
+        )
+        negative = np.bincount(
+            text_ids,
+            weights=np.where(sentiments < 0, sentiments - 1, 0.0),
+            minlength=count,
+        )
+        neutral = np.bincount(
+            text_ids, weights=sentiments == 0, minlength=count
+        )
+
+        scores = []
+        for text, word_count, sum_s, pos_sum, neg_sum, neu_count in zip(
+            texts, words, sums, positive, negative, neutral
+        ):
+            if not word_count:
+                scores.append(
+                    {"neg": 0.0, "neu": 0.0, "pos": 0.0, "compound": 0.0}
+                )
+                continue
+            sum_s, pos_sum, neg_sum = (
+                float(sum_s),
+                float(pos_sum),
+                float(neg_sum),
+            )
+            amplifier = min(text.count("!"), 4) * 0.292
+            question_marks = text.count("?")
+            if question_marks > 1:
+                amplifier += (
+                    question_marks * 0.18 if question_marks <= 3 else 0.96
+                )
+            if sum_s > 0:
+                sum_s += amplifier
+            elif sum_s < 0:
+                sum_s -= amplifier
+            compound = sum_s / math.sqrt(sum_s * sum_s + 15)
+
+            if pos_sum > math.fabs(neg_sum):
+                pos_sum += amplifier
+            elif pos_sum < math.fabs(neg_sum):
+                neg_sum -= amplifier
+            total = pos_sum + math.fabs(neg_sum) + neu_count
+            scores.append(
+                {
+                    "neg": round(math.fabs(neg_sum / total), 3),
+                    "neu": round(math.fabs(neu_count / total), 3),
+                    "pos": round(math.fabs(pos_sum / total), 3),
+                    "compound": round(compound, 4),
+                }
+            )
+        return scores
+
+
+class MappedLexicon(Mapping):
+    """Read-only ``{word: valence}`` view of the compiled lexicon.
+
+    The valences are read from the memory-mapped array, only the index of
+    the words is built in the process.
+    """
+
+    def __init__(self, words: list, valences: np.ndarray):
+        self.index = {word: i for i, word in enumerate(words)}
+        self.valences = valences
+
+    def __getitem__(self, word: str) -> float:
+        return self.valences.item(self.index[word])
+
+    def __contains__(self, word: object) -> bool:
+        return word in self.index
+
+    def __iter__(self):
+        return iter(self.index)
+
+    def __len__(self) -> int:
+        return len(self.index)
+
+
+class CompiledSentimentIntensityAnalyzer(SentimentIntensityAnalyzer):
+    """VADER sentiment analysis with the lexicon of ``compile_lexicon``."""
+
+    def __init__(self, words: list, valences: np.ndarray):
+        self.lexicon = MappedLexicon(words, valences)
+        self.constants = VaderConstants()
+
+
+def compile_lexicon(lexicon: dict, path: str) -> None:
+    """Write the lexicon as sorted words and a valence array for ``load_lexicon``.
+
+    The file holds a header with the number of words and the size of the
+    words, the float64 valences followed by a NaN sentinel, then the UTF-8
+    words separated by new lines.
+
+    :param lexicon: (dict) The ``{word: valence}`` lexicon.
+    :param path: (str) The path of the compiled lexicon.
+    """
+    words = sorted(lexicon)
+    encoded_words = "\n".join(words).encode()
+    valences = np.array(
+        [*(lexicon[word] for word in words), np.nan], dtype="<f8"
+    )
+    temporary_path = f"{path}.tmp"
+    with open(temporary_path, "wb") as file:
+        file.write(
+            LEXICON_HEADER.pack(LEXICON_MAGIC, len(words), len(encoded_words))
+        )
+        file.write(valences.tobytes())
+        file.write(encoded_words)
+    os.replace(temporary_path, path)
+
+
+def load_lexicon(path: str) -> tuple[list, np.ndarray]:
+    """Memory-map the lexicon compiled by ``compile_lexicon``.
+
+    The valences are read from the pages of the file, shared by all the
+    processes mapping it.
+
+    :param path: (str) The path of the compiled lexicon.
+    :returns: (tuple) The sorted words and their valences followed by the
+        NaN sentinel.
+    """
+    with open(path, "rb") as file:
+        buffer = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+    magic, count, size = LEXICON_HEADER.unpack_from(buffer)
+    if magic != LEXICON_MAGIC:
+        raise ValueError(f"Invalid compiled VADER lexicon '{path}'.")
+    valences = np.frombuffer(
+        buffer, dtype="<f8", count=count + 1, offset=LEXICON_HEADER.size
+    )
+    start = LEXICON_HEADER.size + valences.nbytes
+    words = buffer[start : start + size].decode().split("\n")
+    return words, valences
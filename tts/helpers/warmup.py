@@ -0,0 +1,54 @@
+import logging
+import threading
+import time
+from typing import Callable, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class ModelWarmup:
+    """Warm-up of the sentiment analysis models before serving traffic.
+
+    The warm-up runs once, either in the calling thread or in a background
+    thread, and the service reports ready once it completes.
+    """
+
+    PENDING = "pending"
+    RUNNING = "running"
+    READY = "ready"
+    FAILED = "failed"
+
+    def __init__(self, warm_up: Callable[[], None]):
+        self.warm_up = warm_up
+        self.state = self.PENDING
+        self.seconds: Optional[float] = None
+        self._lock = threading.Lock()
+
+    @property
+    def ready(self) -> bool:
+        """Check if the warm-up completed."""
+        return self.state == self.READY
+
+    def run(self) -> None:
+        """Warm up the models in the calling thread, unless already started."""
+        with self._lock:
+            if self.state != self.PENDING:
+                return
+            self.state = self.RUNNING
+        start = time.perf_counter()
+        try:
+            self.warm_up()
+        except Exception:
+            logger.exception("Model warm-up failed.")
+            self.state = self.FAILED
+            return
+        self.seconds = round(time.perf_counter() - start, 3)
+        self.state = self.READY
+
+    def start(self) -> threading.Thread:
+        """Warm up the models in a background thread."""
+        thread = threading.Thread(
+            target=self.run, name="tts-warmup", daemon=True
+        )
+        thread.start()
+        return thread
@@ -1,13 +1,34 @@
+import asyncio
+import threading
+import time
 import uuid
 
 from cryptography.fernet import Fernet
 from pydantic import BaseModel, constr
 from sqlalchemy.dialects.postgresql import UUID, BYTEA
-from sqlalchemy import create_engine, Column, String, TIMESTAMP, func
+from sqlalchemy import (
+    create_engine,
+    event,
+    select,
+    Column,
+    String,
+    TIMESTAMP,
+    func,
+)
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
 from sqlalchemy.orm import sessionmaker, declarative_base, scoped_session
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
 
-from tts.extensions import config_tts, configurations
+from tts.extensions import config_tts, configurations, client_redis
+from tts.helpers.cache import TieredCache
 from tts.helpers.constants import EnvironmentVariables
+from tts.helpers.metrics import (
+    DB_POOL_CHECKED_OUT,
+    DB_POOL_CHECKOUT_SECONDS,
+    DB_POOL_CONNECTIONS_CREATED,
+    DB_POOL_OVERFLOW_CONNECTIONS,
+    EXTERNAL_CALL_SECONDS,
+)
 
 Base = declarative_base()
 
@@ -21,19 +42,131 @@ class PostgresDatabaseConfig:
     host = EnvironmentVariables.POSTGRES_HOST
 
     @classmethod
-    def get_database_url(cls):
+    def get_database_url(cls, driver: str = "psycopg2"):
         """Return the database full URL."""
         return (
-            f"postgresql+psycopg2://{cls.user}:{cls.password}@{cls.host}/{cls.db}"
+            f"postgresql+{driver}://{cls.user}:{cls.password}@{cls.host}/{cls.db}"
         )
 
 
+class InstrumentedQueuePool(QueuePool):
+    """Queue pool reporting the checkout latency and the connections.
+
+    The checked out connections are counted on checkout and checkin rather
+    than read from the pool, so they add up across the gunicorn workers.
+    """
+
+    def _do_get(self):
+        overflow = self.overflow()
+        start = time.perf_counter()
+        try:
+            connection = super()._do_get()
+            DB_POOL_CHECKED_OUT.inc()
+            return connection
+        finally:
+            DB_POOL_CHECKOUT_SECONDS.observe(time.perf_counter() - start)
+            if self.overflow() > max(overflow, 0):
+                DB_POOL_OVERFLOW_CONNECTIONS.inc()
+
+    def _do_return_conn(self, record):
+        DB_POOL_CHECKED_OUT.dec()
+        super()._do_return_conn(record)
+
+    def _create_connection(self):
+        DB_POOL_CONNECTIONS_CREATED.inc()
+        return super()._create_connection()
+
+
+class InstrumentedAsyncQueuePool(InstrumentedQueuePool, AsyncAdaptedQueuePool):
+    """Instrumented queue pool of the async engine."""
+
+
+def instrument_statements(database_engine) -> None:
+    """Report the latency of the statements executed by the engine.
+
+    The statements are timed by their SQL verb, e.g. "select" or "insert".
+    """
+
+    @event.listens_for(database_engine, "before_cursor_execute")
+    def start_statement(conn, cursor, statement, parameters, context, many):
+        conn.info.setdefault("statement_start", []).append(time.perf_counter())
+
+    @event.listens_for(database_engine, "after_cursor_execute")
+    def end_statement(conn, cursor, statement, parameters, context, many):
+        start = conn.info["statement_start"].pop()
+        operation = statement.split(None, 1)[0].lower()
+        EXTERNAL_CALL_SECONDS.labels(
+            service="postgres", operation=operation
+        ).observe(time.perf_counter() - start)
+
+    @event.listens_for(database_engine, "handle_error")
+    def discard_statement(exception_context):
+        connection = exception_context.connection
+        if connection is not None and connection.info.get("statement_start"):
+            connection.info["statement_start"].pop()
+
+
+class PostgresEngineConfig:
+    """The engine and connection pool configuration."""
+
+    @staticmethod
+    def get_engine_options() -> dict:
+        """Return the engine options from the database configuration."""
+        settings = config_tts.settings
+        return {
+            "poolclass": InstrumentedQueuePool,
+            "pool_size": settings.pool_size,
+            "max_overflow": settings.max_overflow,
+            "pool_timeout": settings.pool_timeout,
+            "pool_recycle": settings.pool_recycle,
+            "pool_pre_ping": settings.pool_pre_ping,
+            "echo": settings.environment == "testing",
+            "connect_args": {
+                "options": f"-c statement_timeout={settings.statement_timeout}"
+            },
+        }
+
+    @staticmethod
+    def get_async_engine_options() -> dict:
+        """Return the async engine options, asyncpg takes the server settings."""
+        options = PostgresEngineConfig.get_engine_options()
+        options["poolclass"] = InstrumentedAsyncQueuePool
+        options["connect_args"] = {
+            "server_settings": {
+                "statement_timeout": str(config_tts.settings.statement_timeout)
+            }
+        }
+        return options
+
+
 DATABASE_URL = PostgresDatabaseConfig.get_database_url()
 
-engine = create_engine(DATABASE_URL, echo=True)
+engine = create_engine(
+    DATABASE_URL, **PostgresEngineConfig.get_engine_options()
+)
+instrument_statements(engine)
+
+async_engine = create_async_engine(
+    PostgresDatabaseConfig.get_database_url(driver="asyncpg"),
+    **PostgresEngineConfig.get_async_engine_options(),
+)
+instrument_statements(async_engine.sync_engine)
+
+channel_message_cache = TieredCache(
+    name="channel_message",
+    maxsize=config_tts.settings.channel_message_cache_size,
+    ttl_seconds=config_tts.settings.channel_message_cache_ttl,
+    redis_client=(
+        client_redis
+        if config_tts.settings.channel_message_cache_redis
+        else None
+    ),
+    publish_evictions=True,
+)
 
 SessionFactory = sessionmaker(bind=engine)
 Session = scoped_session(SessionFactory)
+AsyncSessionFactory = async_sessionmaker(async_engine, expire_on_commit=False)
 
 
 class Channel(Base):
@@ -70,6 +203,8 @@ class SessionManager:
     """The session manager."""
 
     def __init__(self):
+        if not DatabaseSchema.ready:
+            initialize_database()
         self.session = Session()
 
     def __enter__(self):
@@ -93,7 +228,7 @@ class DatabaseManager:
     @staticmethod
     def get_secret_key() -> bytes:
         """Return the secret key."""
-        environment = config_tts.project.environment
+        environment = config_tts.settings.environment
         secret_key = configurations[environment].SECRET_KEY
         return secret_key.encode()
 
@@ -134,20 +269,30 @@ class DatabaseManager:
                 sentiment_message=sentiment_message,
             )
             session.add(new_channel)
-            return new_channel
+        channel_message_cache.delete(channel_id)
+        return new_channel
 
     @staticmethod
     def read_channel_sentiment_message(channel_id: str):
-        """Retrieve a channel by ID."""
+        """Retrieve a channel sentiment message by ID, read through the cache.
+
+        A channel without a custom message is cached as well.
+        """
+        cached = channel_message_cache.get(channel_id)
+        if cached is not None:
+            return cached["sentiment_message"]
+
         with SessionManager() as session:
             channel = (
                 session.query(Channel)
                 .filter(Channel.channel_id == channel_id)
                 .first()
             )
-            if channel:
-                return channel.sentiment_message
-            return None
+            sentiment_message = channel.sentiment_message if channel else None
+        channel_message_cache.set(
+            channel_id, {"sentiment_message": sentiment_message}
+        )
+        return sentiment_message
 
     @staticmethod
     def update_channel_sentiment_message(channel_id: str, sentiment_message: str):
@@ -159,9 +304,103 @@ class DatabaseManager:
                 .first()
             )
             channel.sentiment_message = sentiment_message
-            return channel
+        channel_message_cache.delete(channel_id)
+        return channel
+
+
+class AsyncSessionManager:
+    """The session manager of the coroutines."""
+
+    async def __aenter__(self):
+        """Return the session object when entering the context manager."""
+        if not DatabaseSchema.ready:
+            await asyncio.to_thread(initialize_database)
+        self.session = AsyncSessionFactory()
+        return self.session
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        """Commit the session if no exceptions occurred, otherwise rollback."""
+        try:
+            if exc_type is None:
+                await self.session.commit()
+            else:
+                await self.session.rollback()
+        finally:
+            await self.session.close()
+
+
+class AsyncDatabaseManager:
+    """The database manager of the coroutines."""
+
+    @staticmethod
+    async def add_channel_sentiment_message(
+        team_id: str,
+        team_domain: str,
+        channel_id: str,
+        channel_name: str,
+        sentiment_message: str,
+    ):
+        """Add a channel to the database."""
+        async with AsyncSessionManager() as session:
+            new_channel = Channel(
+                team_id=DatabaseManager.encrypt(team_id),
+                team_domain=team_domain,
+                channel_id=channel_id,
+                channel_name=channel_name,
+                sentiment_message=sentiment_message,
+            )
+            session.add(new_channel)
+        await channel_message_cache.adelete(channel_id)
+        return new_channel
+
+    @staticmethod
+    async def read_channel_sentiment_message(channel_id: str):
+        """Retrieve a channel sentiment message by ID, read through the cache."""
+        cached = await channel_message_cache.aget(channel_id)
+        if cached is not None:
+            return cached["sentiment_message"]
+
+        async with AsyncSessionManager() as session:
+            channel = await session.scalar(
+                select(Channel).where(Channel.channel_id == channel_id)
+            )
+            sentiment_message = channel.sentiment_message if channel else None
+        await channel_message_cache.aset(
+            channel_id, {"sentiment_message": sentiment_message}
+        )
+        return sentiment_message
+
+    @staticmethod
+    async def update_channel_sentiment_message(
+        channel_id: str, sentiment_message: str
+    ):
+        """Update a channel sentiment message."""
+        async with AsyncSessionManager() as session:
+            channel = await session.scalar(
+                select(Channel).where(Channel.channel_id == channel_id)
+            )
+            channel.sentiment_message = sentiment_message
+        await channel_message_cache.adelete(channel_id)
+        return channel
+
+
+class DatabaseSchema:
+    """Readiness of the database schema in the current process."""
+
+    ready = False
+    lock = threading.Lock()
 
 
 def initialize_database():
-    """Initialize the database."""
-    Base.metadata.create_all(engine)
+    """Initialize the database schema once per process.
+
+    The bootstrap connection is disposed of, so the engine pool is empty
+    when gunicorn forks the workers from a preloaded master.
+    """
+    if DatabaseSchema.ready:
+        return
+    with DatabaseSchema.lock:
+        if not DatabaseSchema.ready:
+            Base.metadata.create_all(engine)
+            engine.dispose()
+            DatabaseSchema.ready = True
@@ -1,7 +1,21 @@
-import redis
+import logging
+import os
+import threading
+import time
 from contextlib import contextmanager
+from typing import Callable, Optional
+
+import redis
+import redis.asyncio
 
 from tts.helpers.constants import EnvironmentVariables
+from tts.helpers.metrics import (
+    REDIS_POOL_CHECKOUTS,
+    REDIS_POOL_CONNECTIONS_CREATED,
+    external_call_timer,
+)
+
+logger = logging.getLogger(__name__)
 
 
 class RedisDatabaseConfig:
@@ -12,41 +26,85 @@ class RedisDatabaseConfig:
     db = 0
     password = EnvironmentVariables.REDIS_PASSWORD
 
+    max_connections = int(EnvironmentVariables.REDIS_MAX_CONNECTIONS)
+    socket_timeout = float(EnvironmentVariables.REDIS_SOCKET_TIMEOUT)
+    socket_connect_timeout = float(
+        EnvironmentVariables.REDIS_SOCKET_CONNECT_TIMEOUT
+    )
+    health_check_interval = int(
+        EnvironmentVariables.REDIS_HEALTH_CHECK_INTERVAL
+    )
+
     @classmethod
     def prepare(cls):
         """Return the database full configuration."""
         return cls.host, cls.port, cls.db, cls.password
 
+    @classmethod
+    def pool_options(cls) -> dict:
+        """Return the connection pool configuration."""
+        return {
+            "max_connections": cls.max_connections,
+            "socket_timeout": cls.socket_timeout,
+            "socket_connect_timeout": cls.socket_connect_timeout,
+            "health_check_interval": cls.health_check_interval,
+        }
+
+
+class InstrumentedConnectionPool(redis.ConnectionPool):
+    """Connection pool reporting the checkouts and the opened connections."""
+
+    def get_connection(self, command_name, *keys, **options):
+        REDIS_POOL_CHECKOUTS.inc()
+        return super().get_connection(command_name, *keys, **options)
+
+    def make_connection(self):
+        REDIS_POOL_CONNECTIONS_CREATED.inc()
+        return super().make_connection()
+
 
 class RedisClient:
+    _pool: Optional[redis.ConnectionPool] = None
+    _pool_lock = threading.Lock()
+
     def __init__(self):
         self.host, self.port, self.db, self.password = (
             RedisDatabaseConfig.prepare()
         )
         self.connection = None
 
+    def get_pool(self) -> redis.ConnectionPool:
+        """Return the connection pool shared by the whole process."""
+        if RedisClient._pool is None:
+            with RedisClient._pool_lock:
+                if RedisClient._pool is None:
+                    RedisClient._pool = InstrumentedConnectionPool(
+                        host=self.host,
+                        port=int(self.port),
+                        db=self.db,
+                        password=self.password,
+                        **RedisDatabaseConfig.pool_options(),
+                    )
+        return RedisClient._pool
+
     def connect(self):
-        """Connect to Redis."""
-        self.connection = redis.StrictRedis(
-            host=self.host,
-            port=int(self.port),
-            db=self.db,
-            password=self.password,
-        )
+        """Connect to Redis through the shared connection pool."""
+        if self.connection is None:
+            self.connection = redis.StrictRedis(connection_pool=self.get_pool())
 
     def close(self):
-        """Close the connection."""
-        if self.connection:
-            del self.connection
+        """Release the client, the pooled connections stay open for reuse."""
+        self.connection = None
 
     @contextmanager
-    def manage_connection(self):
-        """Context manager to handle connection."""
+    def manage_connection(self, operation: str = "command"):
+        """Context manager to provide the pooled connection.
+
+        :param operation: (str) The name of the timed operation.
+        """
         self.connect()
-        try:
+        with external_call_timer("redis", operation):
             yield self.connection
-        finally:
-            self.close()
 
     def store_user_data_with_ttl(
         self,
@@ -58,7 +116,7 @@ class RedisClient:
         ttl_seconds: int = 1800,
     ):
         """Store user data with TTL."""
-        with self.manage_connection() as conn:
+        with self.manage_connection("hset") as conn:
             user_key = f"user:{user_id}:event_data"
             data = {
                 "team_id": team_id,
@@ -66,12 +124,14 @@ class RedisClient:
                 "channel_id": channel_id,
                 "channel_name": channel_name,
             }
-            conn.hset(user_key, mapping=data)
-            conn.expire(user_key, ttl_seconds)
+            pipeline = conn.pipeline()
+            pipeline.hset(user_key, mapping=data)
+            pipeline.expire(user_key, ttl_seconds)
+            pipeline.execute()
 
     def get_user_data(self, user_id: str, decoded: bool = True):
         """Get user data."""
-        with self.manage_connection() as conn:
+        with self.manage_connection("hgetall") as conn:
             user_key = f"user:{user_id}:event_data"
             if decoded:
                 user_data = conn.hgetall(user_key)
@@ -83,12 +143,153 @@ class RedisClient:
 
     def get_ttl(self, user_id):
         """Get TTL for the user key."""
-        with self.manage_connection() as conn:
+        with self.manage_connection("ttl") as conn:
             user_key = f"user:{user_id}:event_data"
             return conn.ttl(user_key)
 
     def delete_user_data(self, user_id):
         """Delete user data."""
-        with self.manage_connection() as conn:
+        with self.manage_connection("delete") as conn:
             user_key = f"user:{user_id}:event_data"
             conn.delete(user_key)
+
+    def get_cached_value(self, key: str):
+        """Get a cached value."""
+        with self.manage_connection("get") as conn:
+            return conn.get(key)
+
+    def set_cached_value(self, key: str, value: str, ttl_seconds: int):
+        """Store a cached value with TTL."""
+        with self.manage_connection("set") as conn:
+            conn.set(key, value, ex=ttl_seconds)
+
+    def add_cached_value(self, key: str, value: str, ttl_seconds: int) -> bool:
+        """Store a cached value with TTL only if the key does not exist."""
+        with self.manage_connection("set_nx") as conn:
+            return bool(conn.set(key, value, ex=ttl_seconds, nx=True))
+
+    def delete_cached_value(self, key: str):
+        """Delete a cached value."""
+        with self.manage_connection("delete") as conn:
+            conn.delete(key)
+
+    def publish_message(self, channel: str, message: str):
+        """Publish a message to the subscribers of the channel."""
+        with self.manage_connection("publish") as conn:
+            conn.publish(channel, message)
+
+    def subscribe(
+        self, channel: str, handler: Callable[[str], None]
+    ) -> threading.Thread:
+        """Call the handler with the messages of the channel in a thread.
+
+        The subscription is restored after a connection error, the thread
+        retries every second while Redis is unreachable.
+        """
+        self.connect()
+        pubsub = self.connection.pubsub(ignore_subscribe_messages=True)
+        pubsub.subscribe(
+            **{channel: lambda message: handler(message["data"].decode())}
+        )
+
+        def on_error(error, pubsub_, thread):
+            logger.warning("Redis subscription to '%s': %s", channel, error)
+            time.sleep(1.0)
+
+        return pubsub.run_in_thread(
+            sleep_time=1.0, daemon=True, exception_handler=on_error
+        )
+
+
+class InstrumentedAsyncConnectionPool(redis.asyncio.BlockingConnectionPool):
+    """Async connection pool reporting the checkouts and the opened connections.
+
+    The coroutines wait up to the socket timeout for a free connection, so a
+    burst of concurrent requests does not fail on the connection limit.
+    """
+
+    async def get_connection(self, command_name, *keys, **options):
+        REDIS_POOL_CHECKOUTS.inc()
+        return await super().get_connection(command_name, *keys, **options)
+
+    def make_connection(self):
+        REDIS_POOL_CONNECTIONS_CREATED.inc()
+        return super().make_connection()
+
+
+class AsyncRedisClient:
+    """Redis client of the coroutines, the pool is shared by the process."""
+
+    _pool: Optional[redis.asyncio.ConnectionPool] = None
+    _pool_pid: Optional[int] = None
+
+    def __init__(self):
+        self.host, self.port, self.db, self.password = (
+            RedisDatabaseConfig.prepare()
+        )
+
+    def get_pool(self) -> redis.asyncio.ConnectionPool:
+        """Return the connection pool of the current process."""
+        if AsyncRedisClient._pool_pid != os.getpid():
+            AsyncRedisClient._pool = InstrumentedAsyncConnectionPool(
+                host=self.host,
+                port=int(self.port),
+                db=self.db,
+                password=self.password,
+                timeout=RedisDatabaseConfig.socket_timeout,
+                **RedisDatabaseConfig.pool_options(),
+            )
+            AsyncRedisClient._pool_pid = os.getpid()
+        return AsyncRedisClient._pool
+
+    async def close(self):
+        """Close the pooled connections of the current process."""
+        if AsyncRedisClient._pool_pid == os.getpid():
+            await AsyncRedisClient._pool.disconnect()
+            AsyncRedisClient._pool, AsyncRedisClient._pool_pid = None, None
+
+    @contextmanager
+    def manage_connection(self, operation: str = "command"):
+        """Context manager to provide the pooled client.
+
+        :param operation: (str) The name of the timed operation.
+        """
+        with external_call_timer("redis", operation):
+            yield redis.asyncio.StrictRedis(connection_pool=self.get_pool())
+
+    async def store_user_data_with_ttl(
+        self,
+        user_id: str,
+        team_id: str,
+        team_domain: str,
+        channel_id: str,
+        channel_name: str,
+        ttl_seconds: int = 1800,
+    ):
+        """Store user data with TTL."""
+        with self.manage_connection("hset") as conn:
+            user_key = f"user:{user_id}:event_data"
+            data = {
+                "team_id": team_id,
+                "team_domain": team_domain,
+                "channel_id": channel_id,
+                "channel_name": channel_name,
+            }
+            async with conn.pipeline() as pipeline:
+                pipeline.hset(user_key, mapping=data)
+                pipeline.expire(user_key, ttl_seconds)
+                await pipeline.execute()
+
+    async def get_user_data(self, user_id: str) -> dict:
+        """Get user data."""
+        with self.manage_connection("hgetall") as conn:
+            user_data = await conn.hgetall(f"user:{user_id}:event_data")
+            return {
+                key.decode("utf-8"): value.decode("utf-8")
+                for key, value in user_data.items()
+            }
+
+    async def delete_user_data(self, user_id: str):
+        """Delete user data."""
+        with self.manage_connection("delete") as conn:
+            await conn.delete(f"user:{user_id}:event_data")
@@ -1,4 +1,4 @@
-from typing import Literal
+from typing import Any, Literal, Union
 
 from pydantic import BaseModel, Field, validator
 
@@ -15,3 +15,25 @@ class SentimentResponse(BaseModel):
 
     text: str
     sentiment_result: str
+
+
+class SentimentBatchRequest(BaseModel):
+    """Store the list of JSON items from the batch request.
+
+    The items are validated one by one, so an invalid item is reported in
+    the results instead of failing the whole batch.
+    """
+
+    items: list[Any] = Field(..., min_length=1, max_length=100)
+
+
+class SentimentBatchItemError(BaseModel):
+    """Validation error for a single item of the batch request."""
+
+    error: list[dict]
+
+
+class SentimentBatchResponse(BaseModel):
+    """Response model for batch sentiment analysis, in request order."""
+
+    results: list[Union[SentimentResponse, SentimentBatchItemError]]
@@ -0,0 +1,21 @@
+from slack_sdk import WebClient
+from slack_sdk.web import SlackResponse
+from slack_sdk.web.async_client import AsyncSlackResponse, AsyncWebClient
+
+from tts.helpers.metrics import external_call_timer
+
+
+class InstrumentedWebClient(WebClient):
+    """Slack web client reporting the latency of every API method."""
+
+    def api_call(self, api_method: str, **kwargs) -> SlackResponse:
+        with external_call_timer("slack", api_method):
+            return super().api_call(api_method, **kwargs)
+
+
+class InstrumentedAsyncWebClient(AsyncWebClient):
+    """Async Slack web client reporting the latency of every API method."""
+
+    async def api_call(self, api_method: str, **kwargs) -> AsyncSlackResponse:
+        with external_call_timer("slack", api_method):
+            return await super().api_call(api_method, **kwargs)
@@ -29,7 +29,6 @@ $(document).ready(function () {
             contentType: 'application/json',
             data: JSON.stringify({ text: userInput, sentiment_type: 'all' }),
             success: function (response) {
-                response = JSON.parse(response);
                 $('#info-text').text(response.sentiment_result);
                 $('#input-text').val('');
             },